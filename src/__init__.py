@@ -1,5 +1,5 @@
-from .api import FantasyAPI
-from .main import FantasyProcessor
-from .tournament_manager import TournamentManager
-
-__all__ = ['FantasyAPI', 'FantasyProcessor', 'TournamentManager']
+from .api import FantasyAPI
+from .main import FantasyProcessor
+from .tournament_manager import TournamentManager
+
+__all__ = ['FantasyAPI', 'FantasyProcessor', 'TournamentManager']
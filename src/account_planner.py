@@ -0,0 +1,38 @@
+from typing import Iterable, List
+
+# Steps that only report on the account are not a reason to log in
+PASSIVE_STEPS = {"info"}
+
+
+class AccountPlanner:
+    def __init__(self, account_storage, step_ledger):
+        self.account_storage = account_storage
+        self.step_ledger = step_ledger
+
+    def get_always_due(self, step_names: Iterable[str]) -> List[str]:
+        # Without a cooldown a finished step is forgotten after a full run, so
+        # nothing stored says it is not due and every account runs it again
+        return [
+            step_name
+            for step_name in step_names
+            if step_name not in self.step_ledger.cooldowns
+            and step_name != "daily"
+            and step_name not in PASSIVE_STEPS
+        ]
+
+    def plan(self, wallet_address: str, step_names: Iterable[str]) -> List[str]:
+        # Built from stored state only, so an account with an empty plan is
+        # skipped without any network request
+        completed_steps = self.step_ledger.get_completed_steps(wallet_address)
+
+        try:
+            if self.account_storage.get_next_daily_claim_time(wallet_address):
+                completed_steps.add("daily")
+        except ValueError:
+            pass
+
+        return [
+            step_name
+            for step_name in step_names
+            if step_name not in completed_steps and step_name not in PASSIVE_STEPS
+        ]
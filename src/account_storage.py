@@ -1,59 +1,360 @@
-import json
-import os
-from datetime import datetime, timedelta
-from typing import Dict, Optional
-import pytz
-
-class AccountStorage:
-    def __init__(self, storage_file: str = "data/accounts_data.json"):
-        self.storage_file = storage_file
-        self.data = self._load_data()
-
-    def _load_data(self) -> Dict:
-        if os.path.exists(self.storage_file):
-            try:
-                with open(self.storage_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                return {}
-        return {}
-
-    def _save_data(self):
-        os.makedirs(os.path.dirname(self.storage_file), exist_ok=True)
-        with open(self.storage_file, 'w') as f:
-            json.dump(self.data, f, indent=4)
-
-    def update_account(self, address: str, private_key: str, token: Optional[str] = None,
-                      cookies: Optional[Dict] = None, last_daily_claim: Optional[str] = None):
-        if address not in self.data:
-            self.data[address] = {
-                "private_key": private_key,
-                "created_at": datetime.now(pytz.UTC).isoformat()
-            }
-        
-        account_data = self.data[address]
-        
-        if token is not None:
-            account_data["token"] = token
-            account_data["token_updated_at"] = datetime.now(pytz.UTC).isoformat()
-        
-        if cookies is not None:
-            account_data["cookies"] = cookies
-            account_data["cookies_updated_at"] = datetime.now(pytz.UTC).isoformat()
-        
-        if last_daily_claim is not None:
-            account_data["last_daily_claim"] = last_daily_claim
-        
-        self._save_data()
-
-    def get_account_data(self, address: str) -> Optional[Dict]:
-        return self.data.get(address)
-
-    def get_next_daily_claim_time(self, address: str) -> Optional[datetime]:
-        account_data = self.get_account_data(address)
-        if not account_data or "last_daily_claim" not in account_data:
-            return None
-
-        last_claim = datetime.fromisoformat(account_data["last_daily_claim"])
-        next_claim = last_claim.replace(tzinfo=pytz.UTC) + timedelta(hours=24)
-        return next_claim if next_claim > datetime.now(pytz.UTC) else None
+import atexit
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+import pytz
+from .utils import error_log, write_file_atomic
+
+class AccountStorage:
+    def __init__(self, storage_file: str = "data/accounts_data.json", flush_interval: float = 0):
+        self.storage_file = storage_file
+        self.flush_interval = flush_interval
+        self.lock = threading.RLock()
+        self.data = self._load_data()
+        self._dirty = set()
+        self._fragments: Dict[str, str] = {}
+        self._flush_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._flush_thread = None
+
+        if self.flush_interval > 0:
+            self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+            self._flush_thread.start()
+            atexit.register(self.close)
+
+    def _load_data(self) -> Dict:
+        if os.path.exists(self.storage_file):
+            try:
+                with open(self.storage_file, 'r') as f:
+                    return json.load(f)
+            except json.JSONDecodeError:
+                return {}
+        return {}
+
+    def _save_data(self):
+        # Each account is kept serialized on its own; a flush re-serializes
+        # only the dirty accounts under the lock and builds the file from the
+        # cached pieces after releasing it
+        with self._flush_lock:
+            with self.lock:
+                if not self._dirty:
+                    return
+                addresses = list(self.data)
+                fragments = {
+                    address: json.dumps(self.data[address], indent=4).replace("\n", "\n    ")
+                    for address in addresses
+                    if address in self._dirty or address not in self._fragments
+                }
+                self._dirty.clear()
+
+            self._fragments.update(fragments)
+            if not addresses:
+                payload = "{}"
+            else:
+                payload = "{\n" + ",\n".join(
+                    f"    {json.dumps(address)}: {self._fragments[address]}"
+                    for address in addresses
+                ) + "\n}"
+            write_file_atomic(self.storage_file, payload)
+
+    def _flush_loop(self):
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        try:
+            self._save_data()
+        except Exception as e:
+            error_log(f"Error flushing account storage: {str(e)}")
+
+    def close(self):
+        self._stop_event.set()
+        if self._flush_thread and self._flush_thread is not threading.current_thread():
+            self._flush_thread.join(timeout=self.flush_interval + 5)
+        self.flush()
+
+    def update_account(self, address: str, private_key: str, token: Optional[str] = None,
+                      cookies: Optional[Dict] = None, last_daily_claim: Optional[str] = None,
+                      steps: Optional[Dict] = None):
+        with self.lock:
+            if address not in self.data:
+                self.data[address] = {
+                    "private_key": private_key,
+                    "created_at": datetime.now(pytz.UTC).isoformat()
+                }
+            
+            account_data = self.data[address]
+            
+            if token is not None:
+                account_data["token"] = token
+                account_data["token_updated_at"] = datetime.now(pytz.UTC).isoformat()
+            
+            if cookies is not None:
+                account_data["cookies"] = cookies
+                account_data["cookies_updated_at"] = datetime.now(pytz.UTC).isoformat()
+            
+            if last_daily_claim is not None:
+                account_data["last_daily_claim"] = last_daily_claim
+
+            if steps is not None:
+                account_data["steps"] = steps
+
+            self._dirty.add(address)
+
+        # in write-behind mode the flusher thread persists the dirty set
+        if self._flush_thread is None:
+            self._save_data()
+
+    def update_steps(
+        self, steps_by_address: Dict[str, Tuple[str, Dict]], sync: bool = False
+    ):
+        with self.lock:
+            for address, (private_key, steps) in steps_by_address.items():
+                if address not in self.data:
+                    self.data[address] = {
+                        "private_key": private_key,
+                        "created_at": datetime.now(pytz.UTC).isoformat()
+                    }
+                self.data[address]["steps"] = steps
+                self._dirty.add(address)
+
+        if sync or self._flush_thread is None:
+            self._save_data()
+
+    def get_account_data(self, address: str) -> Optional[Dict]:
+        with self.lock:
+            return self.data.get(address)
+
+    def get_next_daily_claim_time(self, address: str) -> Optional[datetime]:
+        account_data = self.get_account_data(address)
+        if not account_data or "last_daily_claim" not in account_data:
+            return None
+
+        last_claim = datetime.fromisoformat(account_data["last_daily_claim"])
+        next_claim = last_claim.replace(tzinfo=pytz.UTC) + timedelta(hours=24)
+        return next_claim if next_claim > datetime.now(pytz.UTC) else None
+
+
+class SQLiteAccountStorage:
+    COLUMNS = (
+        "private_key",
+        "created_at",
+        "token",
+        "token_updated_at",
+        "cookies",
+        "cookies_updated_at",
+        "last_daily_claim",
+        "steps",
+    )
+    JSON_COLUMNS = ("cookies", "steps")
+
+    def __init__(self, storage_file: str = "data/accounts_data.db",
+                 import_file: Optional[str] = None):
+        self.storage_file = storage_file
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+
+        directory = os.path.dirname(self.storage_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._create_schema()
+        if import_file:
+            self._import_json(import_file)
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared between threads, so every
+        # worker thread gets its own connection to the same WAL database
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.storage_file,
+                timeout=30,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _create_schema(self):
+        self._connection().execute(
+            """
+            CREATE TABLE IF NOT EXISTS accounts (
+                address TEXT PRIMARY KEY,
+                private_key TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                token TEXT,
+                token_updated_at TEXT,
+                cookies TEXT,
+                cookies_updated_at TEXT,
+                last_daily_claim TEXT,
+                steps TEXT
+            )
+            """
+        )
+
+        existing_columns = {
+            row["name"] for row in self._connection().execute("PRAGMA table_info(accounts)")
+        }
+        if "steps" not in existing_columns:
+            self._connection().execute("ALTER TABLE accounts ADD COLUMN steps TEXT")
+
+    def _import_json(self, import_file: str):
+        if not os.path.exists(import_file):
+            return
+
+        conn = self._connection()
+        if conn.execute("SELECT 1 FROM accounts LIMIT 1").fetchone():
+            return
+
+        try:
+            with open(import_file, 'r') as f:
+                legacy_data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return
+
+        rows = []
+        for address, account_data in legacy_data.items():
+            if not account_data.get("private_key"):
+                continue
+            cookies = account_data.get("cookies")
+            steps = account_data.get("steps")
+            rows.append((
+                address,
+                account_data["private_key"],
+                account_data.get("created_at", datetime.now(pytz.UTC).isoformat()),
+                account_data.get("token"),
+                account_data.get("token_updated_at"),
+                json.dumps(cookies) if cookies is not None else None,
+                account_data.get("cookies_updated_at"),
+                account_data.get("last_daily_claim"),
+                json.dumps(steps) if steps is not None else None,
+            ))
+
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                f"INSERT OR IGNORE INTO accounts (address, {', '.join(self.COLUMNS)}) "
+                f"VALUES ({', '.join('?' * (len(self.COLUMNS) + 1))})",
+                rows,
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+
+    def update_account(self, address: str, private_key: str, token: Optional[str] = None,
+                      cookies: Optional[Dict] = None, last_daily_claim: Optional[str] = None,
+                      steps: Optional[Dict] = None):
+        now = datetime.now(pytz.UTC).isoformat()
+
+        self._connection().execute(
+            """
+            INSERT INTO accounts (address, private_key, created_at, token, token_updated_at,
+                                  cookies, cookies_updated_at, last_daily_claim, steps)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(address) DO UPDATE SET
+                token = COALESCE(excluded.token, accounts.token),
+                token_updated_at = COALESCE(excluded.token_updated_at, accounts.token_updated_at),
+                cookies = COALESCE(excluded.cookies, accounts.cookies),
+                cookies_updated_at = COALESCE(excluded.cookies_updated_at, accounts.cookies_updated_at),
+                last_daily_claim = COALESCE(excluded.last_daily_claim, accounts.last_daily_claim),
+                steps = COALESCE(excluded.steps, accounts.steps)
+            """,
+            (
+                address,
+                private_key,
+                now,
+                token,
+                now if token is not None else None,
+                json.dumps(cookies) if cookies is not None else None,
+                now if cookies is not None else None,
+                last_daily_claim,
+                json.dumps(steps) if steps is not None else None,
+            ),
+        )
+
+    def update_steps(
+        self, steps_by_address: Dict[str, Tuple[str, Dict]], sync: bool = False
+    ):
+        # every commit is already on disk
+        now = datetime.now(pytz.UTC).isoformat()
+        conn = self._connection()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                """
+                INSERT INTO accounts (address, private_key, created_at, steps)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(address) DO UPDATE SET steps = excluded.steps
+                """,
+                [
+                    (address, private_key, now, json.dumps(steps))
+                    for address, (private_key, steps) in steps_by_address.items()
+                ],
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+
+    def get_account_data(self, address: str) -> Optional[Dict]:
+        row = self._connection().execute(
+            "SELECT * FROM accounts WHERE address = ?", (address,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        account_data = {}
+        for column in self.COLUMNS:
+            value = row[column]
+            if value is None:
+                continue
+            account_data[column] = json.loads(value) if column in self.JSON_COLUMNS else value
+        return account_data
+
+    def get_next_daily_claim_time(self, address: str) -> Optional[datetime]:
+        account_data = self.get_account_data(address)
+        if not account_data or "last_daily_claim" not in account_data:
+            return None
+
+        last_claim = datetime.fromisoformat(account_data["last_daily_claim"])
+        next_claim = last_claim.replace(tzinfo=pytz.UTC) + timedelta(hours=24)
+        return next_claim if next_claim > datetime.now(pytz.UTC) else None
+
+    def close(self):
+        with self._connections_lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._connections = []
+        self._local = threading.local()
+
+
+def create_account_storage(config: Dict):
+    app_config = config.get("app", {})
+    backend = app_config.get("storage_backend", "json")
+
+    if backend == "sqlite":
+        # storage_file stays the JSON file; it is imported into the
+        # database the first time the database is opened
+        return SQLiteAccountStorage(
+            app_config.get("sqlite_file", "data/accounts_data.db"),
+            import_file=app_config.get("storage_file", "data/accounts_data.json"),
+        )
+
+    return AccountStorage(
+        app_config.get("storage_file", "data/accounts_data.json"),
+        flush_interval=app_config.get("storage_flush_interval", 0),
+    )
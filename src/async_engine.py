@@ -0,0 +1,451 @@
+import asyncio
+import random
+from curl_cffi.requests import AsyncSession
+from . import flows
+from .api import FantasyAPI
+from .main import STEP_DEPENDENCIES, STEP_RETRY
+from .session_pool import SessionPool
+from .utils import error_log, success_log, info_log
+
+THREAD_ONLY_FEATURES = (
+    "starter_cards",
+    "fragment_packs",
+    "fragment_roulette",
+    "other_rewards",
+    "tournaments",
+    "burn_cards",
+)
+
+
+def validate_async_config(config):
+    # These steps are on-chain or multi-step flows only the threads engine
+    # runs; skipping them would report half processed accounts as done
+    unsupported = [
+        feature
+        for feature in THREAD_ONLY_FEATURES
+        if config.get(feature, {}).get("enabled", False)
+    ]
+    if unsupported:
+        raise ValueError(
+            f"Async engine cannot run {', '.join(unsupported)}. "
+            f"Disable them or set app.engine to threads"
+        )
+
+
+class AsyncFantasyAPI(FantasyAPI):
+    def __init__(
+        self,
+        session: AsyncSession,
+        proxies,
+        all_proxies,
+        config,
+        user_agent,
+        account_storage,
+        result_store,
+        rate_limiter=None,
+        tournament_catalog=None,
+        signing_service=None,
+        token_refresher=None,
+    ):
+        super().__init__(
+            web3_provider=config["rpc"]["url"],
+            session=session,
+            proxies=proxies,
+            all_proxies=all_proxies,
+            config=config,
+            user_agent=user_agent,
+            account_storage=account_storage,
+            result_store=result_store,
+            tournament_catalog=tournament_catalog,
+            signing_service=signing_service,
+            token_refresher=token_refresher,
+        )
+        self.rate_limiter = rate_limiter
+
+    async def request_async(self, method, url, **kwargs):
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async(url)
+        kwargs.setdefault("timeout", 10)
+        return await self.session.request(method, url, proxies=self.proxies, **kwargs)
+
+    # The flows are the ones the threads engine runs through FantasyAPI, so
+    # both engines share request building, retries and response handling
+
+    async def try_stored_credentials_async(self, wallet_address, account_number):
+        return await flows.run_async(
+            self,
+            self.token_manager.try_stored_credentials_flow(
+                wallet_address, account_number
+            ),
+        )
+
+    async def login_async(self, private_key, wallet_address, account_number):
+        return await flows.run_async(
+            self, self._login_flow(private_key, wallet_address, account_number)
+        )
+
+    async def get_token_async(self, auth_data, wallet_address, account_number):
+        return await flows.run_async(
+            self, self._get_token_flow(auth_data, wallet_address, account_number)
+        )
+
+    async def daily_claim_async(self, token, wallet_address, account_number):
+        return await flows.run_async(
+            self, self._daily_claim_flow(token, wallet_address, account_number)
+        )
+
+    async def onboarding_quest_claim_async(
+        self, token, wallet_address, account_number, quest_id
+    ):
+        return await flows.run_async(
+            self,
+            self._onboarding_quest_claim_flow(
+                token, wallet_address, account_number, quest_id
+            ),
+        )
+
+    async def quest_claim_async(self, token, wallet_address, account_number, quest_id):
+        return await flows.run_async(
+            self, self._quest_claim_flow(token, wallet_address, account_number, quest_id)
+        )
+
+    async def fragments_claim_async(
+        self, token, wallet_address, account_number, fragment_id
+    ):
+        return await flows.run_async(
+            self,
+            self._fragments_claim_flow(
+                token, wallet_address, account_number, fragment_id
+            ),
+        )
+
+    async def info_async(self, token, wallet_address, account_number):
+        return await flows.run_async(
+            self, self._info_flow(token, wallet_address, account_number)
+        )
+
+
+class AsyncEngine:
+    def __init__(self, processor):
+        validate_async_config(processor.config)
+        self.processor = processor
+        self.config = processor.config
+        self.concurrency = self.config["app"].get("async_concurrency", 100)
+        self.max_attempts = 3
+        self.session_pool = SessionPool(
+            lambda: AsyncSession(max_clients=4),
+            max_idle_per_proxy=self.config["app"].get(
+                "session_pool_size", self.concurrency
+            ),
+        )
+
+    def run(self, accounts):
+        accounts = self.processor._take_census(self.processor.plan_accounts(accounts))
+        asyncio.run(self._run(accounts))
+
+    async def _run(self, accounts):
+        try:
+            await self._run_accounts(accounts)
+        finally:
+            for session in self.session_pool.drain():
+                await session.close()
+
+    async def _run_accounts(self, accounts):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = []
+        start_delay = 0
+
+        for account_number, account_data in accounts:
+            if len(account_data) != 2:
+                error_log(f"Invalid account data format for account {account_number}")
+                continue
+
+            private_key, wallet_address = account_data
+            self.processor.track_next_run(
+                account_number, private_key, wallet_address, start_delay
+            )
+            tasks.append(
+                asyncio.create_task(
+                    self._start_account(
+                        semaphore, start_delay, account_number, private_key, wallet_address
+                    )
+                )
+            )
+
+            if "acc_delays" in self.config["app"]:
+                delay_config = self.config["app"]["acc_delays"]
+                start_delay += random.randint(delay_config[0], delay_config[1])
+
+        await asyncio.gather(*tasks)
+
+        if not self.config["app"].get("retry_failed_accounts", True):
+            return
+
+        retry_manager = self.processor.retry_manager
+        while retry_manager.should_continue_retrying():
+            retry_accounts = retry_manager.get_retry_accounts()
+            info_log(
+                f"Retrying {len(retry_accounts)} accounts from current session. Success rate: "
+                f"{retry_manager.get_success_rate()*100:.2f}%"
+            )
+            await asyncio.gather(
+                *[
+                    self._start_account(
+                        semaphore,
+                        self.processor.retry_delay,
+                        account_number,
+                        private_key,
+                        wallet_address,
+                    )
+                    for account_number, private_key, wallet_address in retry_accounts
+                ]
+            )
+
+    async def _start_account(
+        self, semaphore, start_delay, account_number, private_key, wallet_address
+    ):
+        if start_delay > 0:
+            await asyncio.sleep(start_delay)
+
+        async with semaphore:
+            await self.process_account_with_retry(
+                account_number, private_key, wallet_address
+            )
+
+    async def process_account_with_retry(self, account_number, private_key, wallet_address):
+        account_data = (account_number, private_key, wallet_address)
+        retry_manager = self.processor.retry_manager
+
+        if not retry_manager.should_process(account_data):
+            info_log(
+                f"Skipping account {account_number}: already processed successfully or max retries reached"
+            )
+            return
+
+        for attempt in range(1, self.max_attempts + 1):
+            if attempt > 1:
+                info_log(
+                    f"Retrying account {account_number}: {wallet_address} (Attempt {attempt}/{self.max_attempts})"
+                )
+
+            try:
+                if await self.process_account(
+                    account_number, private_key, wallet_address, attempt
+                ):
+                    self.processor._write_success(private_key, wallet_address)
+                    success_log(
+                        f"Account {account_number}: {wallet_address} - All tasks completed successfully"
+                    )
+                    retry_manager.add_success_account(account_data)
+                    return
+            except Exception as e:
+                error_log(f"Error processing account {account_number}: {str(e)}")
+
+            await asyncio.sleep(2)
+
+        error_log(f"All attempts exhausted for account {account_number}")
+        self.processor._write_failure(private_key, wallet_address)
+        retry_manager.add_failed_account(account_data)
+
+    async def process_account(self, account_number, private_key, wallet_address, attempt):
+        proxy = self.processor._get_random_proxy()
+        with self.processor.lock:
+            user_agent = next(self.processor.user_agents_cycle)
+
+        if attempt == 1:
+            info_log(f"Processing account {account_number}: {wallet_address}")
+
+        session = self.session_pool.acquire(proxy)
+        try:
+            api = AsyncFantasyAPI(
+                session=session,
+                proxies={"http": proxy, "https": proxy},
+                all_proxies=self.processor.all_proxies,
+                config=self.config,
+                user_agent=user_agent,
+                account_storage=self.processor.account_storage,
+                result_store=self.processor.result_store,
+                rate_limiter=self.processor.rate_limiter,
+                tournament_catalog=self.processor.tournament_catalog,
+                signing_service=self.processor.signing_service,
+                token_refresher=self.processor.token_refresher,
+            )
+
+            loop = asyncio.get_running_loop()
+            if self.processor.token_refresher:
+                await loop.run_in_executor(
+                    None, self.processor.token_refresher.wait_for, wallet_address
+                )
+
+            token = None
+            if attempt == 1:
+                stored_success, stored_token = await api.try_stored_credentials_async(
+                    wallet_address, account_number
+                )
+                if stored_success:
+                    info_log(f"Using stored credentials for account {account_number}")
+                    token = stored_token
+
+            if not token:
+                auth_data = await api.login_async(
+                    private_key, wallet_address, account_number
+                )
+                if not auth_data:
+                    return False
+                token = await api.get_token_async(
+                    auth_data, wallet_address, account_number
+                )
+                if not token:
+                    return False
+
+            step_ledger = self.processor.step_ledger
+            completed_steps = await loop.run_in_executor(
+                None, step_ledger.get_completed_steps, wallet_address
+            )
+            if completed_steps:
+                info_log(
+                    f"Account {account_number}: Steps already done, skipping: {', '.join(sorted(completed_steps))}"
+                )
+
+            steps = self._get_account_steps()
+            step_names = {step_name for step_name, _ in steps}
+            finished = set(completed_steps)
+            pending = [
+                (step_name, step)
+                for step_name, step in steps
+                if step_name not in completed_steps
+            ]
+            tasks_completed = True
+
+            # Same dependencies as the threads engine's stages: every step
+            # whose dependencies are done runs concurrently with the others
+            while pending:
+                ready = [
+                    (step_name, step)
+                    for step_name, step in pending
+                    if all(
+                        dependency not in step_names or dependency in finished
+                        for dependency in STEP_DEPENDENCIES.get(step_name, [])
+                    )
+                ]
+                pending = [entry for entry in pending if entry not in ready]
+
+                step_results = await asyncio.gather(
+                    *(
+                        step(api, token, account_number, wallet_address)
+                        for _, step in ready
+                    ),
+                    return_exceptions=True,
+                )
+                for (step_name, _), step_result in zip(ready, step_results):
+                    if isinstance(step_result, Exception):
+                        error_log(f"Stage {step_name} failed: {str(step_result)}")
+                        step_result = STEP_RETRY
+                    if step_result == STEP_RETRY:
+                        return False
+
+                    finished.add(step_name)
+                    if step_result is False:
+                        tasks_completed = False
+                    else:
+                        await loop.run_in_executor(
+                            None,
+                            step_ledger.mark_done,
+                            wallet_address,
+                            private_key,
+                            step_name,
+                        )
+
+            if tasks_completed:
+                await loop.run_in_executor(
+                    None, step_ledger.reset, wallet_address, private_key
+                )
+            return tasks_completed
+        finally:
+            evicted_session = self.session_pool.release(session)
+            if evicted_session:
+                await evicted_session.close()
+
+    def _get_account_steps(self):
+        steps = []
+        if self.config["onboarding_quest"]["enabled"]:
+            steps.append(("onboarding", self._step_onboarding))
+        if self.config["daily"]["enabled"]:
+            steps.append(("daily", self._step_daily))
+        if self.config["fragments"]["enabled"]:
+            steps.append(("fragments", self._step_fragments))
+        if self.config["quest"]["enabled"]:
+            steps.append(("quests", self._step_quests))
+        if self.config["info_check"]:
+            steps.append(("info", self._step_info))
+        return steps
+
+    async def _step_onboarding(self, api, token, account_number, wallet_address):
+        completed_quests = self.processor.completed_quests
+        onboarding_ids = list(self.config["onboarding_quest"].get("ids", []))
+        single_id = self.config["onboarding_quest"].get("id")
+        if single_id and single_id not in onboarding_ids:
+            onboarding_ids.append(single_id)
+
+        for onboarding_id in onboarding_ids:
+            quest_key = f"{account_number}:{onboarding_id}"
+            if quest_key in completed_quests:
+                continue
+
+            if await api.onboarding_quest_claim_async(
+                token, wallet_address, account_number, onboarding_id
+            ):
+                success_log(
+                    f"Successfully completed onboarding quest {onboarding_id} for account {account_number}"
+                )
+                completed_quests.add(quest_key)
+            else:
+                info_log(
+                    f"Onboarding quest {onboarding_id} skipped or failed for account {account_number}"
+                )
+
+        return True
+
+    async def _step_daily(self, api, token, account_number, wallet_address):
+        daily_success = await api.daily_claim_async(token, wallet_address, account_number)
+        if daily_success == "429":
+            info_log(f"Rate limit on daily claim for account {account_number}, retrying...")
+            return STEP_RETRY
+        if not daily_success:
+            return False
+
+        success_log(f"Account {account_number}: Successfully claimed daily reward")
+        return True
+
+    async def _step_fragments(self, api, token, account_number, wallet_address):
+        return bool(
+            await api.fragments_claim_async(
+                token, wallet_address, account_number, self.config["fragments"]["id"]
+            )
+        )
+
+    async def _step_quests(self, api, token, account_number, wallet_address):
+        completed_quests = self.processor.completed_quests
+        quests_completed = True
+        for quest_id in self.config["quest"]["ids"]:
+            quest_key = f"{account_number}:{quest_id}"
+            if quest_key in completed_quests:
+                continue
+
+            quest_success = await api.quest_claim_async(
+                token, wallet_address, account_number, quest_id
+            )
+            if quest_success == "429":
+                return STEP_RETRY
+            if quest_success:
+                completed_quests.add(quest_key)
+            else:
+                quests_completed = False
+
+        return quests_completed
+
+    async def _step_info(self, api, token, account_number, wallet_address):
+        info_success = await api.info_async(token, wallet_address, account_number)
+        if info_success == "429":
+            return STEP_RETRY
+        return bool(info_success)
@@ -0,0 +1,194 @@
+import concurrent.futures
+import hashlib
+import os
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+import pytz
+from .scheduler import StartScheduler
+from .utils import (
+    CONFIG_PATH,
+    error_log,
+    info_log,
+    load_config,
+    validate_tournament_config,
+)
+
+
+class AccountDaemon:
+    def __init__(self, processor, accounts):
+        self.processor = processor
+        self.accounts = [
+            (account_number, account_data)
+            for account_number, account_data in accounts
+            if len(account_data) == 2
+        ]
+        self.daemon_config = processor.config.get("daemon", {})
+        self.config_mtime = self._get_config_mtime()
+        self.executor = None
+        self.scheduler = None
+        self.census_at = None
+        self.slots: Dict[str, datetime] = {}
+
+    def _get_config_mtime(self) -> Optional[float]:
+        try:
+            return os.path.getmtime(CONFIG_PATH)
+        except OSError:
+            return None
+
+    def _get_next_daily_claim(self, wallet_address: str) -> Optional[datetime]:
+        try:
+            return self.processor.account_storage.get_next_daily_claim_time(
+                wallet_address
+            )
+        except ValueError:
+            return None
+
+    def _seconds_until(self, due: Optional[datetime]) -> float:
+        if due is None:
+            return 0
+        return max(0, (due - datetime.now(pytz.UTC)).total_seconds())
+
+    def _jitter(self) -> float:
+        return random.uniform(0, self.daemon_config.get("jitter_seconds", 300))
+
+    def _get_offset(self, wallet_address: str) -> float:
+        # A fixed slot per account inside the spread window, so accounts that
+        # become due together at startup wake apart
+        spread = self.daemon_config.get("spread_minutes", 60) * 60
+        digest = hashlib.sha256(wallet_address.lower().encode()).digest()
+        return spread * int.from_bytes(digest[:4], "big") / 2**32
+
+    def _first_delay(self, wallet_address: str) -> float:
+        # The offset and jitter are applied once, here; later cycles follow
+        # the slot so they do not push the account further every day
+        due = self._get_next_daily_claim(wallet_address) or datetime.now(pytz.UTC)
+        slot = due + timedelta(
+            seconds=self._get_offset(wallet_address) + self._jitter()
+        )
+        self.slots[wallet_address] = slot
+        return self._seconds_until(slot)
+
+    def _next_delay(self, wallet_address: str, success: bool) -> float:
+        if not success:
+            return self.daemon_config.get("retry_minutes", 30) * 60 + self._jitter()
+
+        # The next slot is one interval after the previous one, unless the
+        # daily cooldown only ends later
+        slot = self.slots.get(wallet_address) or datetime.now(pytz.UTC)
+        slot += timedelta(hours=self.daemon_config.get("interval_hours", 24))
+        next_daily_claim = self._get_next_daily_claim(wallet_address)
+        if next_daily_claim and next_daily_claim > slot:
+            slot = next_daily_claim
+        self.slots[wallet_address] = slot
+        return self._seconds_until(slot)
+
+    def _schedule(self, delay: float, account_number, private_key, wallet_address):
+        self.processor.track_next_run(
+            account_number, private_key, wallet_address, delay
+        )
+        self.scheduler.schedule(
+            delay, self._run_account, account_number, private_key, wallet_address
+        )
+
+    def _run_account(self, account_number, private_key, wallet_address):
+        success = False
+        try:
+            planner = self.processor.account_planner
+            if planner and not planner.plan(
+                wallet_address,
+                [step_name for step_name, _ in self.processor._get_account_steps()],
+            ):
+                info_log(f"Account {account_number}: nothing due, sleeping")
+                success = True
+            else:
+                # Every wake is a fresh cycle with its own login attempts
+                self.processor.retry_manager.reset_account(
+                    (account_number, private_key, wallet_address)
+                )
+                success = self.processor.process_account(
+                    account_number, private_key, wallet_address, len(self.accounts)
+                )
+        except Exception as e:
+            error_log(f"Error processing account {account_number}: {str(e)}")
+        finally:
+            delay = self._next_delay(wallet_address, success)
+            info_log(
+                f"Account {account_number}: next run in {delay / 3600:.2f} hours"
+            )
+            try:
+                self._schedule(delay, account_number, private_key, wallet_address)
+            except RuntimeError:
+                pass
+
+    def _reload_config(self):
+        mtime = self._get_config_mtime()
+        if mtime is None or mtime == self.config_mtime:
+            return
+        self.config_mtime = mtime
+
+        try:
+            config = validate_tournament_config(load_config())
+        except Exception as e:
+            error_log(f"Config reload failed, keeping the current config: {str(e)}")
+            return
+
+        # Account runs build their API objects from processor.config, so the
+        # next run of every account picks up the new settings
+        restart_keys = self.processor.apply_config(config)
+        self.daemon_config = config.get("daemon", {})
+        self.census_at = None
+        info_log("Config reloaded")
+        if restart_keys:
+            info_log(
+                f"Changed settings that only apply after a restart: {', '.join(restart_keys)}"
+            )
+
+    def _refresh_census(self):
+        # The census snapshot expires after its ttl; a long running daemon
+        # reads it again instead of leaving accounts without it
+        census = self.processor.fleet_census
+        if not census:
+            return
+        if (
+            self.census_at is not None
+            and time.monotonic() - self.census_at < census.ttl
+        ):
+            return
+        self.census_at = time.monotonic()
+        self.processor.refresh_census(self.accounts)
+
+    def run(self):
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.processor.config["app"]["threads"]
+        )
+        self.scheduler = StartScheduler(self.executor)
+        self._refresh_census()
+
+        # Every account wakes at its own offset after it becomes due, the ones
+        # already due included, so no cycle starts them all at once
+        due_now = 0
+        for account_number, (private_key, wallet_address) in self.accounts:
+            if self._get_next_daily_claim(wallet_address) is None:
+                due_now += 1
+            self._schedule(
+                self._first_delay(wallet_address),
+                account_number,
+                private_key,
+                wallet_address,
+            )
+
+        info_log(
+            f"Daemon started: {due_now} accounts due now, "
+            f"{len(self.accounts) - due_now} waiting for their cooldown"
+        )
+
+        try:
+            while True:
+                time.sleep(self.daemon_config.get("reload_interval", 60))
+                self._reload_config()
+                self._refresh_census()
+        finally:
+            self.scheduler.shutdown(cancel_pending=True)
+            self.executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,203 @@
+import threading
+import time
+from typing import Dict, Iterable, Optional
+from .utils import debug_log, error_log, info_log
+from .web3_pool import get_contract
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+CENSUS_BATCH_SIZE = 300
+CENSUS_TTL_MINUTES = 30
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+    {
+        "inputs": [{"name": "addr", "type": "address"}],
+        "name": "getEthBalance",
+        "outputs": [{"name": "balance", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+ERC721_CENSUS_ABI = [
+    {
+        "inputs": [{"name": "owner", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"name": "owner", "type": "address"},
+            {"name": "operator", "type": "address"},
+        ],
+        "name": "isApprovedForAll",
+        "outputs": [{"name": "", "type": "bool"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+
+class FleetCensus:
+    def __init__(
+        self,
+        batch_size: int = CENSUS_BATCH_SIZE,
+        ttl_minutes: float = CENSUS_TTL_MINUTES,
+    ):
+        self.configure(batch_size, ttl_minutes)
+        self.wallets: Dict[str, Dict] = {}
+        self.lock = threading.Lock()
+
+    def configure(self, batch_size: int, ttl_minutes: float):
+        self.batch_size = max(1, batch_size)
+        self.ttl = ttl_minutes * 60
+
+    def run(
+        self,
+        web3,
+        wallet_addresses: Iterable[str],
+        cards_address: str,
+        operators: Iterable[str] = (),
+    ) -> int:
+        # One aggregate3 call reads balance, card count and approvals for a
+        # whole batch of wallets; sub-calls may fail without failing the rest
+        multicall = get_contract(web3, MULTICALL3_ADDRESS, MULTICALL3_ABI)
+        cards = get_contract(web3, cards_address, ERC721_CENSUS_ABI)
+        operators = [web3.to_checksum_address(operator) for operator in operators]
+        wallets = [web3.to_checksum_address(address) for address in wallet_addresses]
+
+        counted = 0
+        for start in range(0, len(wallets), self.batch_size):
+            batch = wallets[start : start + self.batch_size]
+            calls = []
+            for wallet in batch:
+                calls.append(
+                    (
+                        multicall.address,
+                        True,
+                        multicall.encodeABI(fn_name="getEthBalance", args=[wallet]),
+                    )
+                )
+                calls.append(
+                    (
+                        cards.address,
+                        True,
+                        cards.encodeABI(fn_name="balanceOf", args=[wallet]),
+                    )
+                )
+                for operator in operators:
+                    calls.append(
+                        (
+                            cards.address,
+                            True,
+                            cards.encodeABI(
+                                fn_name="isApprovedForAll", args=[wallet, operator]
+                            ),
+                        )
+                    )
+
+            try:
+                results = multicall.functions.aggregate3(calls).call()
+            except Exception as e:
+                error_log(f"Census batch of {len(batch)} wallets failed: {str(e)}")
+                continue
+
+            states = {}
+            read_at = time.monotonic()
+            calls_per_wallet = 2 + len(operators)
+            for index, wallet in enumerate(batch):
+                wallet_results = results[
+                    index * calls_per_wallet : (index + 1) * calls_per_wallet
+                ]
+                states[wallet.lower()] = {
+                    "balance": self._decode(web3, "uint256", wallet_results[0]),
+                    "cards": self._decode(web3, "uint256", wallet_results[1]),
+                    "approvals": {
+                        operator.lower(): self._decode(web3, "bool", result)
+                        for operator, result in zip(operators, wallet_results[2:])
+                    },
+                    "read_at": read_at,
+                }
+
+            with self.lock:
+                self.wallets.update(states)
+            counted += len(states)
+            debug_log(f"Census read {counted}/{len(wallets)} wallets")
+
+        info_log(f"Census collected on-chain state for {counted} wallets")
+        return counted
+
+    def _decode(self, web3, abi_type: str, result):
+        success, return_data = result
+        if not success or not return_data:
+            return None
+        try:
+            return web3.codec.decode([abi_type], return_data)[0]
+        except Exception:
+            return None
+
+    def _get_wallet(self, wallet_address: str) -> Dict:
+        # A snapshot older than the ttl reads as unknown, so long daemon runs
+        # fall back to each account reading its own state
+        wallet = self.wallets.get(wallet_address.lower())
+        if wallet is None or time.monotonic() - wallet["read_at"] > self.ttl:
+            return {}
+        return wallet
+
+    def get_balance(self, wallet_address: str) -> Optional[int]:
+        with self.lock:
+            return self._get_wallet(wallet_address).get("balance")
+
+    def get_card_count(self, wallet_address: str) -> Optional[int]:
+        with self.lock:
+            return self._get_wallet(wallet_address).get("cards")
+
+    def is_approved(self, wallet_address: str, operator: str) -> Optional[bool]:
+        with self.lock:
+            wallet = self._get_wallet(wallet_address)
+            return wallet.get("approvals", {}).get(operator.lower())
+
+    def set_approved(self, wallet_address: str, operator: str):
+        with self.lock:
+            wallet = self.wallets.get(wallet_address.lower())
+            if wallet is not None:
+                wallet["approvals"][operator.lower()] = True
+
+    def forget_holdings(self, wallet_address: str):
+        # Approvals survive a transaction, balance and card count do not
+        with self.lock:
+            wallet = self.wallets.get(wallet_address.lower())
+            if wallet is not None:
+                wallet["balance"] = None
+                wallet["cards"] = None
+
+    def is_funded(self, wallet_address: str, min_balance: int) -> bool:
+        balance = self.get_balance(wallet_address)
+        return balance is None or balance >= min_balance
@@ -0,0 +1,104 @@
+import asyncio
+from time import sleep
+from typing import Callable, Generator
+
+# An account flow is a generator that yields the I/O it needs and receives the
+# result back, so the same request building and response handling runs on the
+# threads engine (run) and on the asyncio engine (run_async).
+PAUSE = "pause"
+REQUEST = "request"
+HTTP = "http"
+BLOCKING = "blocking"
+GATHER = "gather"
+
+
+def pause(seconds: float):
+    return PAUSE, seconds
+
+
+def request(method: str, url: str, **kwargs):
+    # A plain session request, used for the privy login endpoints
+    return REQUEST, method, url, kwargs
+
+
+def http(method: str, url: str, token=None, **kwargs):
+    # A request through FantasyHTTPClient with its retries and GET cache
+    return HTTP, method, url, token, kwargs
+
+
+def blocking(func: Callable, *args, **kwargs):
+    # Storage, captcha and signing work; the async engine runs it off the loop
+    return BLOCKING, func, args, kwargs
+
+
+def gather(*flows: Generator):
+    return GATHER, flows
+
+
+def _perform(api, effect):
+    kind = effect[0]
+    if kind == PAUSE:
+        sleep(effect[1])
+        return None
+    if kind == REQUEST:
+        _, method, url, kwargs = effect
+        kwargs.setdefault("timeout", 10)
+        return api.session.request(method, url, proxies=api.proxies, **kwargs)
+    if kind == HTTP:
+        _, method, url, token, kwargs = effect
+        return api.http.request(method, url, token, **kwargs)
+    if kind == BLOCKING:
+        _, func, args, kwargs = effect
+        return func(*args, **kwargs)
+    if kind == GATHER:
+        return [run(api, flow) for flow in effect[1]]
+    raise ValueError(f"Unknown flow effect: {kind}")
+
+
+async def _perform_async(api, effect):
+    kind = effect[0]
+    if kind == PAUSE:
+        await asyncio.sleep(effect[1])
+        return None
+    if kind == REQUEST:
+        _, method, url, kwargs = effect
+        return await api.request_async(method, url, **kwargs)
+    if kind == HTTP:
+        _, method, url, token, kwargs = effect
+        return await api.http.request_async(method, url, token, **kwargs)
+    if kind == BLOCKING:
+        _, func, args, kwargs = effect
+        return await asyncio.get_running_loop().run_in_executor(
+            None, lambda: func(*args, **kwargs)
+        )
+    if kind == GATHER:
+        return list(await asyncio.gather(*(run_async(api, flow) for flow in effect[1])))
+    raise ValueError(f"Unknown flow effect: {kind}")
+
+
+def run(api, flow: Generator):
+    send, value = flow.send, None
+    while True:
+        try:
+            effect = send(value)
+        except StopIteration as stop:
+            return stop.value
+
+        try:
+            send, value = flow.send, _perform(api, effect)
+        except Exception as e:
+            send, value = flow.throw, e
+
+
+async def run_async(api, flow: Generator):
+    send, value = flow.send, None
+    while True:
+        try:
+            effect = send(value)
+        except StopIteration as stop:
+            return stop.value
+
+        try:
+            send, value = flow.send, await _perform_async(api, effect)
+        except Exception as e:
+            send, value = flow.throw, e
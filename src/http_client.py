@@ -0,0 +1,251 @@
+import asyncio
+import json
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+from . import flows
+from .utils import rate_limit_log, debug_log, get_platform, get_sec_ch_ua
+
+SECRET_API_URL = "https://secret-api.fantasy.top"
+
+STATUS_OK = "ok"
+STATUS_RATE_LIMITED = "rate_limited"
+STATUS_UNAUTHORIZED = "unauthorized"
+STATUS_SERVER_ERROR = "server_error"
+STATUS_ERROR = "error"
+
+# Seconds a successful GET response is reused within one account session.
+# Any POST or on-chain transaction of the account clears the cache.
+CACHE_TTLS = {
+    "/player/basic-data/": 30,
+    "/player/player-rewards": 30,
+    "/rewards/has-pending-cards-from-fragments": 30,
+    "/tournaments/summary/": 120,
+    "/card/player/": 30,
+    "/card/player-all-cards/": 30,
+}
+
+
+def classify_status(status_code: int) -> str:
+    if 200 <= status_code < 300:
+        return STATUS_OK
+    if status_code == 429:
+        return STATUS_RATE_LIMITED
+    if status_code == 401:
+        return STATUS_UNAUTHORIZED
+    if status_code >= 500:
+        return STATUS_SERVER_ERROR
+    return STATUS_ERROR
+
+
+def get_cache_ttl(url: str) -> float:
+    path = urlparse(url).path
+    for prefix, ttl in CACHE_TTLS.items():
+        if path.startswith(prefix):
+            return ttl
+    return 0
+
+
+def build_headers(user_agent: str, auth_token: Optional[str] = None) -> Dict[str, str]:
+    headers = {
+        "Accept": "application/json, text/plain, */*",
+        "Origin": "https://monad.fantasy.top",
+        "Referer": "https://monad.fantasy.top/",
+        "User-Agent": user_agent,
+        "Priority": "u=1, i",
+        "Sec-Ch-Ua": get_sec_ch_ua(user_agent),
+        "Sec-Ch-Ua-Mobile": "?0",
+        "Sec-Ch-Ua-Platform": get_platform(user_agent),
+        "Sec-Fetch-Dest": "empty",
+        "Sec-Fetch-Mode": "cors",
+        "Sec-Fetch-Site": "same-site",
+    }
+    if auth_token:
+        headers["Authorization"] = f"Bearer {auth_token}"
+    return headers
+
+
+class FantasyHTTPClient:
+    def __init__(
+        self, api, max_retries: int = 3, backoff: float = 2, cache_enabled: bool = True
+    ):
+        self.api = api
+        self.max_retries = max(1, max_retries)
+        self.backoff = backoff
+        self.cache_enabled = cache_enabled
+        self.lock = threading.Lock()
+        self.rejected_privy_token = None
+        self.cache = {}
+        self.in_flight: Dict[str, threading.Event] = {}
+        self.cache_generation = 0
+
+    def _get_auth_token(self, token: Optional[str], prefer_privy: bool) -> Optional[str]:
+        if not prefer_privy:
+            return token
+
+        privy_id_token = self.api._get_privy_token_id()
+        with self.lock:
+            # Once the server rejects a privy id token the session sticks to the
+            # bearer token until it receives a different privy id token
+            if not privy_id_token or privy_id_token == self.rejected_privy_token:
+                return token
+        return privy_id_token
+
+    def _get_retry_delay(self, attempt: int) -> float:
+        return self.backoff * (2**attempt) + random.uniform(0, 1)
+
+    def invalidate(self):
+        with self.lock:
+            self.cache.clear()
+            self.cache_generation += 1
+
+    def _cache_key(self, url: str, params) -> str:
+        return url + "?" + json.dumps(params, sort_keys=True, default=str)
+
+    def _claim(self, key: str, new_event):
+        # Concurrent stages asking for the same resource share one request:
+        # the first caller gets a generation and fetches it, the others get
+        # the in-flight event to wait on and read the cache afterwards
+        with self.lock:
+            cached = self.cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1], None, None
+
+            event = self.in_flight.get(key)
+            if event is not None:
+                return None, event, None
+
+            event = new_event()
+            self.in_flight[key] = event
+            return None, event, self.cache_generation
+
+    def _store(self, key: str, response, ttl: float, generation: int):
+        if classify_status(response.status_code) == STATUS_OK:
+            with self.lock:
+                # a mutation that finished meanwhile makes this response stale
+                if generation == self.cache_generation:
+                    self.cache[key] = (time.monotonic() + ttl, response)
+
+    def _release(self, key: str, event):
+        with self.lock:
+            self.in_flight.pop(key, None)
+        event.set()
+
+    def _get_cached(self, key: str, ttl: float, send):
+        while True:
+            cached, event, generation = self._claim(key, threading.Event)
+            if cached is not None:
+                return cached
+            if generation is not None:
+                break
+            event.wait()
+
+        try:
+            response = send()
+            self._store(key, response, ttl, generation)
+            return response
+        finally:
+            self._release(key, event)
+
+    async def _get_cached_async(self, key: str, ttl: float, send):
+        while True:
+            cached, event, generation = self._claim(key, asyncio.Event)
+            if cached is not None:
+                return cached
+            if generation is not None:
+                break
+            await event.wait()
+
+        try:
+            response = await send()
+            self._store(key, response, ttl, generation)
+            return response
+        finally:
+            self._release(key, event)
+
+    def _get_ttl(self, method: str, url: str) -> float:
+        if method.upper() != "GET" or not self.cache_enabled:
+            return 0
+        return get_cache_ttl(url)
+
+    def request(self, method: str, url: str, token: Optional[str] = None, **kwargs):
+        send = lambda: flows.run(self.api, self._send_flow(method, url, token, **kwargs))
+
+        ttl = self._get_ttl(method, url)
+        if ttl > 0:
+            return self._get_cached(self._cache_key(url, kwargs.get("params")), ttl, send)
+        if method.upper() == "GET":
+            return send()
+
+        try:
+            return send()
+        finally:
+            self.invalidate()
+
+    async def request_async(
+        self, method: str, url: str, token: Optional[str] = None, **kwargs
+    ):
+        send = lambda: flows.run_async(
+            self.api, self._send_flow(method, url, token, **kwargs)
+        )
+
+        ttl = self._get_ttl(method, url)
+        if ttl > 0:
+            return await self._get_cached_async(
+                self._cache_key(url, kwargs.get("params")), ttl, send
+            )
+        if method.upper() == "GET":
+            return await send()
+
+        try:
+            return await send()
+        finally:
+            self.invalidate()
+
+    def _send_flow(
+        self,
+        method: str,
+        url: str,
+        token: Optional[str] = None,
+        prefer_privy: bool = True,
+        headers: Optional[Dict] = None,
+        max_retries: Optional[int] = None,
+        retry_on=(STATUS_RATE_LIMITED,),
+        timeout: float = 10,
+        **kwargs,
+    ):
+        max_retries = self.max_retries if max_retries is None else max(1, max_retries)
+        attempt = 0
+
+        while True:
+            auth_token = self._get_auth_token(token, prefer_privy)
+            request_headers = build_headers(self.api.user_agent, auth_token)
+            if headers:
+                request_headers.update(headers)
+
+            response = yield flows.request(
+                method, url, headers=request_headers, timeout=timeout, **kwargs
+            )
+            status = classify_status(response.status_code)
+
+            if status == STATUS_UNAUTHORIZED and token and auth_token != token:
+                debug_log(f"Privy id token rejected for {url}, falling back to bearer token")
+                with self.lock:
+                    self.rejected_privy_token = auth_token
+                continue
+
+            attempt += 1
+            if status not in retry_on or attempt >= max_retries:
+                return response
+
+            if status == STATUS_RATE_LIMITED:
+                rate_limit_log(f"Rate limit hit for {url}, retrying ({attempt}/{max_retries})")
+            yield flows.pause(self._get_retry_delay(attempt - 1))
+
+    def get(self, url: str, token: Optional[str] = None, **kwargs):
+        return self.request("GET", url, token, **kwargs)
+
+    def post(self, url: str, token: Optional[str] = None, **kwargs):
+        return self.request("POST", url, token, **kwargs)
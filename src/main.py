@@ -1,942 +1,1382 @@
-import math
-import random
-import time
-import os
-import threading
-import concurrent.futures
-from time import sleep
-from curl_cffi import requests
-from web3 import Web3
-from colorama import Fore
-from src.api import FantasyAPI
-from src.utils import error_log, info_log, success_log, rate_limit_log
-from src.account_storage import AccountStorage
-
-
-class RetryManager:
-    def __init__(self, max_retries=3, success_threshold=0.9):
-        self.failed_accounts = set()
-        self.success_accounts = set()
-        self.attempt_counter = {}
-        self.stored_credentials_failed = set()
-        self.max_retries = max_retries
-        self.success_threshold = success_threshold
-        self.lock = threading.Lock()
-        self.processed_failures = set()
-        self.final_failures = set()
-        self.completed_accounts = set()
-
-    def add_failed_account(self, account_data):
-        with self.lock:
-            if account_data in self.completed_accounts:
-                return
-
-            if account_data not in self.success_accounts:
-                self.failed_accounts.add(account_data)
-                if account_data not in self.attempt_counter:
-                    self.attempt_counter[account_data] = 1
-                else:
-                    self.attempt_counter[account_data] += 1
-
-                if self.attempt_counter[account_data] >= self.max_retries:
-                    if account_data not in self.final_failures:
-                        self.final_failures.add(account_data)
-                        self._write_to_fail_file(account_data)
-
-    def add_success_account(self, account_data):
-        with self.lock:
-            self.success_accounts.add(account_data)
-            self.completed_accounts.add(account_data)
-            if account_data in self.failed_accounts:
-                self.failed_accounts.remove(account_data)
-            if account_data in self.final_failures:
-                self.final_failures.remove(account_data)
-            if account_data in self.stored_credentials_failed:
-                self.stored_credentials_failed.remove(account_data)
-            self.processed_failures.add(account_data)
-
-    def should_process(self, account_data):
-        with self.lock:
-            if account_data in self.completed_accounts:
-                return False
-            if (
-                account_data in self.attempt_counter
-                and self.attempt_counter[account_data] >= self.max_retries
-            ):
-                return False
-            return True
-
-    def _write_to_fail_file(self, account_data):
-        try:
-            _, private_key, wallet_address = account_data
-            fail_file_path = "logs/failure_accounts.txt"
-
-            existing_entries = set()
-            if os.path.exists(fail_file_path):
-                with open(fail_file_path, "r") as f:
-                    existing_entries = set(f.readlines())
-
-            new_entry = f"{private_key}:{wallet_address}\n"
-
-            if new_entry not in existing_entries:
-                with open(fail_file_path, "a") as f:
-                    f.write(new_entry)
-
-        except Exception as e:
-            error_log(f"Error writing to fail file: {str(e)}")
-
-    def mark_stored_credentials_failed(self, account_data):
-        with self.lock:
-            self.stored_credentials_failed.add(account_data)
-
-    def should_try_stored_credentials(self, account_data):
-        return account_data not in self.stored_credentials_failed
-
-    def get_retry_accounts(self):
-        with self.lock:
-            return [
-                acc
-                for acc in self.failed_accounts
-                if acc not in self.completed_accounts
-                and self.attempt_counter[acc] < self.max_retries
-                and acc not in self.final_failures
-            ]
-
-    def get_current_attempt(self, account_data):
-        with self.lock:
-            return self.attempt_counter.get(account_data, 0)
-
-    def get_success_rate(self):
-        total = len(self.success_accounts) + len(self.failed_accounts)
-        return len(self.success_accounts) / total if total > 0 else 0
-
-    def should_continue_retrying(self):
-        return self.get_success_rate() < self.success_threshold and bool(
-            self.get_retry_accounts()
-        )
-
-    def get_unprocessed_failures(self):
-        with self.lock:
-            return [
-                acc
-                for acc in self.failed_accounts
-                if acc not in self.processed_failures
-                and acc not in self.completed_accounts
-            ]
-
-
-class FantasyProcessor:
-    def __init__(self, config, proxies_dict, all_proxies, user_agents_cycle):
-        self.config = config
-        self.proxies = proxies_dict
-        self.all_proxies = all_proxies
-        self.user_agents_cycle = user_agents_cycle
-        self.account_storage = AccountStorage()
-        self.last_request_time = {}
-        self.min_request_interval = 2
-        self.lock = threading.Lock()
-        self.retry_manager = RetryManager()
-        self.retry_delay = 5
-        self.max_proxy_retries = 5
-        self.completed_quests = set()
-
-    def _wait_rate_limit(self, thread_id):
-        current_time = time.time()
-        with self.lock:
-            last_time = self.last_request_time.get(thread_id, 0)
-            time_since_last = current_time - last_time
-            if time_since_last < self.min_request_interval:
-                sleep_time = self.min_request_interval - time_since_last
-                sleep(sleep_time)
-            self.last_request_time[thread_id] = time.time()
-
-    def _get_random_proxy(self):
-        with self.lock:
-            return random.choice(self.all_proxies)
-
-    def process_account_with_retry(
-        self, account_number, private_key, wallet_address, total_accounts
-    ):
-        account_data = (account_number, private_key, wallet_address)
-
-        if not self.retry_manager.should_process(account_data):
-            info_log(
-                f"Skipping account {account_number}: already processed successfully or max retries reached"
-            )
-            return
-
-        proxy_retries = 0
-
-        while proxy_retries < self.max_proxy_retries:
-            try:
-                success = self.process_account(
-                    account_number, private_key, wallet_address, total_accounts
-                )
-                if success:
-                    self.retry_manager.add_success_account(account_data)
-                    return
-                proxy_retries += 1
-                sleep(2)
-            except requests.exceptions.RequestException as e:
-                error_log(f"Network error for account {account_number}: {str(e)}")
-                proxy_retries += 1
-                sleep(2)
-            except Exception as e:
-                error_log(f"Error processing account {account_number}: {str(e)}")
-                self.retry_manager.add_failed_account(account_data)
-                return
-
-        self.retry_manager.add_failed_account(account_data)
-
-    def process_account(
-        self, account_number, private_key, wallet_address, total_accounts
-    ):
-        max_attempts = 3
-        account_data = (account_number, private_key, wallet_address)
-        current_attempt = self.retry_manager.get_current_attempt(account_data)
-
-        while current_attempt < max_attempts:
-            current_attempt += 1
-            try:
-                thread_id = threading.get_ident()
-                self._wait_rate_limit(thread_id)
-
-                session = requests.Session()
-                api = None
-
-                try:
-                    proxy = self._get_random_proxy()
-                    proxy_dict = {"http": proxy, "https": proxy}
-
-                    if current_attempt == 1:
-                        info_log(
-                            f"Processing account {account_number}: {wallet_address}"
-                        )
-                    else:
-                        info_log(
-                            f"Retrying account {account_number}: {wallet_address} (Attempt {current_attempt}/{max_attempts})"
-                        )
-
-                    with self.lock:
-                        user_agent = next(self.user_agents_cycle)
-
-                    api = FantasyAPI(
-                        web3_provider=self.config["rpc"]["url"],
-                        session=session,
-                        proxies=proxy_dict,
-                        all_proxies=self.all_proxies,
-                        config=self.config,
-                        user_agent=user_agent,
-                        account_storage=self.account_storage,
-                    )
-
-                    auth_data = None
-                    token = None
-
-                    if current_attempt == 1:
-                        stored_success, stored_token = (
-                            api.token_manager.try_stored_credentials(
-                                wallet_address, account_number
-                            )
-                        )
-                        if stored_success:
-                            info_log(
-                                f"Using stored credentials for account {account_number}"
-                            )
-                            token = stored_token
-
-                    if not token:
-                        auth_data = api.login(
-                            private_key, wallet_address, account_number
-                        )
-                        if auth_data is False:
-                            session.close()
-                            sleep(2)
-                            continue
-
-                        if isinstance(auth_data, str) and "429" in auth_data:
-                            info_log(
-                                f"Rate limit on login for account {account_number}, switching proxy..."
-                            )
-                            session.close()
-                            sleep(2)
-                            continue
-
-                        token = api.get_token(auth_data, wallet_address, account_number)
-                        if not token:
-                            session.close()
-                            sleep(2)
-                            continue
-
-                    tasks_completed = True
-
-                    if self.config.get("starter_cards", {}).get("enabled", False):
-                        account_info = None
-                        if self.config["info_check"]:
-                            account_info = api.info(
-                                token, wallet_address, account_number
-                            )
-                            if isinstance(account_info, str) and "429" in account_info:
-                                info_log(f"Rate limit on info check, retrying...")
-                                sleep(2)
-                                continue
-
-                        card_count = 0
-                        if isinstance(account_info, dict):
-                            card_count = account_info.get("number_of_cards", 0)
-                        elif os.path.exists(self.config["app"]["result_file"]):
-                            with open(self.config["app"]["result_file"], "r") as f:
-                                for line in f:
-                                    if wallet_address in line:
-                                        parts = line.strip().split(":")
-                                        for part in parts:
-                                            if part.startswith("number_of_cards="):
-                                                try:
-                                                    card_count = int(part.split("=")[1])
-                                                except ValueError:
-                                                    pass
-                                        break
-
-                        if card_count >= 15:
-                            info_log(
-                                f"Account {account_number}: Already has {card_count} cards, skipping starter cards claim"
-                            )
-                        else:
-                            starter_cards_success = api.claim_starter_cards(
-                                token, wallet_address, account_number
-                            )
-                            if (
-                                isinstance(starter_cards_success, str)
-                                and "429" in starter_cards_success
-                            ):
-                                info_log(
-                                    f"Rate limit on claiming starter cards for account {account_number}, retrying..."
-                                )
-                                sleep(2)
-                                continue
-                            if starter_cards_success:
-                                success_log(
-                                    f"Account {account_number}: Successfully claimed starter cards"
-                                )
-
-                                if self.config.get("tournaments", {}).get(
-                                    "enabled", False
-                                ):
-                                    wait_time = self.config.get(
-                                        "starter_cards", {}
-                                    ).get("wait_time_after_claim", 10)
-                                    info_log(
-                                        f"Waiting {wait_time} seconds for transaction confirmation before tournament registration..."
-                                    )
-                                    sleep(wait_time)
-
-                                    account_info = api.info(
-                                        token, wallet_address, account_number
-                                    )
-                                    if (
-                                        isinstance(account_info, str)
-                                        and "429" in account_info
-                                    ):
-                                        info_log(
-                                            f"Rate limit on info check after claiming cards, continuing..."
-                                        )
-                                    else:
-                                        success_log(
-                                            f"Account {account_number}: Updated info after claiming cards"
-                                        )
-                            else:
-                                info_log(
-                                    f"Claiming starter cards skipped or failed for account {account_number}"
-                                )
-
-                    if self.config.get("fragment_packs", {}).get(
-                        "enabled", False
-                    ) and self.config.get("fragment_packs", {}).get("buy_packs", False):
-                        try:
-                            pack_type = self.config.get("fragment_packs", {}).get(
-                                "pack_type", "violet"
-                            )
-                            pack_id = (
-                                self.config.get("fragment_packs", {})
-                                .get("pack_types", {})
-                                .get(pack_type, {})
-                                .get("id")
-                            )
-
-                            if not pack_id:
-                                info_log(
-                                    f"Invalid pack type in configuration: {pack_type}"
-                                )
-                            else:
-                                if self.config.get("fragment_packs", {}).get(
-                                    "use_all_fragments", False
-                                ):
-                                    claim_immediately = self.config.get(
-                                        "fragment_packs", {}
-                                    ).get("claim_immediately", True)
-                                    pk = private_key if claim_immediately else None
-                                    num_purchased = api.buy_packs_with_all_fragments(
-                                        token,
-                                        wallet_address,
-                                        account_number,
-                                        pack_id,
-                                        pk,
-                                    )
-
-                                    if num_purchased > 0:
-                                        success_log(
-                                            f"Account {account_number}: Successfully purchased {num_purchased} fragment packs"
-                                        )
-                                else:
-                                    specific_quantity = self.config.get(
-                                        "fragment_packs", {}
-                                    ).get("specific_quantity", 0)
-                                    if specific_quantity > 0:
-                                        purchase_success = api.buy_fragment_pack(
-                                            token,
-                                            wallet_address,
-                                            account_number,
-                                            pack_id,
-                                            specific_quantity,
-                                        )
-
-                                        if purchase_success:
-                                            success_log(
-                                                f"Account {account_number}: Successfully purchased {specific_quantity} fragment packs"
-                                            )
-
-                                            if self.config.get(
-                                                "fragment_packs", {}
-                                            ).get("claim_immediately", True):
-                                                time.sleep(5)
-                                                api.process_fragment_packs(
-                                                    token,
-                                                    wallet_address,
-                                                    account_number,
-                                                    private_key,
-                                                )
-                                        else:
-                                            info_log(
-                                                f"Account {account_number}: Failed to purchase fragment packs"
-                                            )
-                        except Exception as e:
-                            error_log(
-                                f"Error processing fragment packs purchase for account {account_number}: {str(e)}"
-                            )
-
-                    if self.config["onboarding_quest"]["enabled"]:
-                        onboarding_ids = self.config["onboarding_quest"].get("ids", [])
-
-                        if "id" in self.config["onboarding_quest"]:
-                            single_id = self.config["onboarding_quest"]["id"]
-                            if single_id and single_id not in onboarding_ids:
-                                onboarding_ids.append(single_id)
-
-                        if not onboarding_ids:
-                            info_log(
-                                f"No onboarding quest IDs configured for account {account_number}"
-                            )
-                        else:
-                            for onboarding_id in onboarding_ids:
-                                quest_key = f"{account_number}:{onboarding_id}"
-                                if quest_key in self.completed_quests:
-                                    continue
-
-                                onboarding_success = api.onboarding_quest_claim(
-                                    token, wallet_address, account_number, onboarding_id
-                                )
-                                if onboarding_success:
-                                    success_log(
-                                        f"Successfully completed onboarding quest {onboarding_id} for account {account_number}"
-                                    )
-                                    self.completed_quests.add(quest_key)
-                                else:
-                                    info_log(
-                                        f"Onboarding quest {onboarding_id} skipped or failed for account {account_number}"
-                                    )
-
-                    if self.config["daily"]["enabled"]:
-                        daily_success = api.daily_claim(
-                            token, wallet_address, account_number
-                        )
-                        if isinstance(daily_success, str) and "429" in daily_success:
-                            info_log(
-                                f"Rate limit on daily claim for account {account_number}, retrying..."
-                            )
-                            sleep(2)
-                            continue
-                        if not daily_success:
-                            tasks_completed = False
-                        else:
-                            success_log(
-                                f"Account {account_number}: Successfully claimed daily reward"
-                            )
-
-                    if self.config["fragments"]["enabled"]:
-                        fragment_id = self.config["fragments"]["id"]
-                        fragment_success = api.fragments_claim(
-                            token, wallet_address, account_number, fragment_id
-                        )
-                        if not fragment_success:
-                            tasks_completed = False
-
-                    if self.config.get("fragment_roulette", {}).get("enabled", False):
-                        claim_packs = self.config.get("other_rewards", {}).get(
-                            "claim_packs", False
-                        )
-                        fragment_roulette_result = api.fragment_roulette(
-                            token,
-                            wallet_address,
-                            account_number,
-                            private_key if claim_packs else None,
-                        )
-                        if (
-                            isinstance(fragment_roulette_result, str)
-                            and "429" in fragment_roulette_result
-                        ):
-                            info_log(
-                                f"Rate limit on fragment roulette for account {account_number}, retrying..."
-                            )
-                            sleep(2)
-                            continue
-                        if fragment_roulette_result and fragment_roulette_result.get(
-                            "success", False
-                        ):
-                            prize = fragment_roulette_result.get("selectedPrize", {})
-                            prize_type = prize.get("type", "Unknown")
-                            prize_amount = prize.get("text", "Unknown")
-                            success_log(
-                                f"Account {account_number}: Fragment roulette success - {prize_type}({prize_amount})"
-                            )
-                        else:
-                            info_log(
-                                f"Account {account_number}: Fragment roulette skipped (not enough fragments or already claimed)"
-                            )
-
-                    if self.config["quest"]["enabled"]:
-                        for quest_id in self.config["quest"]["ids"]:
-                            quest_key = f"{account_number}:{quest_id}"
-                            if quest_key in self.completed_quests:
-                                continue
-
-                            quest_success = api.quest_claim(
-                                token, wallet_address, account_number, quest_id
-                            )
-                            if quest_success == "429":
-                                info_log(
-                                    f"Rate limit on quest claim for account {account_number}, retrying..."
-                                )
-                                sleep(2)
-                                continue
-                            if quest_success:
-                                self.completed_quests.add(quest_key)
-                            else:
-                                tasks_completed = False
-
-                    if self.config.get("tournaments", {}).get(
-                        "enabled", False
-                    ) and self.config.get("tournaments", {}).get(
-                        "claim_rewards", False
-                    ):
-                        tournament_rewards = api.check_tournament_rewards(
-                            token, wallet_address, account_number
-                        )
-                        if (
-                            isinstance(tournament_rewards, str)
-                            and "429" in tournament_rewards
-                        ):
-                            info_log(
-                                f"Rate limit on checking tournament rewards for account {account_number}, retrying..."
-                            )
-                            sleep(2)
-                            continue
-
-                        if (
-                            tournament_rewards
-                            and "tournamentRewards" in tournament_rewards
-                            and tournament_rewards["tournamentRewards"]
-                        ):
-                            success_log(
-                                f"Account {account_number}: Found available tournament rewards"
-                            )
-
-                            tournament_data = api.get_active_tournaments(
-                                token, wallet_address, account_number
-                            )
-                            if (
-                                isinstance(tournament_data, str)
-                                and "429" in tournament_data
-                            ):
-                                info_log(
-                                    f"Rate limit on getting tournament data for account {account_number}, retrying..."
-                                )
-                                sleep(2)
-                                continue
-
-                            if tournament_data and "tournaments" in tournament_data:
-                                tournament_ids = [
-                                    t.get("id")
-                                    for t in tournament_data.get("tournaments", [])
-                                ]
-
-                                if tournament_ids:
-                                    sleep(1)
-
-                                    claim_result = api.claim_tournament_rewards(
-                                        token,
-                                        wallet_address,
-                                        account_number,
-                                        tournament_ids,
-                                    )
-
-                                    if (
-                                        isinstance(claim_result, str)
-                                        and "429" in claim_result
-                                    ):
-                                        info_log(
-                                            f"Rate limit on claiming tournament rewards for account {account_number}, retrying..."
-                                        )
-                                        sleep(2)
-                                        continue
-
-                                    if claim_result:
-                                        if isinstance(claim_result, dict):
-                                            if "claimed" in claim_result:
-                                                rewards = claim_result.get(
-                                                    "claimed", {}
-                                                )
-                                                rewards_str = ", ".join(
-                                                    [
-                                                        f"{k}: {v}"
-                                                        for k, v in rewards.items()
-                                                    ]
-                                                )
-                                                success_log(
-                                                    f"Account {account_number}: Successfully claimed tournament rewards: {rewards_str}"
-                                                )
-                                            elif (
-                                                "status" in claim_result
-                                                and claim_result["status"]
-                                                == "already_claimed"
-                                            ):
-                                                success_log(
-                                                    f"Account {account_number}: Tournament rewards processing completed"
-                                                )
-                                        else:
-                                            info_log(
-                                                f"Unexpected result type from claim_tournament_rewards for account {account_number}"
-                                            )
-                                    else:
-                                        info_log(
-                                            f"Failed to claim tournament rewards for account {account_number}"
-                                        )
-                                else:
-                                    info_log(
-                                        f"No tournament IDs found for account {account_number}"
-                                    )
-                            else:
-                                info_log(
-                                    f"Tournament data unavailable for account {account_number}"
-                                )
-                        else:
-                            info_log(
-                                f"No available tournament rewards found for account {account_number}"
-                            )
-
-                    if self.config.get("other_rewards", {}).get(
-                        "enabled", False
-                    ) and self.config.get("other_rewards", {}).get(
-                        "claim_packs", False
-                    ):
-                        pack_processing_result = api.process_fragment_packs(
-                            token, wallet_address, account_number, private_key
-                        )
-                        if (
-                            isinstance(pack_processing_result, str)
-                            and "429" in pack_processing_result
-                        ):
-                            info_log(
-                                f"Rate limit on pack processing for account {account_number}, retrying..."
-                            )
-                            sleep(2)
-                            continue
-
-                        if pack_processing_result:
-                            success_log(
-                                f"Account {account_number}: Successfully processed fragment packs"
-                            )
-                        else:
-                            info_log(
-                                f"Account {account_number}: No fragment packs to process or processing failed"
-                            )
-
-                    if self.config.get("other_rewards", {}).get("enabled", False):
-                        other_rewards_result = api.check_other_rewards(
-                            token, wallet_address, account_number
-                        )
-                        if (
-                            isinstance(other_rewards_result, str)
-                            and "429" in other_rewards_result
-                        ):
-                            info_log(
-                                f"Rate limit on checking other rewards for account {account_number}, retrying..."
-                            )
-                            sleep(2)
-                            continue
-
-                        if other_rewards_result:
-                            success_log(
-                                f"Account {account_number}: Successfully processed other rewards"
-                            )
-
-                    if self.config.get("tournaments", {}).get("enabled", False):
-                        from src.tournament_manager import TournamentManager
-
-                        tournament_manager = TournamentManager(api, self.config)
-
-                        tournament_ids = {}
-                        for t_type, t_config in self.config["tournaments"][
-                            "types"
-                        ].items():
-                            if t_config.get("id"):
-                                tournament_ids[t_type] = t_config["id"]
-
-                        if tournament_ids:
-                            info_log(
-                                f"Registering account {account_number} in tournaments: {', '.join(tournament_ids.keys())}"
-                            )
-                            tournament_results = (
-                                tournament_manager.register_in_tournaments(
-                                    token,
-                                    wallet_address,
-                                    account_number,
-                                    tournament_ids,
-                                )
-                            )
-
-                            success_tournaments = [
-                                t_type
-                                for t_type, result in tournament_results.items()
-                                if result
-                            ]
-                            if success_tournaments:
-                                success_log(
-                                    f"Account {account_number}: Successfully registered in {', '.join(success_tournaments)} tournaments"
-                                )
-
-                            failed_tournaments = [
-                                t_type
-                                for t_type, result in tournament_results.items()
-                                if not result
-                            ]
-                            if failed_tournaments:
-                                info_log(
-                                    f"Account {account_number}: Failed to register in {', '.join(failed_tournaments)} tournaments"
-                                )
-
-                    # Burn cards functionality
-                    if self.config.get("burn_cards", {}).get("enabled", False):
-                        try:
-                            # Fetch all player cards
-                            all_cards = api.get_player_cards_for_burn(
-                                token, wallet_address, account_number
-                            )
-                            
-                            if all_cards:
-                                info_log(f"Found {len(all_cards)} cards for account {account_number}")
-                                
-                                # Select cards to burn based on configuration
-                                cards_to_burn = api.select_cards_to_burn(
-                                    all_cards,
-                                    self.config["burn_cards"]["min_cards_to_burn"],
-                                    self.config["burn_cards"]["max_cards_to_burn"],
-                                    self.config["burn_cards"]["min_stars_threshold"],
-                                    self.config["burn_cards"]["max_stars_threshold"],
-                                    self.config["burn_cards"]["burn_duplicates"]
-                                )
-                                
-                                if cards_to_burn:
-                                    # Log cards to be burned
-                                    burn_info = []
-                                    for card in cards_to_burn:
-                                        burn_info.append(f"{card['name']} ({card['stars']}* ID:{card['token_id']})")
-                                    info_log(f"Account {account_number}: Burning {len(cards_to_burn)} cards: {', '.join(burn_info[:5])}{'...' if len(burn_info) > 5 else ''}")
-                                    
-                                    # Extract token IDs
-                                    token_ids_to_burn = [card["token_id"] for card in cards_to_burn]
-                                    
-                                    # Execute burn transaction
-                                    burn_result = api.burn_cards(
-                                        token, wallet_address, account_number, private_key, token_ids_to_burn
-                                    )
-                                    
-                                    if burn_result:
-                                        success_log(f"Account {account_number}: Successfully burned {len(cards_to_burn)} cards")
-                                    else:
-                                        error_log(f"Account {account_number}: Failed to burn cards")
-                                else:
-                                    info_log(f"Account {account_number}: No cards selected for burning based on criteria")
-                            else:
-                                info_log(f"Account {account_number}: No cards available for burning")
-                                
-                        except Exception as e:
-                            error_log(f"Error in burn cards process for account {account_number}: {str(e)}")
-
-                    if self.config["info_check"]:
-                        info_success = api.info(token, wallet_address, account_number)
-                        if isinstance(info_success, str) and "429" in info_success:
-                            info_log(
-                                f"Rate limit on info check for account {account_number}, retrying..."
-                            )
-                            sleep(2)
-                            continue
-                        if not info_success:
-                            tasks_completed = False
-
-                    if tasks_completed:
-                        self._write_success(private_key, wallet_address)
-                        success_log(
-                            f"Account {account_number}: {wallet_address} - All tasks completed successfully"
-                        )
-                        self.retry_manager.add_success_account(account_data)
-                        return True
-                    else:
-                        session.close()
-                        sleep(2)
-                        continue
-
-                except requests.exceptions.RequestException as e:
-                    if "429" in str(e):
-                        info_log(
-                            f"Rate limit exception for account {account_number}, retrying..."
-                        )
-                        sleep(2)
-                        continue
-                    error_log(f"Request error for account {account_number}: {str(e)}")
-                    session.close()
-                    sleep(2)
-                    continue
-
-                finally:
-                    if session:
-                        session.close()
-
-            except Exception as e:
-                error_log(f"Error processing account {account_number}: {str(e)}")
-                sleep(2)
-                continue
-
-        error_log(f"All attempts exhausted for account {account_number}")
-        self._write_failure(private_key, wallet_address)
-        self.retry_manager.add_failed_account(account_data)
-        return False
-
-    def retry_failed_accounts(self):
-        if not self.config["app"].get("retry_failed_accounts", True):
-            info_log("Retry failed accounts feature is disabled in config. Skipping.")
-            return
-
-        while self.retry_manager.should_continue_retrying():
-            retry_accounts = self.retry_manager.get_retry_accounts()
-            if retry_accounts:
-                info_log(
-                    f"Retrying {len(retry_accounts)} accounts from current session. Success rate: "
-                    f"{self.retry_manager.get_success_rate()*100:.2f}%"
-                )
-
-                with concurrent.futures.ThreadPoolExecutor(
-                    max_workers=self.config["app"]["threads"]
-                ) as executor:
-                    futures = []
-                    for account_number, private_key, wallet_address in retry_accounts:
-                        sleep(self.retry_delay)
-                        future = executor.submit(
-                            self.process_account_with_retry,
-                            account_number,
-                            private_key,
-                            wallet_address,
-                            len(retry_accounts),
-                        )
-                        futures.append(future)
-                    concurrent.futures.wait(futures)
-
-        try:
-            if os.path.exists(self.config["app"]["failure_file"]):
-                with open(self.config["app"]["failure_file"], "r") as f:
-                    failed_accounts = []
-                    seen_accounts = set()
-
-                    for line in f:
-                        if line.strip():
-                            try:
-                                private_key, wallet_address = line.strip().split(":")
-                                if wallet_address not in seen_accounts:
-                                    failed_accounts.append(
-                                        (private_key, wallet_address)
-                                    )
-                                    seen_accounts.add(wallet_address)
-                            except ValueError:
-                                error_log(
-                                    f"Invalid line format in failure_accounts.txt: {line.strip()}"
-                                )
-                                continue
-                if failed_accounts:
-                    info_log(
-                        f"Processing {len(failed_accounts)} unique accounts from failure_accounts.txt..."
-                    )
-
-                    with concurrent.futures.ThreadPoolExecutor(
-                        max_workers=self.config["app"]["threads"]
-                    ) as executor:
-                        futures = []
-                        for idx, (private_key, wallet_address) in enumerate(
-                            failed_accounts, 1
-                        ):
-                            sleep(self.retry_delay)
-                            future = executor.submit(
-                                self.process_account_with_retry,
-                                idx,
-                                private_key,
-                                wallet_address,
-                                len(failed_accounts),
-                            )
-                            futures.append(future)
-                        concurrent.futures.wait(futures)
-
-                    success_rate = self.retry_manager.get_success_rate() * 100
-                    info_log(
-                        f"Final success rate for failure_accounts.txt: {success_rate:.2f}%"
-                    )
-                else:
-                    info_log("No valid accounts found in failure_accounts.txt")
-
-                open(self.config["app"]["failure_file"], "w").close()
-
-        except Exception as e:
-            error_log(f"Error processing failure_accounts.txt: {str(e)}")
-
-    def _write_success(self, private_key, wallet_address):
-        with self.lock:
-            try:
-                with open(self.config["app"]["success_file"], "a") as f:
-                    f.write(f"{private_key}:{wallet_address}\n")
-                info_log(f"Successfully wrote {wallet_address} to success file")
-            except Exception as e:
-                error_log(f"Error writing to success file: {str(e)}")
-
-    def _write_failure(self, private_key, wallet_address):
-        with self.lock:
-            try:
-                existing_entries = set()
-                if os.path.exists(self.config["app"]["failure_file"]):
-                    with open(self.config["app"]["failure_file"], "r") as f:
-                        existing_entries = {line.strip() for line in f}
-
-                new_entry = f"{private_key}:{wallet_address}"
-
-                if new_entry not in existing_entries:
-                    with open(self.config["app"]["failure_file"], "a") as f:
-                        f.write(f"{new_entry}\n")
-                    info_log(f"Wrote {wallet_address} to failure file")
-            except Exception as e:
-                error_log(f"Error writing to failure file: {str(e)}")
+import math
+import random
+import time
+import os
+import threading
+import concurrent.futures
+from functools import partial
+from time import sleep
+from curl_cffi import requests
+from web3 import Web3
+from colorama import Fore
+from src.api import CARDS_CONTRACT_ADDRESS, FantasyAPI
+from src.utils import error_log, info_log, success_log, rate_limit_log
+from src.account_planner import AccountPlanner
+from src.account_storage import create_account_storage
+from src.fleet_census import CENSUS_BATCH_SIZE, CENSUS_TTL_MINUTES, FleetCensus
+from src.result_store import ResultStore
+from src.rate_limiter import RateLimiter
+from src.scheduler import StartScheduler
+from src.step_ledger import StepLedger
+from src.stage_executor import Stage, StageExecutor
+from src.session_pool import SessionPool
+from src.signing_service import SigningService
+from src.token_refresher import TokenRefresher
+from src.tournament_catalog import TournamentCatalog
+from src.web3_pool import get_web3, registry as web3_registry
+
+
+STEP_RETRY = "retry"
+
+# Steps only wait for the ones listed here; everything else may run in
+# parallel within an account. info summarizes the account, so it goes last.
+STEP_DEPENDENCIES = {
+    "fragment_roulette": ["fragment_packs", "daily", "fragments"],
+    "pack_claims": ["fragment_packs", "fragment_roulette"],
+    "other_rewards": ["pack_claims"],
+    # Decks and burn candidates are picked from the cards the account owns,
+    # so they wait for every step that can add cards to it
+    "tournaments": [
+        "starter_cards",
+        "fragment_packs",
+        "fragment_roulette",
+        "tournament_rewards",
+        "pack_claims",
+        "other_rewards",
+    ],
+    "burn_cards": ["tournaments", "pack_claims", "other_rewards"],
+    "info": [
+        "starter_cards",
+        "fragment_packs",
+        "onboarding",
+        "daily",
+        "fragments",
+        "fragment_roulette",
+        "quests",
+        "tournament_rewards",
+        "pack_claims",
+        "other_rewards",
+        "tournaments",
+        "burn_cards",
+    ],
+}
+
+# Steps that send transactions from the account wallet never overlap
+TRANSACTION_STEPS = {
+    "starter_cards",
+    "fragment_packs",
+    "fragment_roulette",
+    "pack_claims",
+    "burn_cards",
+}
+
+# Read once when the processor and its long lived components start; a config
+# reload in daemon mode only reports changes to them
+RESTART_CONFIG_KEYS = (
+    "app.threads",
+    "app.processes",
+    "app.engine",
+    "app.keys_file",
+    "app.proxy_file",
+    "app.result_file",
+    "app.failure_file",
+    "app.storage_backend",
+    "app.storage_file",
+    "app.sqlite_file",
+    "app.storage_flush_interval",
+    "app.result_flush_interval",
+    "app.step_ledger_flush_interval",
+    "app.session_pool_size",
+    "app.signing_processes",
+    "app.token_refresh_concurrency",
+    "app.token_refresh_before_minutes",
+    "app.rpc_batch_window_ms",
+    "app.tournament_refresh_interval",
+    "rate_limits",
+)
+
+
+class RetryManager:
+    def __init__(
+        self,
+        max_retries=3,
+        success_threshold=0.9,
+        failure_file="logs/failure_accounts.txt",
+    ):
+        self.failed_accounts = set()
+        self.success_accounts = set()
+        self.attempt_counter = {}
+        self.stored_credentials_failed = set()
+        self.max_retries = max_retries
+        self.success_threshold = success_threshold
+        self.failure_file = failure_file
+        self.lock = threading.Lock()
+        self.processed_failures = set()
+        self.final_failures = set()
+        self.completed_accounts = set()
+
+    def add_failed_account(self, account_data):
+        with self.lock:
+            if account_data in self.completed_accounts:
+                return
+
+            if account_data not in self.success_accounts:
+                self.failed_accounts.add(account_data)
+                if account_data not in self.attempt_counter:
+                    self.attempt_counter[account_data] = 1
+                else:
+                    self.attempt_counter[account_data] += 1
+
+                if self.attempt_counter[account_data] >= self.max_retries:
+                    if account_data not in self.final_failures:
+                        self.final_failures.add(account_data)
+                        self._write_to_fail_file(account_data)
+
+    def add_success_account(self, account_data):
+        with self.lock:
+            self.success_accounts.add(account_data)
+            self.completed_accounts.add(account_data)
+            if account_data in self.failed_accounts:
+                self.failed_accounts.remove(account_data)
+            if account_data in self.final_failures:
+                self.final_failures.remove(account_data)
+            if account_data in self.stored_credentials_failed:
+                self.stored_credentials_failed.remove(account_data)
+            self.processed_failures.add(account_data)
+
+    def reset_account(self, account_data):
+        with self.lock:
+            self.attempt_counter.pop(account_data, None)
+            self.success_accounts.discard(account_data)
+            self.completed_accounts.discard(account_data)
+            self.failed_accounts.discard(account_data)
+            self.final_failures.discard(account_data)
+
+    def should_process(self, account_data):
+        with self.lock:
+            if account_data in self.completed_accounts:
+                return False
+            if (
+                account_data in self.attempt_counter
+                and self.attempt_counter[account_data] >= self.max_retries
+            ):
+                return False
+            return True
+
+    def _write_to_fail_file(self, account_data):
+        try:
+            _, private_key, wallet_address = account_data
+            fail_file_path = self.failure_file
+
+            existing_entries = set()
+            if os.path.exists(fail_file_path):
+                with open(fail_file_path, "r") as f:
+                    existing_entries = set(f.readlines())
+
+            new_entry = f"{private_key}:{wallet_address}\n"
+
+            if new_entry not in existing_entries:
+                with open(fail_file_path, "a") as f:
+                    f.write(new_entry)
+
+        except Exception as e:
+            error_log(f"Error writing to fail file: {str(e)}")
+
+    def mark_stored_credentials_failed(self, account_data):
+        with self.lock:
+            self.stored_credentials_failed.add(account_data)
+
+    def should_try_stored_credentials(self, account_data):
+        return account_data not in self.stored_credentials_failed
+
+    def get_retry_accounts(self):
+        with self.lock:
+            return [
+                acc
+                for acc in self.failed_accounts
+                if acc not in self.completed_accounts
+                and self.attempt_counter[acc] < self.max_retries
+                and acc not in self.final_failures
+            ]
+
+    def get_current_attempt(self, account_data):
+        with self.lock:
+            return self.attempt_counter.get(account_data, 0)
+
+    def get_success_rate(self):
+        total = len(self.success_accounts) + len(self.failed_accounts)
+        return len(self.success_accounts) / total if total > 0 else 0
+
+    def should_continue_retrying(self):
+        return self.get_success_rate() < self.success_threshold and bool(
+            self.get_retry_accounts()
+        )
+
+    def get_unprocessed_failures(self):
+        with self.lock:
+            return [
+                acc
+                for acc in self.failed_accounts
+                if acc not in self.processed_failures
+                and acc not in self.completed_accounts
+            ]
+
+
+class FantasyProcessor:
+    def __init__(self, config, proxies_dict, all_proxies, user_agents_cycle):
+        self.config = config
+        self.proxies = proxies_dict
+        self.all_proxies = all_proxies
+        self.user_agents_cycle = user_agents_cycle
+        self.account_storage = create_account_storage(config)
+        self.result_store = ResultStore(
+            config["app"]["result_file"],
+            flush_interval=config["app"].get("result_flush_interval", 2),
+        )
+        self.rate_limiter = RateLimiter.from_config(config)
+        web3_registry.configure(
+            batch_window=config["app"].get("rpc_batch_window_ms", 5) / 1000
+        )
+        self.tournament_catalog = TournamentCatalog(
+            refresh_interval=config["app"].get("tournament_refresh_interval", 300)
+        )
+        self.signing_service = SigningService(
+            processes=config["app"].get("signing_processes", 2)
+        )
+        census_config = config.get("census", {})
+        self.fleet_census = (
+            FleetCensus(
+                batch_size=census_config.get("batch_size", CENSUS_BATCH_SIZE),
+                ttl_minutes=census_config.get("ttl_minutes", CENSUS_TTL_MINUTES),
+            )
+            if census_config.get("enabled", False)
+            else None
+        )
+        planner_config = config.get("planner", {})
+        self.step_ledger = StepLedger(
+            self.account_storage,
+            ttl_hours=config["app"].get("step_ledger_ttl_hours", 12),
+            cooldown_hours=(
+                planner_config.get("cooldowns", {})
+                if planner_config.get("enabled", False)
+                else None
+            ),
+            flush_interval=config["app"].get("step_ledger_flush_interval", 5),
+            durable_steps=TRANSACTION_STEPS,
+        )
+        self.account_planner = (
+            AccountPlanner(self.account_storage, self.step_ledger)
+            if planner_config.get("enabled", False)
+            else None
+        )
+        self.stage_executor = StageExecutor(
+            max_workers=config["app"].get("stage_concurrency", 3),
+            retry_result=STEP_RETRY,
+        )
+        self.session_pool = SessionPool(
+            requests.Session,
+            max_idle_per_proxy=config["app"].get(
+                "session_pool_size", config["app"]["threads"]
+            ),
+        )
+        self.token_refresher = (
+            TokenRefresher(
+                self._refresh_login,
+                self.account_storage,
+                refresh_before=config["app"].get("token_refresh_before_minutes", 15)
+                * 60,
+                max_workers=config["app"].get("token_refresh_concurrency", 2),
+            )
+            if config["app"].get("token_refresh_concurrency", 2) > 0
+            else None
+        )
+        self.lock = threading.Lock()
+        self.retry_manager = RetryManager(failure_file=config["app"]["failure_file"])
+        self.retry_delay = 5
+        self.max_proxy_retries = 5
+        self.completed_quests = set()
+
+    def apply_config(self, config):
+        # Planner, ledger, census and stage settings are rebuilt for the next
+        # account runs; returns the changed keys that need a restart
+        def lookup(source, key):
+            for part in key.split("."):
+                source = source.get(part) if isinstance(source, dict) else None
+            return source
+
+        restart_keys = [
+            key
+            for key in RESTART_CONFIG_KEYS
+            if lookup(self.config, key) != lookup(config, key)
+        ]
+        self.config = config
+
+        planner_config = config.get("planner", {})
+        self.step_ledger.configure(
+            ttl_hours=config["app"].get("step_ledger_ttl_hours", 12),
+            cooldown_hours=(
+                planner_config.get("cooldowns", {})
+                if planner_config.get("enabled", False)
+                else None
+            ),
+        )
+        self.account_planner = (
+            AccountPlanner(self.account_storage, self.step_ledger)
+            if planner_config.get("enabled", False)
+            else None
+        )
+
+        census_config = config.get("census", {})
+        if not census_config.get("enabled", False):
+            self.fleet_census = None
+        elif self.fleet_census:
+            self.fleet_census.configure(
+                batch_size=census_config.get("batch_size", CENSUS_BATCH_SIZE),
+                ttl_minutes=census_config.get("ttl_minutes", CENSUS_TTL_MINUTES),
+            )
+        else:
+            self.fleet_census = FleetCensus(
+                batch_size=census_config.get("batch_size", CENSUS_BATCH_SIZE),
+                ttl_minutes=census_config.get("ttl_minutes", CENSUS_TTL_MINUTES),
+            )
+
+        self.stage_executor.max_workers = max(
+            1, config["app"].get("stage_concurrency", 3)
+        )
+        return restart_keys
+
+    def _get_random_proxy(self):
+        with self.lock:
+            return random.choice(self.all_proxies)
+
+    def _create_api(self, session, proxy_dict):
+        with self.lock:
+            user_agent = next(self.user_agents_cycle)
+
+        return FantasyAPI(
+            web3_provider=self.config["rpc"]["url"],
+            session=session,
+            proxies=proxy_dict,
+            all_proxies=self.all_proxies,
+            config=self.config,
+            user_agent=user_agent,
+            account_storage=self.account_storage,
+            result_store=self.result_store,
+            rate_limiter=self.rate_limiter,
+            tournament_catalog=self.tournament_catalog,
+            fleet_census=self.fleet_census,
+            signing_service=self.signing_service,
+            token_refresher=self.token_refresher,
+        )
+
+    def _refresh_login(self, account_number, private_key, wallet_address):
+        proxy = self._get_random_proxy()
+        session = self.session_pool.acquire(proxy)
+        session_failed = False
+        try:
+            api = self._create_api(session, {"http": proxy, "https": proxy})
+            auth_data = api.login(private_key, wallet_address, account_number)
+            return isinstance(auth_data, dict)
+        except requests.exceptions.RequestException:
+            session_failed = True
+            return False
+        finally:
+            evicted_session = self.session_pool.release(session, discard=session_failed)
+            if evicted_session:
+                evicted_session.close()
+
+    def track_next_run(self, account_number, private_key, wallet_address, delay):
+        if self.token_refresher:
+            self.token_refresher.track(
+                account_number, private_key, wallet_address, time.time() + delay
+            )
+
+    def refresh_census(self, accounts) -> bool:
+        if not self.fleet_census:
+            return False
+
+        monad_web3 = get_web3(self.config["monad_rpc"]["url"], self.rate_limiter)
+        operators = []
+        if self.config.get("burn_cards", {}).get("enabled", False):
+            operators.append(self.config["burn_cards"]["contract_address"])
+
+        wallet_addresses = [
+            account_data[1] for _, account_data in accounts if len(account_data) == 2
+        ]
+        try:
+            self.fleet_census.run(
+                monad_web3, wallet_addresses, CARDS_CONTRACT_ADDRESS, operators
+            )
+        except Exception as e:
+            error_log(f"Census failed, accounts will read their own state: {str(e)}")
+            return False
+        return True
+
+    def _take_census(self, accounts):
+        if not self.refresh_census(accounts):
+            return accounts
+
+        census_config = self.config.get("census", {})
+        if not census_config.get("drop_unfunded", False):
+            return accounts
+
+        min_balance = Web3.to_wei(census_config.get("min_balance", 0.01), "ether")
+        funded_accounts = [
+            (account_number, account_data)
+            for account_number, account_data in accounts
+            if len(account_data) != 2
+            or self.fleet_census.is_funded(account_data[1], min_balance)
+        ]
+        if len(funded_accounts) < len(accounts):
+            info_log(
+                f"Census skipped {len(accounts) - len(funded_accounts)} accounts below {census_config.get('min_balance', 0.01)} MONAD"
+            )
+        return funded_accounts
+
+    def plan_accounts(self, accounts):
+        if not self.account_planner:
+            return accounts
+
+        step_names = [step_name for step_name, _ in self._get_account_steps()]
+        always_due = self.account_planner.get_always_due(step_names)
+        if always_due:
+            info_log(
+                f"Planner: {', '.join(always_due)} have no cooldown and are always due, so no account is skipped"
+            )
+            return accounts
+
+        planned_accounts = [
+            (account_number, account_data)
+            for account_number, account_data in accounts
+            if len(account_data) != 2
+            or self.account_planner.plan(account_data[1], step_names)
+        ]
+        if len(planned_accounts) < len(accounts):
+            info_log(
+                f"Planner skipped {len(accounts) - len(planned_accounts)} accounts with nothing to do"
+            )
+        return planned_accounts
+
+    def process_accounts(self, accounts):
+        accounts = self._take_census(self.plan_accounts(accounts))
+        total_accounts = len(accounts)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.config["app"]["threads"]
+        ) as executor:
+            scheduler = StartScheduler(executor)
+            futures = []
+            start_delay = 0
+            for account_number, account_data in accounts:
+                if len(account_data) != 2:
+                    error_log(
+                        f"Invalid account data format for account {account_number}"
+                    )
+                    continue
+
+                private_key, wallet_address = account_data
+                self.track_next_run(
+                    account_number, private_key, wallet_address, start_delay
+                )
+                future = scheduler.schedule(
+                    start_delay,
+                    self.process_account_with_retry,
+                    account_number,
+                    private_key,
+                    wallet_address,
+                    total_accounts,
+                )
+                futures.append(future)
+
+                if "acc_delays" in self.config["app"]:
+                    delay_config = self.config["app"]["acc_delays"]
+                    start_delay += random.randint(delay_config[0], delay_config[1])
+
+            concurrent.futures.wait(futures)
+            scheduler.shutdown()
+
+    def process_account_with_retry(
+        self, account_number, private_key, wallet_address, total_accounts
+    ):
+        account_data = (account_number, private_key, wallet_address)
+
+        if not self.retry_manager.should_process(account_data):
+            info_log(
+                f"Skipping account {account_number}: already processed successfully or max retries reached"
+            )
+            return
+
+        proxy_retries = 0
+
+        while proxy_retries < self.max_proxy_retries:
+            try:
+                success = self.process_account(
+                    account_number, private_key, wallet_address, total_accounts
+                )
+                if success:
+                    self.retry_manager.add_success_account(account_data)
+                    return
+                proxy_retries += 1
+                sleep(2)
+            except requests.exceptions.RequestException as e:
+                error_log(f"Network error for account {account_number}: {str(e)}")
+                proxy_retries += 1
+                sleep(2)
+            except Exception as e:
+                error_log(f"Error processing account {account_number}: {str(e)}")
+                self.retry_manager.add_failed_account(account_data)
+                return
+
+        self.retry_manager.add_failed_account(account_data)
+
+    def process_account(
+        self, account_number, private_key, wallet_address, total_accounts
+    ):
+        max_attempts = 3
+        account_data = (account_number, private_key, wallet_address)
+        current_attempt = self.retry_manager.get_current_attempt(account_data)
+
+        while current_attempt < max_attempts:
+            current_attempt += 1
+            try:
+                proxy = self._get_random_proxy()
+                session = self.session_pool.acquire(proxy)
+                session_failed = False
+                api = None
+
+                try:
+                    proxy_dict = {"http": proxy, "https": proxy}
+
+                    if current_attempt == 1:
+                        info_log(
+                            f"Processing account {account_number}: {wallet_address}"
+                        )
+                    else:
+                        info_log(
+                            f"Retrying account {account_number}: {wallet_address} (Attempt {current_attempt}/{max_attempts})"
+                        )
+
+                    api = self._create_api(session, proxy_dict)
+
+                    auth_data = None
+                    token = None
+
+                    if self.token_refresher:
+                        self.token_refresher.wait_for(wallet_address)
+
+                    if current_attempt == 1:
+                        stored_success, stored_token = (
+                            api.token_manager.try_stored_credentials(
+                                wallet_address, account_number
+                            )
+                        )
+                        if stored_success:
+                            info_log(
+                                f"Using stored credentials for account {account_number}"
+                            )
+                            token = stored_token
+
+                    if not token:
+                        auth_data = api.login(
+                            private_key, wallet_address, account_number
+                        )
+                        if auth_data is False:
+                            sleep(2)
+                            continue
+
+                        if isinstance(auth_data, str) and "429" in auth_data:
+                            info_log(
+                                f"Rate limit on login for account {account_number}, switching proxy..."
+                            )
+                            sleep(2)
+                            continue
+
+                        token = api.get_token(auth_data, wallet_address, account_number)
+                        if not token:
+                            sleep(2)
+                            continue
+
+                    completed_steps = self.step_ledger.get_completed_steps(
+                        wallet_address
+                    )
+                    if completed_steps:
+                        info_log(
+                            f"Account {account_number}: Steps already done, skipping: {', '.join(sorted(completed_steps))}"
+                        )
+
+                    stages = [
+                        Stage(
+                            step_name,
+                            partial(
+                                step,
+                                api,
+                                token,
+                                account_number,
+                                private_key,
+                                wallet_address,
+                            ),
+                            depends_on=STEP_DEPENDENCIES.get(step_name, []),
+                            exclusive=step_name in TRANSACTION_STEPS,
+                        )
+                        for step_name, step in self._get_account_steps()
+                    ]
+
+                    def on_stage_done(step_name, step_result):
+                        if step_result is not False:
+                            self.step_ledger.mark_done(
+                                wallet_address, private_key, step_name
+                            )
+
+                    step_results, rate_limited = self.stage_executor.run(
+                        stages, completed_steps, on_stage_done
+                    )
+
+                    if rate_limited:
+                        sleep(2)
+                        continue
+
+                    tasks_completed = all(
+                        step_result is not False
+                        for step_result in step_results.values()
+                    )
+                    if tasks_completed:
+                        self.step_ledger.reset(wallet_address, private_key)
+                        self._write_success(private_key, wallet_address)
+                        success_log(
+                            f"Account {account_number}: {wallet_address} - All tasks completed successfully"
+                        )
+                        self.retry_manager.add_success_account(account_data)
+                        return True
+                    else:
+                        sleep(2)
+                        continue
+
+                except requests.exceptions.RequestException as e:
+                    if "429" in str(e):
+                        info_log(
+                            f"Rate limit exception for account {account_number}, retrying..."
+                        )
+                        sleep(2)
+                        continue
+                    error_log(f"Request error for account {account_number}: {str(e)}")
+                    session_failed = True
+                    sleep(2)
+                    continue
+
+                finally:
+                    evicted_session = self.session_pool.release(
+                        session, discard=session_failed
+                    )
+                    if evicted_session:
+                        evicted_session.close()
+
+            except Exception as e:
+                error_log(f"Error processing account {account_number}: {str(e)}")
+                sleep(2)
+                continue
+
+        error_log(f"All attempts exhausted for account {account_number}")
+        self._write_failure(private_key, wallet_address)
+        self.retry_manager.add_failed_account(account_data)
+        return False
+
+    def _get_account_steps(self):
+        steps = []
+        if self.config.get("starter_cards", {}).get("enabled", False):
+            steps.append(("starter_cards", self._step_starter_cards))
+        if self.config.get("fragment_packs", {}).get(
+            "enabled", False
+        ) and self.config.get("fragment_packs", {}).get("buy_packs", False):
+            steps.append(("fragment_packs", self._step_fragment_packs))
+        if self.config["onboarding_quest"]["enabled"]:
+            steps.append(("onboarding", self._step_onboarding))
+        if self.config["daily"]["enabled"]:
+            steps.append(("daily", self._step_daily))
+        if self.config["fragments"]["enabled"]:
+            steps.append(("fragments", self._step_fragments))
+        if self.config.get("fragment_roulette", {}).get("enabled", False):
+            steps.append(("fragment_roulette", self._step_fragment_roulette))
+        if self.config["quest"]["enabled"]:
+            steps.append(("quests", self._step_quests))
+        if self.config.get("tournaments", {}).get(
+            "enabled", False
+        ) and self.config.get("tournaments", {}).get("claim_rewards", False):
+            steps.append(("tournament_rewards", self._step_tournament_rewards))
+        if self.config.get("other_rewards", {}).get(
+            "enabled", False
+        ) and self.config.get("other_rewards", {}).get("claim_packs", False):
+            steps.append(("pack_claims", self._step_pack_claims))
+        if self.config.get("other_rewards", {}).get("enabled", False):
+            steps.append(("other_rewards", self._step_other_rewards))
+        if self.config.get("tournaments", {}).get("enabled", False):
+            steps.append(("tournaments", self._step_tournaments))
+        if self.config.get("burn_cards", {}).get("enabled", False):
+            steps.append(("burn_cards", self._step_burn_cards))
+        if self.config["info_check"]:
+            steps.append(("info", self._step_info))
+        return steps
+
+    def _step_starter_cards(
+        self, api, token, account_number, private_key, wallet_address
+    ):
+        account_info = None
+        if self.config["info_check"]:
+            account_info = api.info(
+                token, wallet_address, account_number
+            )
+            if isinstance(account_info, str) and "429" in account_info:
+                info_log(f"Rate limit on info check, retrying...")
+                return STEP_RETRY
+
+        card_count = 0
+        if isinstance(account_info, dict):
+            card_count = account_info.get("number_of_cards", 0)
+        else:
+            card_count = (
+                self.result_store.get_int_field(
+                    wallet_address, "number_of_cards"
+                )
+                or 0
+            )
+
+        if card_count >= 15:
+            info_log(
+                f"Account {account_number}: Already has {card_count} cards, skipping starter cards claim"
+            )
+        else:
+            starter_cards_success = api.claim_starter_cards(
+                token, wallet_address, account_number
+            )
+            if (
+                isinstance(starter_cards_success, str)
+                and "429" in starter_cards_success
+            ):
+                info_log(
+                    f"Rate limit on claiming starter cards for account {account_number}, retrying..."
+                )
+                return STEP_RETRY
+            if starter_cards_success:
+                success_log(
+                    f"Account {account_number}: Successfully claimed starter cards"
+                )
+
+                if self.config.get("tournaments", {}).get(
+                    "enabled", False
+                ):
+                    wait_time = self.config.get(
+                        "starter_cards", {}
+                    ).get("wait_time_after_claim", 10)
+                    info_log(
+                        f"Waiting {wait_time} seconds for transaction confirmation before tournament registration..."
+                    )
+                    sleep(wait_time)
+
+                    account_info = api.info(
+                        token, wallet_address, account_number
+                    )
+                    if (
+                        isinstance(account_info, str)
+                        and "429" in account_info
+                    ):
+                        info_log(
+                            f"Rate limit on info check after claiming cards, continuing..."
+                        )
+                    else:
+                        success_log(
+                            f"Account {account_number}: Updated info after claiming cards"
+                        )
+            else:
+                info_log(
+                    f"Claiming starter cards skipped or failed for account {account_number}"
+                )
+
+        return True
+
+    def _step_fragment_packs(
+        self, api, token, account_number, private_key, wallet_address
+    ):
+        try:
+            pack_type = self.config.get("fragment_packs", {}).get(
+                "pack_type", "violet"
+            )
+            pack_id = (
+                self.config.get("fragment_packs", {})
+                .get("pack_types", {})
+                .get(pack_type, {})
+                .get("id")
+            )
+
+            if not pack_id:
+                info_log(
+                    f"Invalid pack type in configuration: {pack_type}"
+                )
+            else:
+                if self.config.get("fragment_packs", {}).get(
+                    "use_all_fragments", False
+                ):
+                    claim_immediately = self.config.get(
+                        "fragment_packs", {}
+                    ).get("claim_immediately", True)
+                    pk = private_key if claim_immediately else None
+                    num_purchased = api.buy_packs_with_all_fragments(
+                        token,
+                        wallet_address,
+                        account_number,
+                        pack_id,
+                        pk,
+                    )
+
+                    if num_purchased > 0:
+                        success_log(
+                            f"Account {account_number}: Successfully purchased {num_purchased} fragment packs"
+                        )
+                else:
+                    specific_quantity = self.config.get(
+                        "fragment_packs", {}
+                    ).get("specific_quantity", 0)
+                    if specific_quantity > 0:
+                        purchase_success = api.buy_fragment_pack(
+                            token,
+                            wallet_address,
+                            account_number,
+                            pack_id,
+                            specific_quantity,
+                        )
+
+                        if purchase_success:
+                            success_log(
+                                f"Account {account_number}: Successfully purchased {specific_quantity} fragment packs"
+                            )
+
+                            if self.config.get(
+                                "fragment_packs", {}
+                            ).get("claim_immediately", True):
+                                time.sleep(5)
+                                api.process_fragment_packs(
+                                    token,
+                                    wallet_address,
+                                    account_number,
+                                    private_key,
+                                )
+                        else:
+                            info_log(
+                                f"Account {account_number}: Failed to purchase fragment packs"
+                            )
+        except Exception as e:
+            error_log(
+                f"Error processing fragment packs purchase for account {account_number}: {str(e)}"
+            )
+
+        return True
+
+    def _step_onboarding(
+        self, api, token, account_number, private_key, wallet_address
+    ):
+        onboarding_ids = self.config["onboarding_quest"].get("ids", [])
+
+        if "id" in self.config["onboarding_quest"]:
+            single_id = self.config["onboarding_quest"]["id"]
+            if single_id and single_id not in onboarding_ids:
+                onboarding_ids.append(single_id)
+
+        if not onboarding_ids:
+            info_log(
+                f"No onboarding quest IDs configured for account {account_number}"
+            )
+        else:
+            for onboarding_id in onboarding_ids:
+                quest_key = f"{account_number}:{onboarding_id}"
+                if quest_key in self.completed_quests:
+                    continue
+
+                onboarding_success = api.onboarding_quest_claim(
+                    token, wallet_address, account_number, onboarding_id
+                )
+                if onboarding_success:
+                    success_log(
+                        f"Successfully completed onboarding quest {onboarding_id} for account {account_number}"
+                    )
+                    self.completed_quests.add(quest_key)
+                else:
+                    info_log(
+                        f"Onboarding quest {onboarding_id} skipped or failed for account {account_number}"
+                    )
+
+        return True
+
+    def _step_daily(
+        self, api, token, account_number, private_key, wallet_address
+    ):
+        daily_success = api.daily_claim(
+            token, wallet_address, account_number
+        )
+        if isinstance(daily_success, str) and "429" in daily_success:
+            info_log(
+                f"Rate limit on daily claim for account {account_number}, retrying..."
+            )
+            return STEP_RETRY
+        if not daily_success:
+            return False
+        else:
+            success_log(
+                f"Account {account_number}: Successfully claimed daily reward"
+            )
+
+        return True
+
+    def _step_fragments(
+        self, api, token, account_number, private_key, wallet_address
+    ):
+        fragment_id = self.config["fragments"]["id"]
+        fragment_success = api.fragments_claim(
+            token, wallet_address, account_number, fragment_id
+        )
+        if not fragment_success:
+            return False
+
+        return True
+
+    def _step_fragment_roulette(
+        self, api, token, account_number, private_key, wallet_address
+    ):
+        claim_packs = self.config.get("other_rewards", {}).get(
+            "claim_packs", False
+        )
+        fragment_roulette_result = api.fragment_roulette(
+            token,
+            wallet_address,
+            account_number,
+            private_key if claim_packs else None,
+        )
+        if (
+            isinstance(fragment_roulette_result, str)
+            and "429" in fragment_roulette_result
+        ):
+            info_log(
+                f"Rate limit on fragment roulette for account {account_number}, retrying..."
+            )
+            return STEP_RETRY
+        if fragment_roulette_result and fragment_roulette_result.get(
+            "success", False
+        ):
+            prize = fragment_roulette_result.get("selectedPrize", {})
+            prize_type = prize.get("type", "Unknown")
+            prize_amount = prize.get("text", "Unknown")
+            success_log(
+                f"Account {account_number}: Fragment roulette success - {prize_type}({prize_amount})"
+            )
+        else:
+            info_log(
+                f"Account {account_number}: Fragment roulette skipped (not enough fragments or already claimed)"
+            )
+
+        return True
+
+    def _step_quests(
+        self, api, token, account_number, private_key, wallet_address
+    ):
+        quests_completed = True
+        for quest_id in self.config["quest"]["ids"]:
+            quest_key = f"{account_number}:{quest_id}"
+            if quest_key in self.completed_quests:
+                continue
+
+            quest_success = api.quest_claim(
+                token, wallet_address, account_number, quest_id
+            )
+            if quest_success == "429":
+                info_log(
+                    f"Rate limit on quest claim for account {account_number}, retrying..."
+                )
+                sleep(2)
+                continue
+            if quest_success:
+                self.completed_quests.add(quest_key)
+            else:
+                quests_completed = False
+
+        return quests_completed
+
+    def _step_tournament_rewards(
+        self, api, token, account_number, private_key, wallet_address
+    ):
+        tournament_rewards = api.check_tournament_rewards(
+            token, wallet_address, account_number
+        )
+        if (
+            isinstance(tournament_rewards, str)
+            and "429" in tournament_rewards
+        ):
+            info_log(
+                f"Rate limit on checking tournament rewards for account {account_number}, retrying..."
+            )
+            return STEP_RETRY
+
+        if (
+            tournament_rewards
+            and "tournamentRewards" in tournament_rewards
+            and tournament_rewards["tournamentRewards"]
+        ):
+            success_log(
+                f"Account {account_number}: Found available tournament rewards"
+            )
+
+            tournaments = api.get_tournaments(token, wallet_address, account_number)
+
+            if tournaments:
+                tournament_ids = [t.get("id") for t in tournaments]
+
+                if tournament_ids:
+                    sleep(1)
+
+                    claim_result = api.claim_tournament_rewards(
+                        token,
+                        wallet_address,
+                        account_number,
+                        tournament_ids,
+                    )
+
+                    if (
+                        isinstance(claim_result, str)
+                        and "429" in claim_result
+                    ):
+                        info_log(
+                            f"Rate limit on claiming tournament rewards for account {account_number}, retrying..."
+                        )
+                        return STEP_RETRY
+
+                    if claim_result:
+                        if isinstance(claim_result, dict):
+                            if "claimed" in claim_result:
+                                rewards = claim_result.get(
+                                    "claimed", {}
+                                )
+                                rewards_str = ", ".join(
+                                    [
+                                        f"{k}: {v}"
+                                        for k, v in rewards.items()
+                                    ]
+                                )
+                                success_log(
+                                    f"Account {account_number}: Successfully claimed tournament rewards: {rewards_str}"
+                                )
+                            elif (
+                                "status" in claim_result
+                                and claim_result["status"]
+                                == "already_claimed"
+                            ):
+                                success_log(
+                                    f"Account {account_number}: Tournament rewards processing completed"
+                                )
+                        else:
+                            info_log(
+                                f"Unexpected result type from claim_tournament_rewards for account {account_number}"
+                            )
+                    else:
+                        info_log(
+                            f"Failed to claim tournament rewards for account {account_number}"
+                        )
+                else:
+                    info_log(
+                        f"No tournament IDs found for account {account_number}"
+                    )
+            else:
+                info_log(
+                    f"Tournament data unavailable for account {account_number}"
+                )
+        else:
+            info_log(
+                f"No available tournament rewards found for account {account_number}"
+            )
+
+        return True
+
+    def _step_pack_claims(
+        self, api, token, account_number, private_key, wallet_address
+    ):
+        pack_processing_result = api.process_fragment_packs(
+            token, wallet_address, account_number, private_key
+        )
+        if (
+            isinstance(pack_processing_result, str)
+            and "429" in pack_processing_result
+        ):
+            info_log(
+                f"Rate limit on pack processing for account {account_number}, retrying..."
+            )
+            return STEP_RETRY
+
+        if pack_processing_result:
+            success_log(
+                f"Account {account_number}: Successfully processed fragment packs"
+            )
+        else:
+            info_log(
+                f"Account {account_number}: No fragment packs to process or processing failed"
+            )
+
+        return True
+
+    def _step_other_rewards(
+        self, api, token, account_number, private_key, wallet_address
+    ):
+        other_rewards_result = api.check_other_rewards(
+            token, wallet_address, account_number
+        )
+        if (
+            isinstance(other_rewards_result, str)
+            and "429" in other_rewards_result
+        ):
+            info_log(
+                f"Rate limit on checking other rewards for account {account_number}, retrying..."
+            )
+            return STEP_RETRY
+
+        if other_rewards_result:
+            success_log(
+                f"Account {account_number}: Successfully processed other rewards"
+            )
+
+        return True
+
+    def _step_tournaments(
+        self, api, token, account_number, private_key, wallet_address
+    ):
+        from src.tournament_manager import TournamentManager
+
+        tournament_manager = TournamentManager(api, self.config)
+
+        tournament_ids = {}
+        for t_type, t_config in self.config["tournaments"][
+            "types"
+        ].items():
+            if t_config.get("id"):
+                tournament_ids[t_type] = t_config["id"]
+
+        if tournament_ids:
+            info_log(
+                f"Registering account {account_number} in tournaments: {', '.join(tournament_ids.keys())}"
+            )
+            tournament_results = (
+                tournament_manager.register_in_tournaments(
+                    token,
+                    wallet_address,
+                    account_number,
+                    tournament_ids,
+                )
+            )
+
+            success_tournaments = [
+                t_type
+                for t_type, result in tournament_results.items()
+                if result
+            ]
+            if success_tournaments:
+                success_log(
+                    f"Account {account_number}: Successfully registered in {', '.join(success_tournaments)} tournaments"
+                )
+
+            failed_tournaments = [
+                t_type
+                for t_type, result in tournament_results.items()
+                if not result
+            ]
+            if failed_tournaments:
+                info_log(
+                    f"Account {account_number}: Failed to register in {', '.join(failed_tournaments)} tournaments"
+                )
+
+        return True
+
+    def _step_burn_cards(
+        self, api, token, account_number, private_key, wallet_address
+    ):
+        try:
+            # Fetch all player cards
+            all_cards = api.get_player_cards_for_burn(
+                token, wallet_address, account_number
+            )
+                            
+            if all_cards:
+                info_log(f"Found {len(all_cards)} cards for account {account_number}")
+                                
+                # Select cards to burn based on configuration
+                cards_to_burn = api.select_cards_to_burn(
+                    all_cards,
+                    self.config["burn_cards"]["min_cards_to_burn"],
+                    self.config["burn_cards"]["max_cards_to_burn"],
+                    self.config["burn_cards"]["min_stars_threshold"],
+                    self.config["burn_cards"]["max_stars_threshold"],
+                    self.config["burn_cards"]["burn_duplicates"]
+                )
+                                
+                if cards_to_burn:
+                    # Log cards to be burned
+                    burn_info = []
+                    for card in cards_to_burn:
+                        burn_info.append(f"{card['name']} ({card['stars']}* ID:{card['token_id']})")
+                    info_log(f"Account {account_number}: Burning {len(cards_to_burn)} cards: {', '.join(burn_info[:5])}{'...' if len(burn_info) > 5 else ''}")
+                                    
+                    # Extract token IDs
+                    token_ids_to_burn = [card["token_id"] for card in cards_to_burn]
+                                    
+                    # Execute burn transaction
+                    burn_result = api.burn_cards(
+                        token, wallet_address, account_number, private_key, token_ids_to_burn
+                    )
+                                    
+                    if burn_result:
+                        success_log(f"Account {account_number}: Successfully burned {len(cards_to_burn)} cards")
+                    else:
+                        error_log(f"Account {account_number}: Failed to burn cards")
+                else:
+                    info_log(f"Account {account_number}: No cards selected for burning based on criteria")
+            else:
+                info_log(f"Account {account_number}: No cards available for burning")
+                                
+        except Exception as e:
+            error_log(f"Error in burn cards process for account {account_number}: {str(e)}")
+
+        return True
+
+    def _step_info(
+        self, api, token, account_number, private_key, wallet_address
+    ):
+        info_success = api.info(token, wallet_address, account_number)
+        if isinstance(info_success, str) and "429" in info_success:
+            info_log(
+                f"Rate limit on info check for account {account_number}, retrying..."
+            )
+            return STEP_RETRY
+        if not info_success:
+            return False
+
+        return True
+
+    def retry_failed_accounts(self):
+        if not self.config["app"].get("retry_failed_accounts", True):
+            info_log("Retry failed accounts feature is disabled in config. Skipping.")
+            return
+
+        while self.retry_manager.should_continue_retrying():
+            retry_accounts = self.retry_manager.get_retry_accounts()
+            if retry_accounts:
+                info_log(
+                    f"Retrying {len(retry_accounts)} accounts from current session. Success rate: "
+                    f"{self.retry_manager.get_success_rate()*100:.2f}%"
+                )
+
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.config["app"]["threads"]
+                ) as executor:
+                    futures = []
+                    for account_number, private_key, wallet_address in retry_accounts:
+                        sleep(self.retry_delay)
+                        future = executor.submit(
+                            self.process_account_with_retry,
+                            account_number,
+                            private_key,
+                            wallet_address,
+                            len(retry_accounts),
+                        )
+                        futures.append(future)
+                    concurrent.futures.wait(futures)
+
+        try:
+            if os.path.exists(self.config["app"]["failure_file"]):
+                with open(self.config["app"]["failure_file"], "r") as f:
+                    failed_accounts = []
+                    seen_accounts = set()
+
+                    for line in f:
+                        if line.strip():
+                            try:
+                                private_key, wallet_address = line.strip().split(":")
+                                if wallet_address not in seen_accounts:
+                                    failed_accounts.append(
+                                        (private_key, wallet_address)
+                                    )
+                                    seen_accounts.add(wallet_address)
+                            except ValueError:
+                                error_log(
+                                    f"Invalid line format in failure_accounts.txt: {line.strip()}"
+                                )
+                                continue
+                if failed_accounts:
+                    info_log(
+                        f"Processing {len(failed_accounts)} unique accounts from failure_accounts.txt..."
+                    )
+
+                    with concurrent.futures.ThreadPoolExecutor(
+                        max_workers=self.config["app"]["threads"]
+                    ) as executor:
+                        futures = []
+                        for idx, (private_key, wallet_address) in enumerate(
+                            failed_accounts, 1
+                        ):
+                            sleep(self.retry_delay)
+                            future = executor.submit(
+                                self.process_account_with_retry,
+                                idx,
+                                private_key,
+                                wallet_address,
+                                len(failed_accounts),
+                            )
+                            futures.append(future)
+                        concurrent.futures.wait(futures)
+
+                    success_rate = self.retry_manager.get_success_rate() * 100
+                    info_log(
+                        f"Final success rate for failure_accounts.txt: {success_rate:.2f}%"
+                    )
+                else:
+                    info_log("No valid accounts found in failure_accounts.txt")
+
+                open(self.config["app"]["failure_file"], "w").close()
+
+        except Exception as e:
+            error_log(f"Error processing failure_accounts.txt: {str(e)}")
+
+    def get_stats(self):
+        return {
+            "success": len(self.retry_manager.success_accounts),
+            "failed": len(self.retry_manager.failed_accounts),
+            "completed_quests": len(self.completed_quests),
+        }
+
+    def close(self):
+        if self.token_refresher:
+            self.token_refresher.stop()
+        for session in self.session_pool.drain():
+            session.close()
+        web3_registry.close()
+        self.signing_service.close()
+        self.step_ledger.close()
+        self.account_storage.close()
+        self.result_store.close()
+
+    def _write_success(self, private_key, wallet_address):
+        with self.lock:
+            try:
+                with open(self.config["app"]["success_file"], "a") as f:
+                    f.write(f"{private_key}:{wallet_address}\n")
+                info_log(f"Successfully wrote {wallet_address} to success file")
+            except Exception as e:
+                error_log(f"Error writing to success file: {str(e)}")
+
+    def _write_failure(self, private_key, wallet_address):
+        with self.lock:
+            try:
+                existing_entries = set()
+                if os.path.exists(self.config["app"]["failure_file"]):
+                    with open(self.config["app"]["failure_file"], "r") as f:
+                        existing_entries = {line.strip() for line in f}
+
+                new_entry = f"{private_key}:{wallet_address}"
+
+                if new_entry not in existing_entries:
+                    with open(self.config["app"]["failure_file"], "a") as f:
+                        f.write(f"{new_entry}\n")
+                    info_log(f"Wrote {wallet_address} to failure file")
+            except Exception as e:
+                error_log(f"Error writing to failure file: {str(e)}")
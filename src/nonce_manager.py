@@ -0,0 +1,31 @@
+import threading
+from collections import defaultdict
+from typing import Dict
+
+
+class NonceManager:
+    def __init__(self, web3):
+        self.web3 = web3
+        self.nonces: Dict[str, int] = {}
+        self.address_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+        self.lock = threading.Lock()
+
+    def _get_lock(self, address: str) -> threading.Lock:
+        with self.lock:
+            return self.address_locks[address]
+
+    def allocate(self, address: str) -> int:
+        # The chain is asked once per wallet; later transactions take the next
+        # nonce locally so they can be sent without waiting for confirmations
+        address = self.web3.to_checksum_address(address)
+        with self._get_lock(address):
+            nonce = self.nonces.get(address)
+            if nonce is None:
+                nonce = self.web3.eth.get_transaction_count(address, "pending")
+            self.nonces[address] = nonce + 1
+            return nonce
+
+    def resync(self, address: str):
+        address = self.web3.to_checksum_address(address)
+        with self._get_lock(address):
+            self.nonces.pop(address, None)
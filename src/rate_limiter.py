@@ -0,0 +1,106 @@
+import asyncio
+import threading
+import time
+from time import sleep
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        # Takes a token immediately (the balance may go negative) and returns
+        # how long the caller has to wait for it. The lock only covers the
+        # arithmetic, never the wait, so callers queue up without blocking
+        # each other.
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated_at) * self.rate
+            )
+            self.updated_at = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+class RateLimiter:
+    def __init__(self, host_limits: Dict[str, Dict], default_limit: Optional[Dict] = None):
+        self.host_limits = host_limits
+        self.default_limit = default_limit
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional["RateLimiter"]:
+        limits_config = config.get("rate_limits", {})
+        if not limits_config.get("enabled", False):
+            return None
+
+        host_limits = {}
+        for host, limit in limits_config.get("hosts", {}).items():
+            if host == "rpc":
+                host = urlparse(config.get("monad_rpc", {}).get("url", "")).hostname
+                if not host:
+                    continue
+            host_limits[host.lower()] = limit
+
+        return cls(host_limits, limits_config.get("default"))
+
+    def _get_bucket(self, host: str) -> Optional[TokenBucket]:
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                limit = self.host_limits.get(host, self.default_limit)
+                if not limit or limit.get("rate", 0) <= 0:
+                    return None
+                bucket = TokenBucket(
+                    float(limit["rate"]), float(limit.get("burst", limit["rate"]))
+                )
+                self.buckets[host] = bucket
+            return bucket
+
+    def get_wait_time(self, url: str) -> float:
+        host = (urlparse(url).hostname or url).lower()
+        bucket = self._get_bucket(host)
+        if bucket is None:
+            return 0.0
+        return bucket.reserve()
+
+    def acquire(self, url: str):
+        wait_time = self.get_wait_time(url)
+        if wait_time > 0:
+            sleep(wait_time)
+
+    async def acquire_async(self, url: str):
+        wait_time = self.get_wait_time(url)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+
+class RateLimitedSession:
+    def __init__(self, session, rate_limiter: RateLimiter):
+        self._session = session
+        self._rate_limiter = rate_limiter
+
+    def request(self, method, url, *args, **kwargs):
+        self._rate_limiter.acquire(url)
+        return self._session.request(method, url, *args, **kwargs)
+
+    def get(self, url, *args, **kwargs):
+        self._rate_limiter.acquire(url)
+        return self._session.get(url, *args, **kwargs)
+
+    def post(self, url, *args, **kwargs):
+        self._rate_limiter.acquire(url)
+        return self._session.post(url, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
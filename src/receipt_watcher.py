@@ -0,0 +1,161 @@
+import concurrent.futures
+import threading
+from typing import Dict, List, Optional
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
+from web3.exceptions import TransactionNotFound
+from .utils import debug_log
+
+RECEIPT_POLL_INTERVAL = 1
+RECEIPT_BATCH_SIZE = 100
+
+
+def _normalize_tx_hash(tx_hash) -> str:
+    if isinstance(tx_hash, (bytes, bytearray)):
+        tx_hash = tx_hash.hex()
+    tx_hash = tx_hash.lower()
+    return tx_hash if tx_hash.startswith("0x") else "0x" + tx_hash
+
+
+class ReceiptWatcher:
+    def __init__(
+        self,
+        web3,
+        poll_interval: float = RECEIPT_POLL_INTERVAL,
+        batch_size: int = RECEIPT_BATCH_SIZE,
+    ):
+        self.web3 = web3
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.pending: Dict[str, List[concurrent.futures.Future]] = {}
+        self.unchecked = set()
+        self.last_block = None
+        self.condition = threading.Condition()
+        self.closed = False
+        self.thread = None
+
+    def watch(self, tx_hash) -> concurrent.futures.Future:
+        tx_hash = _normalize_tx_hash(tx_hash)
+        future = concurrent.futures.Future()
+        with self.condition:
+            if self.closed:
+                raise RuntimeError("Receipt watcher is stopped")
+            self.pending.setdefault(tx_hash, []).append(future)
+            self.unchecked.add(tx_hash)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, daemon=True)
+                self.thread.start()
+            self.condition.notify()
+        return future
+
+    def wait_for_receipt(self, tx_hash, timeout: float) -> Optional[AttributeDict]:
+        return self.wait_for_receipts([tx_hash], timeout)[0]
+
+    def wait_for_receipts(
+        self, tx_hashes: List, timeout: float
+    ) -> List[Optional[AttributeDict]]:
+        futures = [self.watch(tx_hash) for tx_hash in tx_hashes]
+        concurrent.futures.wait(futures, timeout)
+
+        receipts = []
+        for tx_hash, future in zip(tx_hashes, futures):
+            if future.done() and not future.cancelled():
+                receipts.append(future.result())
+            else:
+                self._forget(_normalize_tx_hash(tx_hash), future)
+                receipts.append(None)
+        return receipts
+
+    def _forget(self, tx_hash: str, future: concurrent.futures.Future):
+        with self.condition:
+            futures = self.pending.get(tx_hash, [])
+            if future in futures:
+                futures.remove(future)
+            if not futures:
+                self.pending.pop(tx_hash, None)
+                self.unchecked.discard(tx_hash)
+
+    def _run(self):
+        # Receipts are only requested when a new block arrives (or right after
+        # a hash is added), so the request count follows the block rate and
+        # not the number of accounts waiting on a transaction
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+                if self.closed:
+                    return
+
+            try:
+                block_number = self.web3.eth.block_number
+            except Exception as e:
+                debug_log(f"Receipt watcher failed to get block number: {str(e)}")
+                block_number = self.last_block
+
+            with self.condition:
+                if block_number != self.last_block:
+                    self.last_block = block_number
+                    tx_hashes = list(self.pending)
+                else:
+                    tx_hashes = list(self.unchecked)
+                self.unchecked.clear()
+
+            if tx_hashes:
+                self._check_receipts(tx_hashes)
+
+            with self.condition:
+                if not self.closed and not self.unchecked:
+                    self.condition.wait(self.poll_interval)
+
+    def _check_receipts(self, tx_hashes: List[str]):
+        for start in range(0, len(tx_hashes), self.batch_size):
+            batch = tx_hashes[start : start + self.batch_size]
+            try:
+                receipts = self._get_receipts(batch)
+            except Exception as e:
+                debug_log(f"Receipt watcher failed to get receipts: {str(e)}")
+                continue
+
+            for tx_hash, receipt in zip(batch, receipts):
+                if receipt is None:
+                    continue
+                with self.condition:
+                    futures = self.pending.pop(tx_hash, [])
+                    self.unchecked.discard(tx_hash)
+                for future in futures:
+                    if not future.done():
+                        future.set_result(receipt)
+
+    def _get_receipts(self, tx_hashes: List[str]) -> List[Optional[AttributeDict]]:
+        make_batch_request = getattr(self.web3.provider, "make_batch_request", None)
+        if make_batch_request is None:
+            receipts = []
+            for tx_hash in tx_hashes:
+                try:
+                    receipts.append(self.web3.eth.get_transaction_receipt(tx_hash))
+                except TransactionNotFound:
+                    receipts.append(None)
+            return receipts
+
+        responses = make_batch_request(
+            [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in tx_hashes]
+        )
+        receipts = []
+        for response in responses:
+            result = response.get("result") if response else None
+            receipts.append(
+                AttributeDict.recursive(receipt_formatter(result)) if result else None
+            )
+        return receipts
+
+    def stop(self):
+        with self.condition:
+            self.closed = True
+            pending = [future for futures in self.pending.values() for future in futures]
+            self.pending.clear()
+            self.unchecked.clear()
+            self.condition.notify_all()
+        for future in pending:
+            future.cancel()
+        if self.thread:
+            self.thread.join()
@@ -0,0 +1,168 @@
+import atexit
+import os
+import threading
+from typing import Dict, List, Optional
+from .utils import error_log, write_file_atomic
+
+
+class ResultStore:
+    def __init__(self, result_file: str, flush_interval: float = 2):
+        self.result_file = result_file
+        self.flush_interval = flush_interval
+        self.lock = threading.RLock()
+        self.records: Dict[str, List[str]] = {}
+        self._dirty = False
+        self._flush_lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+        self._load()
+
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+        atexit.register(self.close)
+
+    def _load(self):
+        if not os.path.exists(self.result_file):
+            return
+
+        try:
+            with open(self.result_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    parts = line.strip().split(":")
+                    if not parts[0]:
+                        continue
+                    self.records[parts[0]] = parts[1:]
+        except Exception as e:
+            error_log(f"Error loading result file {self.result_file}: {str(e)}")
+
+    def _writer_loop(self):
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        with self._flush_lock:
+            with self.lock:
+                if not self._dirty:
+                    return
+                lines = [
+                    ":".join([address] + parts) + "\n"
+                    for address, parts in self.records.items()
+                ]
+                self._dirty = False
+
+            try:
+                write_file_atomic(self.result_file, "".join(lines))
+            except Exception as e:
+                with self.lock:
+                    self._dirty = True
+                error_log(f"Error writing result file {self.result_file}: {str(e)}")
+
+    def close(self):
+        self._stop_event.set()
+        if self._writer_thread is not threading.current_thread():
+            self._writer_thread.join(timeout=self.flush_interval + 5)
+        self.flush()
+
+    def has_record(self, address: str) -> bool:
+        with self.lock:
+            return address in self.records
+
+    def get_record(self, address: str) -> Optional[List[str]]:
+        with self.lock:
+            parts = self.records.get(address)
+            return list(parts) if parts is not None else None
+
+    def set_record(self, address: str, parts: List[str]):
+        with self.lock:
+            self.records[address] = list(parts)
+            self._dirty = True
+
+    def get_field(self, address: str, key: str) -> Optional[str]:
+        prefix = f"{key}="
+        with self.lock:
+            for part in self.records.get(address, []):
+                if part.startswith(prefix):
+                    return part[len(prefix):]
+        return None
+
+    def get_int_field(self, address: str, key: str) -> Optional[int]:
+        value = self.get_field(address, key)
+        if value is None:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            return None
+
+    def set_field(self, address: str, key: str, value, append_missing: bool = True) -> bool:
+        prefix = f"{key}="
+        with self.lock:
+            parts = self.records.get(address)
+            if parts is None:
+                return False
+
+            for i, part in enumerate(parts):
+                if part.startswith(prefix):
+                    parts[i] = f"{prefix}{value}"
+                    self._dirty = True
+                    return True
+
+            if not append_missing:
+                return False
+
+            parts.append(f"{prefix}{value}")
+            self._dirty = True
+            return True
+
+    def increment_field(self, address: str, key: str, amount: int) -> bool:
+        prefix = f"{key}="
+        with self.lock:
+            parts = self.records.get(address)
+            if parts is None:
+                return False
+
+            updated = False
+            for i, part in enumerate(parts):
+                if part.startswith(prefix):
+                    try:
+                        current_value = int(part[len(prefix):])
+                    except ValueError:
+                        continue
+                    parts[i] = f"{prefix}{current_value + amount}"
+                    updated = True
+
+            if updated:
+                self._dirty = True
+            return updated
+
+    def append_to_field(self, address: str, key: str, value, separator: str = ",") -> bool:
+        prefix = f"{key}="
+        with self.lock:
+            parts = self.records.get(address)
+            if parts is None:
+                return False
+
+            for i, part in enumerate(parts):
+                if part.startswith(prefix):
+                    parts[i] = f"{part}{separator}{value}"
+                    break
+            else:
+                parts.append(f"{prefix}{value}")
+
+            self._dirty = True
+            return True
+
+    def remove_field(self, address: str, key: str) -> bool:
+        prefix = f"{key}="
+        with self.lock:
+            parts = self.records.get(address)
+            if parts is None:
+                return False
+
+            filtered_parts = [part for part in parts if not part.startswith(prefix)]
+            if len(filtered_parts) == len(parts):
+                return False
+
+            self.records[address] = filtered_parts
+            self._dirty = True
+            return True
@@ -0,0 +1,80 @@
+import concurrent.futures
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable
+
+
+class StartScheduler:
+    def __init__(self, executor: concurrent.futures.Executor):
+        self.executor = executor
+        self._heap = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def schedule_at(self, due_time: float, fn: Callable, *args) -> concurrent.futures.Future:
+        future = concurrent.futures.Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Cannot schedule new tasks after shutdown")
+            heapq.heappush(self._heap, (due_time, next(self._counter), future, fn, args))
+            self._condition.notify()
+        return future
+
+    def schedule(self, delay: float, fn: Callable, *args) -> concurrent.futures.Future:
+        return self.schedule_at(time.monotonic() + delay, fn, *args)
+
+    def pending_count(self) -> int:
+        with self._condition:
+            return len(self._heap)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed and not self._heap:
+                        return
+                    if self._heap:
+                        wait_time = self._heap[0][0] - time.monotonic()
+                        if wait_time <= 0:
+                            break
+                        self._condition.wait(wait_time)
+                    else:
+                        self._condition.wait()
+                _, _, future, fn, args = heapq.heappop(self._heap)
+
+            self._submit(future, fn, args)
+
+    def _submit(self, future: concurrent.futures.Future, fn: Callable, args):
+        if not future.set_running_or_notify_cancel():
+            return
+
+        try:
+            inner_future = self.executor.submit(fn, *args)
+        except Exception as e:
+            future.set_exception(e)
+            return
+
+        def copy_result(source):
+            if source.cancelled():
+                future.set_exception(concurrent.futures.CancelledError())
+            elif source.exception() is not None:
+                future.set_exception(source.exception())
+            else:
+                future.set_result(source.result())
+
+        inner_future.add_done_callback(copy_result)
+
+    def shutdown(self, cancel_pending: bool = False):
+        with self._condition:
+            self._closed = True
+            if cancel_pending:
+                for _, _, future, _, _ in self._heap:
+                    future.cancel()
+                self._heap = []
+            self._condition.notify()
+        self._thread.join()
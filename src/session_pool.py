@@ -0,0 +1,63 @@
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+
+class SessionPool:
+    def __init__(self, factory: Callable, max_idle_per_proxy: int = 4):
+        self.factory = factory
+        self.max_idle_per_proxy = max(0, max_idle_per_proxy)
+        self.idle: Dict[Optional[str], List] = defaultdict(list)
+        self.proxies: Dict[int, Optional[str]] = {}
+        self.owners: Dict[int, int] = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, proxy: Optional[str]):
+        # Sessions are keyed by proxy so a reused session keeps talking to the
+        # same egress and its open connections stay valid. curl_cffi keeps one
+        # curl handle per thread, so a session last used by the calling thread
+        # is the one that still holds warm connections.
+        thread_id = threading.get_ident()
+        with self.lock:
+            idle_sessions = self.idle[proxy]
+            for index in range(len(idle_sessions) - 1, -1, -1):
+                if self.owners.get(id(idle_sessions[index])) == thread_id:
+                    session = idle_sessions.pop(index)
+                    break
+            else:
+                session = idle_sessions.pop() if idle_sessions else None
+
+        if session is None:
+            session = self.factory()
+
+        with self.lock:
+            self.proxies[id(session)] = proxy
+            self.owners[id(session)] = thread_id
+        return session
+
+    def release(self, session, discard: bool = False):
+        # Returns the session when the pool does not keep it, so the caller can
+        # close it the way its session type requires
+        session.cookies.clear()
+        session.headers.clear()
+
+        with self.lock:
+            proxy = self.proxies.pop(id(session), None)
+            idle_sessions = self.idle[proxy]
+            if discard or len(idle_sessions) >= self.max_idle_per_proxy:
+                self.owners.pop(id(session), None)
+                return session
+            idle_sessions.append(session)
+        return None
+
+    def drain(self) -> List:
+        with self.lock:
+            sessions = [
+                session
+                for idle_sessions in self.idle.values()
+                for session in idle_sessions
+            ]
+            self.idle.clear()
+            self.proxies.clear()
+            self.owners.clear()
+        return sessions
@@ -0,0 +1,235 @@
+import concurrent.futures
+import copy
+import json
+import math
+import os
+from typing import Dict, List, Optional
+from .account_storage import create_account_storage
+from .utils import error_log, info_log, read_user_agents, write_file_atomic
+
+
+def _shard_path(file_path: str, shard_index: int) -> str:
+    root, ext = os.path.splitext(file_path)
+    return f"{root}.shard{shard_index}{ext}"
+
+
+def _read_result_lines(file_path: str) -> Dict[str, str]:
+    lines = {}
+    if not os.path.exists(file_path):
+        return lines
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            address = line.split(":", 1)[0].strip()
+            if address:
+                lines[address] = line.rstrip("\n")
+    return lines
+
+
+def _read_json(file_path: str) -> Dict:
+    if not os.path.exists(file_path):
+        return {}
+
+    try:
+        with open(file_path, "r") as f:
+            return json.load(f)
+    except (json.JSONDecodeError, OSError) as e:
+        error_log(f"Error reading {file_path}: {str(e)}")
+        return {}
+
+
+def _get_rate_limits(config: Dict) -> List[Dict]:
+    limits_config = config.get("rate_limits", {})
+    if not limits_config.get("enabled", False):
+        return []
+    return [
+        limit
+        for limit in [limits_config.get("default")]
+        + list(limits_config.get("hosts", {}).values())
+        if limit
+    ]
+
+
+def _get_max_processes(config: Dict) -> Optional[int]:
+    # Each shard needs a burst of at least one request, so the smallest
+    # configured burst caps how many ways the budget can be split
+    bursts = [
+        limit.get("burst", limit.get("rate", 0)) for limit in _get_rate_limits(config)
+    ]
+    if not bursts:
+        return None
+    return max(1, math.floor(min(bursts)))
+
+
+def _build_shard_config(config: Dict, shard_index: int, processes: int) -> Dict:
+    shard_config = copy.deepcopy(config)
+    app_config = shard_config["app"]
+
+    app_config["result_file"] = _shard_path(config["app"]["result_file"], shard_index)
+    app_config["failure_file"] = _shard_path(config["app"]["failure_file"], shard_index)
+
+    if app_config.get("storage_backend", "json") != "sqlite":
+        app_config["storage_file"] = _shard_path(
+            app_config.get("storage_file", "data/accounts_data.json"), shard_index
+        )
+
+    # Every process keeps its own token buckets, so split the configured
+    # budget between them to keep the fleet-wide rate unchanged; run_sharded
+    # caps processes so every share of the burst is still a whole request
+    for limit in _get_rate_limits(shard_config):
+        limit["burst"] = limit.get("burst", limit.get("rate", 0)) / processes
+        limit["rate"] = limit.get("rate", 0) / processes
+
+    return shard_config
+
+
+def _prepare_shard_files(config: Dict, shard_config: Dict, addresses: set):
+    result_lines = _read_result_lines(config["app"]["result_file"])
+    write_file_atomic(
+        shard_config["app"]["result_file"],
+        "".join(
+            line + "\n"
+            for address, line in result_lines.items()
+            if address in addresses
+        ),
+    )
+
+    if os.path.exists(shard_config["app"]["failure_file"]):
+        os.remove(shard_config["app"]["failure_file"])
+
+    if config["app"].get("storage_backend", "json") != "sqlite":
+        storage_data = _read_json(
+            config["app"].get("storage_file", "data/accounts_data.json")
+        )
+        write_file_atomic(
+            shard_config["app"]["storage_file"],
+            json.dumps(
+                {
+                    address: account_data
+                    for address, account_data in storage_data.items()
+                    if address in addresses
+                },
+                indent=4,
+            ),
+        )
+
+
+def _merge_shard_files(config: Dict, shard_configs: List[Dict]):
+    result_file = config["app"]["result_file"]
+    result_lines = _read_result_lines(result_file)
+    for shard_config in shard_configs:
+        shard_result_file = shard_config["app"]["result_file"]
+        result_lines.update(_read_result_lines(shard_result_file))
+        if os.path.exists(shard_result_file):
+            os.remove(shard_result_file)
+    write_file_atomic(result_file, "".join(line + "\n" for line in result_lines.values()))
+
+    failure_file = config["app"]["failure_file"]
+    failure_entries = []
+    if os.path.exists(failure_file):
+        with open(failure_file, "r") as f:
+            failure_entries = [line.strip() for line in f if line.strip()]
+    for shard_config in shard_configs:
+        shard_failure_file = shard_config["app"]["failure_file"]
+        if not os.path.exists(shard_failure_file):
+            continue
+        with open(shard_failure_file, "r") as f:
+            for line in f:
+                if line.strip() and line.strip() not in failure_entries:
+                    failure_entries.append(line.strip())
+        os.remove(shard_failure_file)
+    write_file_atomic(failure_file, "".join(entry + "\n" for entry in failure_entries))
+
+    if config["app"].get("storage_backend", "json") != "sqlite":
+        storage_file = config["app"].get("storage_file", "data/accounts_data.json")
+        storage_data = _read_json(storage_file)
+        for shard_config in shard_configs:
+            shard_storage_file = shard_config["app"]["storage_file"]
+            storage_data.update(_read_json(shard_storage_file))
+            if os.path.exists(shard_storage_file):
+                os.remove(shard_storage_file)
+        write_file_atomic(storage_file, json.dumps(storage_data, indent=4))
+
+
+def _run_shard(shard_index, config, accounts, proxies_dict, all_proxies):
+    from .async_engine import AsyncEngine
+    from .main import FantasyProcessor
+
+    info_log(f"Shard {shard_index}: processing {len(accounts)} accounts")
+
+    processor = FantasyProcessor(
+        config=config,
+        proxies_dict=proxies_dict,
+        all_proxies=all_proxies,
+        user_agents_cycle=read_user_agents(),
+    )
+
+    try:
+        if config["app"].get("engine", "threads") == "async":
+            AsyncEngine(processor).run(accounts)
+        else:
+            processor.process_accounts(accounts)
+            processor.retry_failed_accounts()
+        return processor.get_stats()
+    finally:
+        processor.close()
+
+
+def run_sharded(config, accounts, proxies_dict, all_proxies, processes) -> Dict:
+    max_processes = _get_max_processes(config)
+    if max_processes is not None and processes > max_processes:
+        info_log(
+            f"Running {max_processes} processes instead of {processes}: "
+            f"the smallest rate limit burst cannot be split further"
+        )
+        processes = max_processes
+
+    shards = [accounts[i::processes] for i in range(processes)]
+    shards = [shard for shard in shards if shard]
+
+    if config["app"].get("storage_backend", "json") == "sqlite":
+        # create the schema and import legacy JSON once, before the
+        # processes start writing to the shared database
+        create_account_storage(config).close()
+
+    shard_configs = []
+    for shard_index, shard in enumerate(shards, 1):
+        shard_config = _build_shard_config(config, shard_index, len(shards))
+        _prepare_shard_files(
+            config,
+            shard_config,
+            {wallet_address for _, (_, wallet_address) in shard},
+        )
+        shard_configs.append(shard_config)
+
+    info_log(f"Splitting {len(accounts)} accounts across {len(shards)} processes")
+
+    stats = {"success": 0, "failed": 0, "completed_quests": 0}
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=len(shards)) as executor:
+            futures = {
+                executor.submit(
+                    _run_shard,
+                    shard_index,
+                    shard_config,
+                    shard,
+                    proxies_dict,
+                    all_proxies,
+                ): shard_index
+                for shard_index, (shard_config, shard) in enumerate(
+                    zip(shard_configs, shards), 1
+                )
+            }
+
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    shard_stats = future.result()
+                except Exception as e:
+                    error_log(f"Shard {futures[future]} crashed: {str(e)}")
+                    continue
+                for key in stats:
+                    stats[key] += shard_stats.get(key, 0)
+    finally:
+        _merge_shard_files(config, shard_configs)
+
+    return stats
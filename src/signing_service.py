@@ -0,0 +1,89 @@
+import concurrent.futures
+import concurrent.futures.process
+import multiprocessing
+import threading
+from typing import Dict, Optional
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from .utils import error_log, info_log
+
+_accounts: Dict[str, object] = {}
+
+
+def _get_account(private_key: str):
+    account = _accounts.get(private_key)
+    if account is None:
+        account = Account.from_key(private_key)
+        _accounts[private_key] = account
+    return account
+
+
+def _sign_message(private_key: str, message: str):
+    return _get_account(private_key).sign_message(
+        encode_defunct(message.encode("utf-8"))
+    )
+
+
+def _sign_transaction(private_key: str, transaction: Dict):
+    return _get_account(private_key).sign_transaction(transaction)
+
+
+class SigningService:
+    def __init__(self, processes: int = 0):
+        self.processes = max(0, processes)
+        self.executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self.addresses: Dict[str, str] = {}
+        self.lock = threading.Lock()
+
+    def _get_executor(self):
+        # Worker processes are spawned, not forked: by the time the first
+        # signature is needed the parent already runs many threads
+        with self.lock:
+            if self.executor is None and self.processes:
+                try:
+                    self.executor = concurrent.futures.ProcessPoolExecutor(
+                        max_workers=self.processes,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                    info_log(f"Started {self.processes} signing processes")
+                except Exception as e:
+                    error_log(f"Could not start signing processes: {str(e)}")
+                    self.processes = 0
+            return self.executor
+
+    def _run(self, func, *args):
+        executor = self._get_executor()
+        if executor is None:
+            return func(*args)
+        try:
+            return executor.submit(func, *args).result()
+        except concurrent.futures.process.BrokenProcessPool as e:
+            error_log(f"Signing processes stopped, signing in place: {str(e)}")
+            with self.lock:
+                self.processes = 0
+                if self.executor is executor:
+                    self.executor = None
+            executor.shutdown(wait=False)
+            return func(*args)
+
+    def get_address(self, private_key: str) -> str:
+        with self.lock:
+            address = self.addresses.get(private_key)
+        if address is None:
+            address = _get_account(private_key).address
+            with self.lock:
+                self.addresses[private_key] = address
+        return address
+
+    def sign_message(self, private_key: str, message: str):
+        return self._run(_sign_message, private_key, message)
+
+    def sign_transaction(self, private_key: str, transaction: Dict):
+        return self._run(_sign_transaction, private_key, dict(transaction))
+
+    def close(self):
+        with self.lock:
+            executor = self.executor
+            self.executor = None
+        if executor:
+            executor.shutdown()
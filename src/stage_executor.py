@@ -0,0 +1,91 @@
+import concurrent.futures
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from .utils import error_log
+
+
+class Stage:
+    def __init__(
+        self,
+        name: str,
+        func: Callable,
+        depends_on: Iterable[str] = (),
+        exclusive: bool = False,
+    ):
+        self.name = name
+        self.func = func
+        self.depends_on = list(depends_on)
+        self.exclusive = exclusive
+
+
+class StageExecutor:
+    def __init__(self, max_workers: int = 3, retry_result=None):
+        self.max_workers = max(1, max_workers)
+        self.retry_result = retry_result
+
+    def run(
+        self,
+        stages: List[Stage],
+        completed: Set[str],
+        on_stage_done: Optional[Callable[[str, object], None]] = None,
+    ) -> Tuple[Dict[str, object], bool]:
+        # Runs every stage as soon as all of its dependencies have finished.
+        # Dependencies on stages that are not in the list (disabled in the
+        # config) are ignored, and stages marked exclusive never overlap with
+        # each other. Once a stage asks for a retry nothing new is started;
+        # the ones already running are allowed to finish.
+        stage_names = {stage.name for stage in stages}
+        finished = set(completed)
+        pending = [stage for stage in stages if stage.name not in completed]
+        running: Dict[concurrent.futures.Future, Stage] = {}
+        results: Dict[str, object] = {}
+        retry_requested = False
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers
+        ) as executor:
+            while pending or running:
+                if not retry_requested:
+                    exclusive_running = any(
+                        stage.exclusive for stage in running.values()
+                    )
+                    for stage in list(pending):
+                        if any(
+                            dependency in stage_names and dependency not in finished
+                            for dependency in stage.depends_on
+                        ):
+                            continue
+                        if stage.exclusive and exclusive_running:
+                            continue
+
+                        running[executor.submit(stage.func)] = stage
+                        pending.remove(stage)
+                        exclusive_running = exclusive_running or stage.exclusive
+
+                if not running:
+                    if pending and not retry_requested:
+                        error_log(
+                            f"Stages {', '.join(stage.name for stage in pending)} have unmet dependencies"
+                        )
+                    break
+
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    stage = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        error_log(f"Stage {stage.name} failed: {str(e)}")
+                        result = self.retry_result
+
+                    results[stage.name] = result
+                    if result == self.retry_result:
+                        retry_requested = True
+                        continue
+
+                    finished.add(stage.name)
+                    if on_stage_done:
+                        on_stage_done(stage.name, result)
+
+        return results, retry_requested
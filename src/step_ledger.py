@@ -0,0 +1,128 @@
+import atexit
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional, Set, Tuple
+import pytz
+from .utils import error_log
+
+
+class StepLedger:
+    def __init__(
+        self,
+        account_storage,
+        ttl_hours: float = 12,
+        cooldown_hours: Optional[Dict[str, float]] = None,
+        flush_interval: float = 5,
+        durable_steps: Iterable[str] = (),
+    ):
+        self.account_storage = account_storage
+        self.flush_interval = flush_interval
+        self.durable_steps = set(durable_steps)
+        self.lock = threading.RLock()
+        self.configure(ttl_hours, cooldown_hours)
+        self._pending: Dict[str, Tuple[str, Dict[str, str]]] = {}
+        self._flush_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._flush_thread = None
+
+        if self.flush_interval > 0:
+            self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+            self._flush_thread.start()
+            atexit.register(self.close)
+
+    def configure(
+        self, ttl_hours: float, cooldown_hours: Optional[Dict[str, float]] = None
+    ):
+        with self.lock:
+            self.ttl = timedelta(hours=ttl_hours)
+            self.cooldowns = {
+                step_name: timedelta(hours=hours)
+                for step_name, hours in (cooldown_hours or {}).items()
+            }
+
+    def _get_steps(self, wallet_address: str) -> Dict[str, str]:
+        with self.lock:
+            pending = self._pending.get(wallet_address)
+        if pending is not None:
+            return pending[1]
+
+        account_data = self.account_storage.get_account_data(wallet_address) or {}
+        return account_data.get("steps") or {}
+
+    def _get_valid_steps(self, wallet_address: str) -> Dict[str, str]:
+        now = datetime.now(pytz.UTC)
+
+        valid_steps = {}
+        for step_name, done_at in self._get_steps(wallet_address).items():
+            try:
+                if datetime.fromisoformat(done_at) > now - self.cooldowns.get(
+                    step_name, self.ttl
+                ):
+                    valid_steps[step_name] = done_at
+            except (TypeError, ValueError):
+                continue
+        return valid_steps
+
+    def _flush_loop(self):
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self, sync: bool = False):
+        with self._flush_lock:
+            with self.lock:
+                batch = dict(self._pending)
+            if not batch:
+                return
+
+            try:
+                self.account_storage.update_steps(batch, sync=sync)
+            except Exception as e:
+                error_log(f"Error saving account steps: {str(e)}")
+                return
+
+            with self.lock:
+                # entries changed during the write stay for the next flush
+                for wallet_address, entry in batch.items():
+                    if self._pending.get(wallet_address) is entry:
+                        del self._pending[wallet_address]
+
+    def close(self):
+        self._stop_event.set()
+        if self._flush_thread and self._flush_thread is not threading.current_thread():
+            self._flush_thread.join(timeout=self.flush_interval + 5)
+        self.flush()
+
+    def get_completed_steps(self, wallet_address: str) -> Set[str]:
+        return set(self._get_valid_steps(wallet_address))
+
+    def mark_done(self, wallet_address: str, private_key: str, step_name: str):
+        with self.lock:
+            steps = self._get_valid_steps(wallet_address)
+            steps[step_name] = datetime.now(pytz.UTC).isoformat()
+            self._pending[wallet_address] = (private_key, steps)
+
+        # Steps that spend something (transactions, fragments) reach the disk
+        # before the next step starts, so a crash never repeats them; the
+        # others are written in one batch per flush tick
+        if step_name in self.durable_steps:
+            self.flush(sync=True)
+        elif self._flush_thread is None:
+            self.flush()
+
+    def reset(self, wallet_address: str, private_key: str):
+        # Steps with a cooldown stay recorded after a full run so the next run
+        # knows they are not due yet
+        with self.lock:
+            self._pending[wallet_address] = (
+                private_key,
+                {
+                    step_name: done_at
+                    for step_name, done_at in self._get_valid_steps(
+                        wallet_address
+                    ).items()
+                    if step_name in self.cooldowns
+                },
+            )
+
+        if self._flush_thread is None:
+            self.flush()
@@ -0,0 +1,162 @@
+import concurrent.futures
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+import jwt
+from .utils import error_log, info_log
+
+# TokenManager.validate_token rejects tokens this close to their expiry
+EXPIRY_MARGIN = 300
+
+
+class TokenRefresher:
+    def __init__(
+        self,
+        login: Callable,
+        account_storage,
+        refresh_before: float = 900,
+        max_workers: int = 2,
+    ):
+        self.login = login
+        self.account_storage = account_storage
+        self.refresh_before = refresh_before
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        self.expiries: Dict[str, Tuple[str, Optional[float]]] = {}
+        self.accounts: Dict[str, tuple] = {}
+        self.run_times: Dict[str, float] = {}
+        self.indexed: Dict[str, tuple] = {}
+        self.refreshing: Dict[str, threading.Event] = {}
+        self.heap = []
+        self.counter = itertools.count()
+        self.condition = threading.Condition()
+        self.closed = False
+        self.thread = None
+
+    def get_expiry(self, wallet_address: str, token: str) -> Optional[float]:
+        # One entry per account: a renewed token replaces the previous one
+        with self.condition:
+            cached = self.expiries.get(wallet_address)
+            if cached and cached[0] == token:
+                return cached[1]
+
+        try:
+            expiry = jwt.decode(token, options={"verify_signature": False}).get("exp")
+        except jwt.InvalidTokenError:
+            expiry = None
+
+        with self.condition:
+            if expiry is None or expiry - EXPIRY_MARGIN <= time.time():
+                # A stale token is never renewed in place, so it is not kept
+                self.expiries.pop(wallet_address, None)
+            else:
+                self.expiries[wallet_address] = (token, expiry)
+        return expiry
+
+    def _get_stored_token(self, wallet_address: str) -> Optional[str]:
+        account_data = self.account_storage.get_account_data(wallet_address) or {}
+        return account_data.get("token")
+
+    def track(self, account_number, private_key, wallet_address, run_at: float):
+        # run_at is when the account is next scheduled to start (epoch seconds)
+        with self.condition:
+            self.accounts[wallet_address] = (account_number, private_key)
+            self.run_times[wallet_address] = run_at
+        self.index_token(wallet_address, self._get_stored_token(wallet_address))
+
+    def index_token(self, wallet_address: str, token: Optional[str]):
+        # Every login costs a captcha, so a token is only renewed when it will
+        # have expired by the account's next run, and then just before that
+        # run instead of ahead of its expiry
+        expiry = self.get_expiry(wallet_address, token) if token else None
+
+        with self.condition:
+            run_at = self.run_times.get(wallet_address)
+            if (
+                expiry is None
+                or run_at is None
+                or run_at <= expiry - EXPIRY_MARGIN
+                or run_at - self.refresh_before <= time.time()
+            ):
+                # A renewal planned for an earlier token or run is dropped
+                self.indexed.pop(wallet_address, None)
+                return
+            due = run_at - self.refresh_before
+            if self.closed or self.indexed.get(wallet_address) == (token, due):
+                return
+            self.indexed[wallet_address] = (token, due)
+            heapq.heappush(self.heap, (due, next(self.counter), wallet_address, token))
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, daemon=True)
+                self.thread.start()
+            self.condition.notify()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while True:
+                    if self.closed:
+                        return
+                    if self.heap:
+                        wait_time = self.heap[0][0] - time.time()
+                        if wait_time <= 0:
+                            break
+                        self.condition.wait(wait_time)
+                    else:
+                        self.condition.wait()
+                due, _, wallet_address, token = heapq.heappop(self.heap)
+                # Entries replaced by a newer token or run time are dropped
+                if self.indexed.get(wallet_address) != (token, due):
+                    continue
+                del self.indexed[wallet_address]
+
+            try:
+                self.executor.submit(self._refresh, wallet_address, token)
+            except RuntimeError:
+                return
+
+    def _refresh(self, wallet_address: str, indexed_token: str):
+        token = self._get_stored_token(wallet_address)
+        if token != indexed_token:
+            self.index_token(wallet_address, token)
+            return
+
+        with self.condition:
+            account_number, private_key = self.accounts[wallet_address]
+            event = threading.Event()
+            self.refreshing[wallet_address] = event
+
+        try:
+            refreshed = self.login(account_number, private_key, wallet_address)
+        except Exception as e:
+            error_log(f"Token refresh error for account {account_number}: {str(e)}")
+            refreshed = False
+        finally:
+            with self.condition:
+                self.refreshing.pop(wallet_address, None)
+            event.set()
+
+        if refreshed:
+            info_log(f"Account {account_number}: token refreshed ahead of its run")
+            self.index_token(wallet_address, self._get_stored_token(wallet_address))
+        else:
+            error_log(
+                f"Account {account_number}: token refresh failed, it will log in on its next run"
+            )
+
+    def wait_for(self, wallet_address: str, timeout: Optional[float] = None):
+        with self.condition:
+            event = self.refreshing.get(wallet_address)
+        if event:
+            event.wait(timeout)
+
+    def stop(self):
+        with self.condition:
+            self.closed = True
+            self.heap = []
+            self.expiries.clear()
+            self.condition.notify_all()
+        if self.thread:
+            self.thread.join()
+        self.executor.shutdown(wait=True, cancel_futures=True)
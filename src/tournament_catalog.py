@@ -0,0 +1,77 @@
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# The summary endpoint is player specific; only the fields that describe the
+# tournament itself are shared between accounts
+DEFINITION_FIELDS = (
+    "id",
+    "name",
+    "type",
+    "tournament_number",
+    "start_date",
+    "end_date",
+)
+
+
+class TournamentCatalog:
+    def __init__(self, refresh_interval: float = 300):
+        self.refresh_interval = refresh_interval
+        self.entries: Dict[int, Tuple[List[Dict], float]] = {}
+        self.refreshing: Dict[int, threading.Event] = {}
+        self.lock = threading.Lock()
+
+    def update(self, tournament_number: int, tournaments: List[Dict]):
+        with self.lock:
+            self.entries[tournament_number] = (
+                [self._definition(t) for t in tournaments],
+                time.monotonic(),
+            )
+
+    def get(self, tournament_number: int) -> Optional[List[Dict]]:
+        with self.lock:
+            entry = self.entries.get(tournament_number)
+            return list(entry[0]) if entry else None
+
+    @staticmethod
+    def _definition(tournament: Dict) -> Dict:
+        return {
+            field: tournament[field]
+            for field in DEFINITION_FIELDS
+            if field in tournament
+        }
+
+    def get_or_fetch(
+        self, tournament_number: int, fetch: Callable[[], Optional[List[Dict]]]
+    ) -> Optional[List[Dict]]:
+        # Only one account refreshes a tournament at a time. While it does,
+        # the others keep using the previous list instead of fetching it too.
+        while True:
+            with self.lock:
+                entry = self.entries.get(tournament_number)
+                if entry and (
+                    time.monotonic() - entry[1] < self.refresh_interval
+                    or tournament_number in self.refreshing
+                ):
+                    return list(entry[0])
+
+                event = self.refreshing.get(tournament_number)
+                if event is None:
+                    event = threading.Event()
+                    self.refreshing[tournament_number] = event
+                    break
+
+            event.wait()
+
+        try:
+            tournaments = fetch()
+        finally:
+            with self.lock:
+                self.refreshing.pop(tournament_number, None)
+            event.set()
+
+        if tournaments is None:
+            return list(entry[0]) if entry else None
+
+        self.update(tournament_number, tournaments)
+        return self.get(tournament_number)
@@ -1,597 +1,777 @@
-import uuid
-import time
-import random
-from typing import List, Dict, Optional, Tuple
-from colorama import Fore
-from .utils import (
-    error_log,
-    success_log,
-    info_log,
-    debug_log,
-    get_sec_ch_ua,
-    get_platform,
-)
-from time import sleep
-from itertools import combinations
-from functools import reduce
-
-
-class TournamentManager:
-    def __init__(self, api, config):
-        self.api = api
-        self.config = config
-        self.tournament_types = {
-            "bronze": {"max_stars": 18, "name": "Bronze Tournament"},
-            "silver": {"max_stars": 23, "name": "Silver Tournament"},
-            "gold": {"max_stars": 25, "name": "Gold Tournament"},
-            "elite": {"max_stars": float("inf"), "name": "Elite Tournament"},
-            "reverse": {
-                "max_stars": float("inf"),
-                "min_stars": 18,
-                "name": "Reverse Tournament",
-            },
-        }
-
-    def fetch_player_cards(
-        self, wallet_address: str, token: str, account_number: int
-    ) -> List[Dict]:
-        try:
-            privy_id_token = self.api._get_privy_token_id()
-
-            auth_token = privy_id_token if privy_id_token else token
-
-            headers = {
-                "Accept": "application/json, text/plain, */*",
-                "Accept-Language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
-                "Authorization": f"Bearer {auth_token}",
-                "Origin": "https://monad.fantasy.top",
-                "Referer": "https://monad.fantasy.top/",
-                "User-Agent": self.api.user_agent,
-                "sec-ch-ua": get_sec_ch_ua(self.api.user_agent),
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-platform": get_platform(self.api.user_agent),
-                "Sec-Fetch-Dest": "empty",
-                "Sec-Fetch-Mode": "cors",
-                "Sec-Fetch-Site": "same-site",
-                "Priority": "u=1, i",
-            }
-
-            page = 1
-            limit = 100
-            cards = []
-
-            while True:
-                params = {
-                    "pagination.page": page,
-                    "pagination.limit": limit,
-                    "where.rarity.in": [1, 2, 3, 4],
-                    "orderBy": "cards_score_desc",
-                    "groupCard": "true",
-                    "isGalleryView": "false",
-                }
-
-                response = self.api.session.get(
-                    f"https://secret-api.fantasy.top/card/player/{wallet_address}",
-                    headers=headers,
-                    params=params,
-                    proxies=self.api.proxies,
-                    timeout=15,
-                )
-                sleep(1)
-
-                if response.status_code == 429:
-                    info_log(
-                        f"Rate limit hit while fetching cards for account {account_number}, retrying..."
-                    )
-                    continue
-
-                if response.status_code == 401:
-                    if auth_token == privy_id_token and token:
-                        auth_token = token
-                        headers["Authorization"] = f"Bearer {auth_token}"
-                        continue
-
-                    error_log(
-                        f"Authorization failed while fetching cards for account {account_number}"
-                    )
-                    return []
-
-                if response.status_code != 200:
-                    error_log(
-                        f"Failed to fetch cards for account {account_number}: {response.status_code}"
-                    )
-                    debug_log(f"Response: {response.text[:200]}")
-                    return []
-
-                data = response.json()
-                if not data.get("data"):
-                    break
-
-                for card in data.get("data", []):
-                    # print(card)
-                    if not card.get("is_in_deck", False):
-                        processed_card = {
-                            "id": card.get("id"),
-                            "heroes": {
-                                "name": card.get(
-                                    "name",
-                                    card.get("heroes", {}).get("name", "Unknown"),
-                                ),
-                                "rarity": card.get(
-                                    "rarity",
-                                    card.get("heroes", {}).get("rarity", 0),
-                                ),
-                                "handle": card.get(
-                                    "handle",
-                                    card.get("heroes", {}).get("handle", "Unknown"),
-                                ),
-                                "stars": card.get(
-                                    "stars", card.get("heroes", {}).get("stars", 0)
-                                ),
-                            },
-                            "card_weighted_score": int(
-                                float(
-                                    card.get(
-                                        "card_weighted_score",
-                                        card.get("weighted_score", 0),
-                                    )
-                                )
-                            ),
-                        }
-                        cards.append(processed_card)
-                print(cards)
-                meta = data.get("meta", {})
-                current_page = meta.get("currentPage", 0)
-                last_page = meta.get("lastPage", 0)
-
-                if current_page >= last_page or not meta:
-                    break
-
-                page += 1
-
-            success_log(
-                f"Fetched {len(cards)} available cards for account {account_number}"
-            )
-            return cards
-
-        except Exception as e:
-            error_log(f"Error fetching cards for account {account_number}: {str(e)}")
-            return []
-
-    def select_best_cards_for_tournament(
-        self,
-        cards: List[Dict],
-        max_stars: int,
-        min_stars: int,
-        used_card_ids: List[str],
-    ) -> Tuple[List[Dict], int]:
-        # for card in cards:
-        #    print(card)
-        try:
-            available_cards = [
-                card for card in cards if card["id"] not in used_card_ids
-            ]
-
-            if len(available_cards) < 5:
-                return [], 0
-
-            def get_stars_safe(card):
-                try:
-                    return int(card.get("heroes", {}).get("stars", 0))
-                except (ValueError, TypeError):
-                    return 0
-
-            sorted_cards = sorted(available_cards, key=get_stars_safe, reverse=True)
-
-            best_selection = self._find_optimal_card_selection(
-                sorted_cards, max_stars, min_stars
-            )
-            if not best_selection:
-                return [], 0
-
-            if not best_selection or len(best_selection) < 5:
-                sorted_by_stars_asc = sorted(available_cards, key=get_stars_safe)
-                best_selection = sorted_by_stars_asc[:5]
-
-            total_stars = 0
-            for card in best_selection:
-                try:
-                    total_stars += int(card.get("heroes", {}).get("stars", 0))
-                except (ValueError, TypeError):
-                    pass
-
-            return best_selection, total_stars
-
-        except Exception as e:
-            error_log(f"Error in select_best_cards_for_tournament: {str(e)}")
-            return [], 0
-
-    def _find_optimal_card_selection(
-        self, sorted_cards: List[Dict], max_stars: int, min_stars: int = 0
-    ) -> Optional[List[Dict]]:
-        if len(sorted_cards) < 5:
-            return []
-
-        selected = []
-        total_stars = 0
-
-        filtered_cards = []
-        rares_amount = 0
-        epics_amount = 0
-        legends_amount = 0
-        for card in sorted_cards:
-            rarity = int(card.get("heroes", {}).get("rarity", 0))
-            score = int(card.get("card_weighted_score", 0))
-            added = False
-
-            if min_stars == 18 and (
-                (rarity == 3 and rares_amount >= 1)
-                or (rarity == 2 and epics_amount >= 1)
-                or (rarity == 1 and legends_amount >= 1)
-            ):
-                # max 1 rare / 1 epic / 1 legend
-                pass
-            if max_stars == 18 and rarity < 4:
-                # no rares in bronze
-                pass
-            elif max_stars == 23 and (
-                rarity < 3 or (rares_amount >= 3 and rarity == 3) or (score < 100)
-            ):
-                # max 3 rares in silver, score != 0
-                pass
-            elif max_stars == 25 and (
-                rarity < 2
-                or (rares_amount >= 4 and rarity == 3)
-                or (epics_amount >= 2 and rarity == 2)
-                or score < 100
-            ):
-                # max 4rare, 2epics, score != 0
-                pass
-            else:
-                added = True
-                filtered_cards.append(card)
-
-            if added:
-                if rarity == 3:
-                    rares_amount += 1
-                elif rarity == 2:
-                    epics_amount += 1
-                elif rarity == 1:
-                    legends_amount += 1
-
-        if min_stars == 18:
-            pass
-
-        elif max_stars == 23 and rares_amount == 0:
-            info_log(f"No rares to register in silver")
-            return None
-
-        elif max_stars == 25 and epics_amount == 0:
-            info_log(f"No epics to register in gold")
-            return None
-
-        elif max_stars > 26 and legends_amount == 0:
-            info_log(f"No legends to register in elite")
-            return None
-
-        sorted_cards = filtered_cards
-        if len(sorted_cards) < 5:
-            return None
-
-        if min_stars == 18:
-            return self._find_optimal_cards_for_reverse(sorted_cards)
-
-        sorted_cards = sorted(
-            sorted_cards,
-            key=lambda x: (
-                -int(x.get("heroes", {}).get("rarity", 0)),
-                int(x.get("heroes", {}).get("stars", 0)),
-            ),
-            reverse=True,
-        )
-
-        best = None  # (score_sum, combo)
-
-        for combo in combinations(sorted_cards, 5):
-            stars_sum = sum(
-                int(item.get("heroes", {}).get("stars", 0)) for item in combo
-            )
-            if stars_sum <= max_stars:
-                score_sum = sum(
-                    int(item.get("card_weighted_score", 0)) for item in combo
-                )
-                if best is None or score_sum > best[0]:
-                    best = (score_sum, combo)
-
-        return best[1] if best else None
-
-    def _find_optimal_cards_for_reverse(
-        self, cards: List[Dict]
-    ) -> Optional[List[Dict]]:
-        sorted_cards = sorted(
-            cards,
-            key=lambda x: (
-                int(x.get("heroes", {}).get("stars", 0)),
-                int(x.get("card_weighted_score", 0)),
-            ),
-            reverse=False,
-        )
-
-        best = None  # Хранит кортеж (score_sum, stars_sum, combination)
-
-        for combo in combinations(sorted_cards, 5):
-            stars_sum = sum(
-                int(item.get("heroes", {}).get("stars", 0)) for item in combo
-            )
-            if stars_sum >= 18:
-                score_sum = sum(
-                    int(item.get("card_weighted_score", 0)) for item in combo
-                )
-                current = (score_sum, stars_sum, combo)
-
-                if (
-                    best is None
-                    or (current[0] < best[0])
-                    or (current[0] == best[0] and current[1] < best[1])
-                ):
-                    best = current
-
-        return best[2] if best else None
-
-    def register_for_tournament(
-        self,
-        token: str,
-        tournament_type: str,
-        wallet_address: str,
-        account_number: int,
-        tournament_id: str,
-        card_ids: List[str],
-        deck_number: int = 1,
-    ) -> bool:
-        try:
-            privy_id_token = self.api._get_privy_token_id()
-
-            auth_token = privy_id_token if privy_id_token else token
-
-            headers = {
-                "Accept": "application/json, text/plain, */*",
-                "Accept-Language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
-                "Authorization": f"Bearer {auth_token}",
-                "Content-Type": "application/json",
-                "Origin": "https://monad.fantasy.top",
-                "Referer": "https://monad.fantasy.top/",
-                "User-Agent": self.api.user_agent,
-                "sec-ch-ua": get_sec_ch_ua(self.api.user_agent),
-                "sec-ch-ua-mobile": "?0",
-                "sec-ch-ua-platform": get_platform(self.api.user_agent),
-                "Sec-Fetch-Dest": "empty",
-                "Sec-Fetch-Mode": "cors",
-                "Sec-Fetch-Site": "same-site",
-                "Priority": "u=1, i",
-            }
-
-            max_registration_retries = 3
-            retry_delay = 2
-
-            for retry_attempt in range(max_registration_retries):
-                try:
-                    deck_id = str(uuid.uuid4())
-
-                    payload = {
-                        "deckId": deck_id,
-                        "cardIds": card_ids,
-                        "tournamentId": tournament_id,
-                    }
-
-                    debug_log(f"Sending tournament registration payload: {payload}")
-
-                    response = self.api.session.post(
-                        "https://secret-api.fantasy.top/tournaments/create-deck",
-                        headers=headers,
-                        json=payload,
-                        proxies=self.api.proxies,
-                        timeout=15,
-                    )
-
-                    try:
-                        response_data = response.json()
-                        debug_log(f"Tournament registration response: {response_data}")
-                    except Exception:
-                        debug_log(f"Non-JSON response: {response.text}")
-
-                    if response.status_code == 429:
-                        info_log(
-                            f"Rate limit hit during tournament registration for account {account_number}, retrying ({retry_attempt+1}/{max_registration_retries})..."
-                        )
-                        time.sleep(retry_delay)
-                        continue
-
-                    if response.status_code == 500:
-                        info_log(
-                            f"Server error (500) during tournament registration for account {account_number}, retrying ({retry_attempt+1}/{max_registration_retries})..."
-                        )
-                        time.sleep(retry_delay)
-                        time.sleep(random.uniform(1.0, 3.0))
-                        continue
-
-                    if (
-                        response.status_code == 401
-                        and auth_token == privy_id_token
-                        and token
-                    ):
-                        auth_token = token
-                        headers["Authorization"] = f"Bearer {auth_token}"
-                        continue
-
-                    if response.status_code in [200, 201]:
-                        success_log(
-                            f"Successfully registered account {account_number} in tournament {tournament_type} = {tournament_id} (Deck #{deck_number})"
-                        )
-                        return True
-
-                    info_log(
-                        f"Unknown response {response.status_code} during tournament registration for account {account_number}, retrying ({retry_attempt+1}/{max_registration_retries})..."
-                    )
-                    info_log(response.text)
-                    debug_log(f"Registration response: {response.text}")
-                    time.sleep(retry_delay)
-
-                except Exception as e:
-                    if retry_attempt < max_registration_retries - 1:
-                        error_log(
-                            f"Error during tournament registration attempt {retry_attempt+1}: {str(e)}, retrying..."
-                        )
-                        time.sleep(retry_delay)
-                    else:
-                        error_log(f"Final error registering for tournament: {str(e)}")
-                        return False
-
-            error_log(
-                f"Failed to register for tournament after {max_registration_retries} attempts"
-            )
-            return False
-
-        except Exception as e:
-            error_log(f"Error registering for tournament: {str(e)}")
-            return False
-
-    def register_in_tournaments(
-        self,
-        token: str,
-        wallet_address: str,
-        account_number: int,
-        tournament_ids: Dict[str, str],
-    ) -> Dict[str, bool]:
-        results = {}
-        cards = self.fetch_player_cards(wallet_address, token, account_number)
-
-        if not cards:
-            info_log(f"No cards available for account {account_number}")
-            return {t_type: False for t_type in tournament_ids.keys()}
-
-        print(tournament_ids)
-        used_card_ids = []
-
-        tournaments_types_ordered = ["elite", "gold", "silver", "reverse", "bronze"]
-        for active_tournament_type in tournaments_types_ordered:
-            t_id = tournament_ids.get(active_tournament_type, None)
-            if not t_id:
-                continue
-
-            # active_tournament_type = None
-            # for t_type, t_id in tournament_ids.items():
-            #    if t_id:
-            #        active_tournament_type = t_type
-            #        break
-
-            # print(active_tournament_type)
-            # if not active_tournament_type:
-            #    info_log(f"No active tournament selected for account {account_number}")
-            #    return {}
-
-            tournament_id = tournament_ids[active_tournament_type]
-            max_stars = self.tournament_types[active_tournament_type]["max_stars"]
-            min_stars = self.tournament_types[active_tournament_type].get(
-                "min_stars", 0
-            )
-
-            info_log(
-                f"Attempting to register account {account_number} in {active_tournament_type.capitalize()} tournament"
-            )
-
-            deck_number = 1
-            registration_successful = False
-
-            while True:
-                selected_cards, total_stars = self.select_best_cards_for_tournament(
-                    cards, max_stars, min_stars, used_card_ids
-                )
-                total_score = reduce(
-                    lambda x, y: x + int(y.get("card_weighted_score", 0)),
-                    selected_cards,
-                    0,
-                )
-
-                # print(selected_cards)
-
-                if len(selected_cards) < 5:
-                    if deck_number == 1:
-                        info_log(
-                            f"Not enough available cards for {active_tournament_type} tournament for account {account_number}"
-                        )
-                        results[active_tournament_type] = False
-                    else:
-                        info_log(
-                            f"No more complete decks available for {active_tournament_type} tournament (registered {deck_number-1} decks) for account {account_number}"
-                        )
-                    break
-
-                if total_stars > max_stars:
-                    if deck_number == 1:
-                        info_log(
-                            f"Selected cards exceed star limit for {active_tournament_type} tournament: {total_stars} > {max_stars} for account {account_number}"
-                        )
-                        results[active_tournament_type] = False
-                    else:
-                        info_log(
-                            f"No more valid decks within star limit for {active_tournament_type} tournament for account {account_number}"
-                        )
-                    break
-
-                card_ids = [card["id"] for card in selected_cards]
-
-                try:
-                    clean_card_info = []
-                    for card in selected_cards:
-                        name = card.get("heroes", {}).get("name", "Unknown")
-                        clean_name = "".join(c for c in name if ord(c) < 128)
-                        stars = card.get("heroes", {}).get("stars", 0)
-                        score = int(card.get("card_weighted_score"))
-                        info = f"{clean_name} ({stars}* {score}s)"
-                        rarity = int(card.get("heroes", {}).get("rarity", 0))
-
-                        if rarity == 4:
-                            info = f"{info} (COMMON)"
-                        elif rarity == 3:
-                            info = f"{info} (RARE)"
-                        elif rarity == 2:
-                            info = f"{info} (EPIC)"
-                        elif rarity == 1:
-                            info = f"{info} (LEGEND)"
-                        clean_card_info.append(info)
-
-                    info_log(
-                        f"Selected cards for {active_tournament_type} tournament deck #{deck_number} (total stars={total_stars}*; score={total_score}): {', '.join(clean_card_info)}"
-                    )
-
-                    success = self.register_for_tournament(
-                        token,
-                        active_tournament_type,
-                        wallet_address,
-                        account_number,
-                        tournament_id,
-                        card_ids,
-                        deck_number,
-                    )
-
-                    if success:
-                        used_card_ids.extend(card_ids)
-                        registration_successful = True
-                        deck_number += 1
-                    else:
-                        if deck_number == 1:
-                            results[active_tournament_type] = False
-                        break
-                except Exception as e:
-                    error_log(
-                        f"Error registering for {active_tournament_type} tournament: {str(e)}"
-                    )
-                    if deck_number == 1:
-                        results[active_tournament_type] = False
-                    break
-                if min_stars == 18:
-                    # attemp to reg only one deck for reverse
-                    break
-
-            results[active_tournament_type] = registration_successful
-        return results
+import uuid
+import time
+import random
+from typing import List, Dict, Optional, Tuple
+from colorama import Fore
+from .utils import (
+    error_log,
+    success_log,
+    info_log,
+    debug_log,
+)
+from .http_client import SECRET_API_URL, STATUS_RATE_LIMITED, classify_status
+from time import sleep
+
+ACCEPT_LANGUAGE = "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7"
+
+
+class TournamentManager:
+    TOURNAMENT_ORDER = ["elite", "gold", "silver", "reverse", "bronze"]
+
+    def __init__(self, api, config):
+        self.api = api
+        self.config = config
+        self.tournament_types = {
+            "bronze": {"max_stars": 18, "name": "Bronze Tournament"},
+            "silver": {"max_stars": 23, "name": "Silver Tournament"},
+            "gold": {"max_stars": 25, "name": "Gold Tournament"},
+            "elite": {"max_stars": float("inf"), "name": "Elite Tournament"},
+            "reverse": {
+                "max_stars": float("inf"),
+                "min_stars": 18,
+                "name": "Reverse Tournament",
+            },
+        }
+
+    def fetch_player_cards(
+        self, wallet_address: str, token: str, account_number: int
+    ) -> List[Dict]:
+        try:
+            page = 1
+            limit = 100
+            cards = []
+
+            while True:
+                params = {
+                    "pagination.page": page,
+                    "pagination.limit": limit,
+                    "where.rarity.in": [1, 2, 3, 4],
+                    "orderBy": "cards_score_desc",
+                    "groupCard": "true",
+                    "isGalleryView": "false",
+                }
+
+                response = self.api.http.get(
+                    f"{SECRET_API_URL}/card/player/{wallet_address}",
+                    token,
+                    headers={"Accept-Language": ACCEPT_LANGUAGE},
+                    params=params,
+                    timeout=15,
+                )
+                sleep(1)
+
+                if classify_status(response.status_code) == STATUS_RATE_LIMITED:
+                    info_log(
+                        f"Rate limit hit while fetching cards for account {account_number}, retrying..."
+                    )
+                    continue
+
+                if response.status_code == 401:
+                    error_log(
+                        f"Authorization failed while fetching cards for account {account_number}"
+                    )
+                    return []
+
+                if response.status_code != 200:
+                    error_log(
+                        f"Failed to fetch cards for account {account_number}: {response.status_code}"
+                    )
+                    debug_log(f"Response: {response.text[:200]}")
+                    return []
+
+                data = response.json()
+                if not data.get("data"):
+                    break
+
+                for card in data.get("data", []):
+                    # print(card)
+                    if not card.get("is_in_deck", False):
+                        processed_card = {
+                            "id": card.get("id"),
+                            "heroes": {
+                                "name": card.get(
+                                    "name",
+                                    card.get("heroes", {}).get("name", "Unknown"),
+                                ),
+                                "rarity": card.get(
+                                    "rarity",
+                                    card.get("heroes", {}).get("rarity", 0),
+                                ),
+                                "handle": card.get(
+                                    "handle",
+                                    card.get("heroes", {}).get("handle", "Unknown"),
+                                ),
+                                "stars": card.get(
+                                    "stars", card.get("heroes", {}).get("stars", 0)
+                                ),
+                            },
+                            "card_weighted_score": int(
+                                float(
+                                    card.get(
+                                        "card_weighted_score",
+                                        card.get("weighted_score", 0),
+                                    )
+                                )
+                            ),
+                        }
+                        cards.append(processed_card)
+                print(cards)
+                meta = data.get("meta", {})
+                current_page = meta.get("currentPage", 0)
+                last_page = meta.get("lastPage", 0)
+
+                if current_page >= last_page or not meta:
+                    break
+
+                page += 1
+
+            success_log(
+                f"Fetched {len(cards)} available cards for account {account_number}"
+            )
+            return cards
+
+        except Exception as e:
+            error_log(f"Error fetching cards for account {account_number}: {str(e)}")
+            return []
+
+    def select_best_cards_for_tournament(
+        self,
+        cards: List[Dict],
+        max_stars: int,
+        min_stars: int,
+        used_card_ids: List[str],
+    ) -> Tuple[List[Dict], int]:
+        # for card in cards:
+        #    print(card)
+        try:
+            available_cards = [
+                card for card in cards if card["id"] not in used_card_ids
+            ]
+
+            if len(available_cards) < 5:
+                return [], 0
+
+            def get_stars_safe(card):
+                try:
+                    return int(card.get("heroes", {}).get("stars", 0))
+                except (ValueError, TypeError):
+                    return 0
+
+            sorted_cards = sorted(available_cards, key=get_stars_safe, reverse=True)
+
+            best_selection = self._find_optimal_card_selection(
+                sorted_cards, max_stars, min_stars
+            )
+            if not best_selection:
+                return [], 0
+
+            if not best_selection or len(best_selection) < 5:
+                sorted_by_stars_asc = sorted(available_cards, key=get_stars_safe)
+                best_selection = sorted_by_stars_asc[:5]
+
+            total_stars = 0
+            for card in best_selection:
+                try:
+                    total_stars += int(card.get("heroes", {}).get("stars", 0))
+                except (ValueError, TypeError):
+                    pass
+
+            return best_selection, total_stars
+
+        except Exception as e:
+            error_log(f"Error in select_best_cards_for_tournament: {str(e)}")
+            return [], 0
+
+    def _filter_tournament_cards(
+        self, sorted_cards: List[Dict], max_stars: int, min_stars: int = 0
+    ) -> Tuple[List[Dict], Optional[str]]:
+        # Rarity and score rules of a tournament: returns the cards that may
+        # be registered and, when the card type the tournament requires is
+        # missing, the reason instead of None
+        filtered_cards = []
+        rares_amount = 0
+        epics_amount = 0
+        legends_amount = 0
+        for card in sorted_cards:
+            rarity = int(card.get("heroes", {}).get("rarity", 0))
+            score = int(card.get("card_weighted_score", 0))
+            added = False
+
+            if min_stars == 18 and (
+                (rarity == 3 and rares_amount >= 1)
+                or (rarity == 2 and epics_amount >= 1)
+                or (rarity == 1 and legends_amount >= 1)
+            ):
+                # max 1 rare / 1 epic / 1 legend
+                pass
+            if max_stars == 18 and rarity < 4:
+                # no rares in bronze
+                pass
+            elif max_stars == 23 and (
+                rarity < 3 or (rares_amount >= 3 and rarity == 3) or (score < 100)
+            ):
+                # max 3 rares in silver, score != 0
+                pass
+            elif max_stars == 25 and (
+                rarity < 2
+                or (rares_amount >= 4 and rarity == 3)
+                or (epics_amount >= 2 and rarity == 2)
+                or score < 100
+            ):
+                # max 4rare, 2epics, score != 0
+                pass
+            else:
+                added = True
+                filtered_cards.append(card)
+
+            if added:
+                if rarity == 3:
+                    rares_amount += 1
+                elif rarity == 2:
+                    epics_amount += 1
+                elif rarity == 1:
+                    legends_amount += 1
+
+        if min_stars == 18:
+            pass
+
+        elif max_stars == 23 and rares_amount == 0:
+            return filtered_cards, "No rares to register in silver"
+
+        elif max_stars == 25 and epics_amount == 0:
+            return filtered_cards, "No epics to register in gold"
+
+        elif max_stars > 26 and legends_amount == 0:
+            return filtered_cards, "No legends to register in elite"
+
+        return filtered_cards, None
+
+    def _find_optimal_card_selection(
+        self, sorted_cards: List[Dict], max_stars: int, min_stars: int = 0
+    ) -> Optional[List[Dict]]:
+        if len(sorted_cards) < 5:
+            return []
+
+        filtered_cards, missing = self._filter_tournament_cards(
+            sorted_cards, max_stars, min_stars
+        )
+        if missing:
+            info_log(missing)
+            return None
+
+        sorted_cards = filtered_cards
+        if len(sorted_cards) < 5:
+            return None
+
+        if min_stars == 18:
+            return self._find_optimal_cards_for_reverse(sorted_cards)
+
+        sorted_cards = sorted(
+            sorted_cards,
+            key=lambda x: (
+                -int(x.get("heroes", {}).get("rarity", 0)),
+                int(x.get("heroes", {}).get("stars", 0)),
+            ),
+            reverse=True,
+        )
+
+        return self._find_max_score_deck(sorted_cards, max_stars)
+
+    def _find_max_score_deck(
+        self, cards: List[Dict], max_stars, deck_size: int = 5
+    ) -> Optional[Tuple[Dict, ...]]:
+        # Exact 0/1 knapsack with a cardinality constraint: best[i][k][s] is
+        # the highest score reachable with k cards taken from cards[i:] using
+        # at most s stars. Walking the table forward and always taking the
+        # earliest card that still reaches the optimum gives the same deck
+        # the combinations() scan used to return (its first best combo).
+        n = len(cards)
+        if n < deck_size:
+            return None
+
+        stars = [int(card.get("heroes", {}).get("stars", 0)) for card in cards]
+        scores = [int(card.get("card_weighted_score", 0)) for card in cards]
+
+        star_budget = sum(sorted(stars, reverse=True)[:deck_size])
+        if max_stars < star_budget:
+            star_budget = int(max_stars)
+        if star_budget < 0:
+            return None
+
+        impossible = float("-inf")
+        best = [
+            [[impossible] * (star_budget + 1) for _ in range(deck_size + 1)]
+            for _ in range(n + 1)
+        ]
+        best[n][0] = [0] * (star_budget + 1)
+
+        for i in range(n - 1, -1, -1):
+            current = best[i]
+            following = best[i + 1]
+            current[0] = [0] * (star_budget + 1)
+            card_stars = stars[i]
+            card_score = scores[i]
+            for k in range(1, deck_size + 1):
+                row = following[k][:]
+                previous_row = following[k - 1]
+                for s in range(card_stars, star_budget + 1):
+                    candidate = previous_row[s - card_stars] + card_score
+                    if candidate > row[s]:
+                        row[s] = candidate
+                current[k] = row
+
+        target = best[0][deck_size][star_budget]
+        if target == impossible:
+            return None
+
+        selection = []
+        remaining_stars = star_budget
+        start = 0
+        for k in range(deck_size, 0, -1):
+            for j in range(start, n):
+                if stars[j] > remaining_stars:
+                    continue
+                if (
+                    best[j + 1][k - 1][remaining_stars - stars[j]] + scores[j]
+                    == target
+                ):
+                    selection.append(cards[j])
+                    target -= scores[j]
+                    remaining_stars -= stars[j]
+                    start = j + 1
+                    break
+
+        return tuple(selection)
+
+    def _find_optimal_cards_for_reverse(
+        self, cards: List[Dict], min_stars: int = 18
+    ) -> Optional[List[Dict]]:
+        sorted_cards = sorted(
+            cards,
+            key=lambda x: (
+                int(x.get("heroes", {}).get("stars", 0)),
+                int(x.get("card_weighted_score", 0)),
+            ),
+            reverse=False,
+        )
+
+        return self._find_min_score_deck(sorted_cards, min_stars)
+
+    def _find_min_score_deck(
+        self, cards: List[Dict], min_stars: int, deck_size: int = 5
+    ) -> Optional[Tuple[Dict, ...]]:
+        # best[i][k][s] is the lowest score of k cards taken from cards[i:]
+        # with exactly s stars. The answer is the (score, stars) minimum over
+        # s >= min_stars; the deck is rebuilt by taking the earliest card that
+        # still reaches it, which matches the first best combo that the old
+        # combinations() scan kept.
+        n = len(cards)
+        if n < deck_size:
+            return None
+
+        stars = [int(card.get("heroes", {}).get("stars", 0)) for card in cards]
+        scores = [int(card.get("card_weighted_score", 0)) for card in cards]
+
+        max_total_stars = sum(sorted(stars, reverse=True)[:deck_size])
+        if max_total_stars < min_stars:
+            return None
+
+        impossible = float("inf")
+        best = [
+            [[impossible] * (max_total_stars + 1) for _ in range(deck_size + 1)]
+            for _ in range(n + 1)
+        ]
+        best[n][0][0] = 0
+
+        for i in range(n - 1, -1, -1):
+            current = best[i]
+            following = best[i + 1]
+            current[0][0] = 0
+            card_stars = stars[i]
+            card_score = scores[i]
+            for k in range(1, deck_size + 1):
+                row = following[k][:]
+                previous_row = following[k - 1]
+                for s in range(card_stars, max_total_stars + 1):
+                    candidate = previous_row[s - card_stars] + card_score
+                    if candidate < row[s]:
+                        row[s] = candidate
+                current[k] = row
+
+        best_total = None
+        for s in range(max(min_stars, 0), max_total_stars + 1):
+            score = best[0][deck_size][s]
+            if score != impossible and (best_total is None or score < best_total[0]):
+                best_total = (score, s)
+
+        if best_total is None:
+            return None
+
+        target, remaining_stars = best_total
+        selection = []
+        start = 0
+        for k in range(deck_size, 0, -1):
+            for j in range(start, n):
+                if stars[j] > remaining_stars:
+                    continue
+                if (
+                    best[j + 1][k - 1][remaining_stars - stars[j]] + scores[j]
+                    == target
+                ):
+                    selection.append(cards[j])
+                    target -= scores[j]
+                    remaining_stars -= stars[j]
+                    start = j + 1
+                    break
+
+        return tuple(selection)
+
+    def register_for_tournament(
+        self,
+        token: str,
+        tournament_type: str,
+        wallet_address: str,
+        account_number: int,
+        tournament_id: str,
+        card_ids: List[str],
+        deck_number: int = 1,
+    ) -> bool:
+        try:
+            headers = {
+                "Accept-Language": ACCEPT_LANGUAGE,
+                "Content-Type": "application/json",
+            }
+
+            max_registration_retries = 3
+            retry_delay = 2
+
+            for retry_attempt in range(max_registration_retries):
+                try:
+                    deck_id = str(uuid.uuid4())
+
+                    payload = {
+                        "deckId": deck_id,
+                        "cardIds": card_ids,
+                        "tournamentId": tournament_id,
+                    }
+
+                    debug_log(f"Sending tournament registration payload: {payload}")
+
+                    response = self.api.http.post(
+                        f"{SECRET_API_URL}/tournaments/create-deck",
+                        token,
+                        headers=headers,
+                        json=payload,
+                        max_retries=1,
+                        timeout=15,
+                    )
+
+                    try:
+                        response_data = response.json()
+                        debug_log(f"Tournament registration response: {response_data}")
+                    except Exception:
+                        debug_log(f"Non-JSON response: {response.text}")
+
+                    if response.status_code == 429:
+                        info_log(
+                            f"Rate limit hit during tournament registration for account {account_number}, retrying ({retry_attempt+1}/{max_registration_retries})..."
+                        )
+                        time.sleep(retry_delay)
+                        continue
+
+                    if response.status_code == 500:
+                        info_log(
+                            f"Server error (500) during tournament registration for account {account_number}, retrying ({retry_attempt+1}/{max_registration_retries})..."
+                        )
+                        time.sleep(retry_delay)
+                        time.sleep(random.uniform(1.0, 3.0))
+                        continue
+
+                    if response.status_code in [200, 201]:
+                        success_log(
+                            f"Successfully registered account {account_number} in tournament {tournament_type} = {tournament_id} (Deck #{deck_number})"
+                        )
+                        return True
+
+                    info_log(
+                        f"Unknown response {response.status_code} during tournament registration for account {account_number}, retrying ({retry_attempt+1}/{max_registration_retries})..."
+                    )
+                    info_log(response.text)
+                    debug_log(f"Registration response: {response.text}")
+                    time.sleep(retry_delay)
+
+                except Exception as e:
+                    if retry_attempt < max_registration_retries - 1:
+                        error_log(
+                            f"Error during tournament registration attempt {retry_attempt+1}: {str(e)}, retrying..."
+                        )
+                        time.sleep(retry_delay)
+                    else:
+                        error_log(f"Final error registering for tournament: {str(e)}")
+                        return False
+
+            error_log(
+                f"Failed to register for tournament after {max_registration_retries} attempts"
+            )
+            return False
+
+        except Exception as e:
+            error_log(f"Error registering for tournament: {str(e)}")
+            return False
+
+    def _card_stats(self, card: Dict) -> Tuple[int, int, int]:
+        heroes = card.get("heroes", {})
+        return (
+            int(heroes.get("stars", 0)),
+            int(card.get("card_weighted_score", 0)),
+            int(heroes.get("rarity", 0)),
+        )
+
+    def _is_reverse(self, tournament_type: str) -> bool:
+        return "min_stars" in self.tournament_types[tournament_type]
+
+    def _deck_is_valid(self, tournament_type: str, deck: List[Dict]) -> bool:
+        # The rules the seed decks are built with: the star bounds, and every
+        # card kept by _filter_tournament_cards. Its required rarity (a rare
+        # in silver, an epic in gold, a legend in elite) is only checked on
+        # the player's whole collection, never on the deck itself
+        tournament_config = self.tournament_types[tournament_type]
+        max_stars = tournament_config["max_stars"]
+        min_stars = tournament_config.get("min_stars", 0)
+
+        total_stars = sum(self._card_stats(card)[0] for card in deck)
+        if total_stars > max_stars or total_stars < min_stars:
+            return False
+
+        filtered_cards, _ = self._filter_tournament_cards(deck, max_stars, min_stars)
+        return len(filtered_cards) == len(deck)
+
+    def _deck_value(self, tournament_type: str, deck: List[Dict], stats: Dict) -> int:
+        score = sum(stats[card["id"]][1] for card in deck)
+        # reverse tournaments are won with the lowest score
+        if self._is_reverse(tournament_type):
+            return -score
+        return score
+
+    def plan_registrations(
+        self, cards: List[Dict], tournament_ids: Dict[str, str]
+    ) -> List[Tuple[str, List[Dict]]]:
+        plan = []
+        used_card_ids = []
+
+        for tournament_type in self.TOURNAMENT_ORDER:
+            if not tournament_ids.get(tournament_type):
+                continue
+
+            max_stars = self.tournament_types[tournament_type]["max_stars"]
+            min_stars = self.tournament_types[tournament_type].get("min_stars", 0)
+
+            while True:
+                selected_cards, total_stars = self.select_best_cards_for_tournament(
+                    cards, max_stars, min_stars, used_card_ids
+                )
+                if len(selected_cards) < 5 or total_stars > max_stars:
+                    break
+
+                plan.append((tournament_type, list(selected_cards)))
+                used_card_ids.extend(card["id"] for card in selected_cards)
+
+                if min_stars == 18:
+                    # only one deck for reverse
+                    break
+
+        return self._improve_plan(plan, cards, tournament_ids)
+
+    def _improve_plan(
+        self,
+        plan: List[Tuple[str, List[Dict]]],
+        cards: List[Dict],
+        tournament_ids: Dict[str, str],
+        max_rounds: int = 20,
+    ) -> List[Tuple[str, List[Dict]]]:
+        # Local search over the greedy plan: swap cards between decks and the
+        # unused pool while every deck stays valid and the summed deck value
+        # grows, then try to build extra decks from whatever got freed up.
+        stats = {card["id"]: self._card_stats(card) for card in cards}
+
+        for _ in range(max_rounds):
+            used_card_ids = {card["id"] for _, deck in plan for card in deck}
+            unused = [card for card in cards if card["id"] not in used_card_ids]
+
+            swapped = self._swap_cards(plan, unused, stats)
+
+            extra_decks = []
+            used_card_ids = [card["id"] for _, deck in plan for card in deck]
+            for tournament_type in self.TOURNAMENT_ORDER:
+                if not tournament_ids.get(tournament_type):
+                    continue
+                tournament_config = self.tournament_types[tournament_type]
+                if tournament_config.get("min_stars") == 18:
+                    continue
+                selected_cards, total_stars = self.select_best_cards_for_tournament(
+                    cards,
+                    tournament_config["max_stars"],
+                    tournament_config.get("min_stars", 0),
+                    used_card_ids,
+                )
+                if len(selected_cards) < 5 or total_stars > tournament_config["max_stars"]:
+                    continue
+                extra_decks.append((tournament_type, list(selected_cards)))
+                used_card_ids.extend(card["id"] for card in selected_cards)
+
+            plan.extend(extra_decks)
+            if not swapped and not extra_decks:
+                break
+
+        plan.sort(key=lambda entry: self.TOURNAMENT_ORDER.index(entry[0]))
+        return plan
+
+    def _swap_cards(self, plan, unused: List[Dict], stats: Dict) -> bool:
+        # Trading cards between two normal decks keeps the summed score, so
+        # decks only trade with the unused pool and with the reverse deck,
+        # whose value counts the other way
+        swapped = False
+        improved = True
+
+        while improved:
+            improved = False
+            for deck_index, (tournament_type, deck) in enumerate(plan):
+                for position in range(len(deck)):
+                    current_value = self._deck_value(tournament_type, deck, stats)
+
+                    for unused_index, candidate in enumerate(unused):
+                        new_deck = list(deck)
+                        new_deck[position] = candidate
+                        new_value = self._deck_value(tournament_type, new_deck, stats)
+                        if new_value > current_value and self._deck_is_valid(
+                            tournament_type, new_deck
+                        ):
+                            unused[unused_index] = deck[position]
+                            deck[position] = candidate
+                            current_value = new_value
+                            improved = swapped = True
+
+                    for other_index in range(deck_index + 1, len(plan)):
+                        other_type, other_deck = plan[other_index]
+                        if self._is_reverse(other_type) == self._is_reverse(
+                            tournament_type
+                        ):
+                            continue
+                        other_value = self._deck_value(other_type, other_deck, stats)
+
+                        for other_position in range(len(other_deck)):
+                            new_deck = list(deck)
+                            new_deck[position] = other_deck[other_position]
+                            new_other_deck = list(other_deck)
+                            new_other_deck[other_position] = deck[position]
+
+                            new_value = self._deck_value(
+                                tournament_type, new_deck, stats
+                            )
+                            new_other_value = self._deck_value(
+                                other_type, new_other_deck, stats
+                            )
+                            if (
+                                new_value + new_other_value > current_value + other_value
+                                and self._deck_is_valid(tournament_type, new_deck)
+                                and self._deck_is_valid(other_type, new_other_deck)
+                            ):
+                                deck[position], other_deck[other_position] = (
+                                    other_deck[other_position],
+                                    deck[position],
+                                )
+                                current_value = new_value
+                                other_value = new_other_value
+                                improved = swapped = True
+
+        return swapped
+
+    def _format_deck(self, selected_cards: List[Dict]) -> str:
+        clean_card_info = []
+        for card in selected_cards:
+            name = card.get("heroes", {}).get("name", "Unknown")
+            clean_name = "".join(c for c in name if ord(c) < 128)
+            stars = card.get("heroes", {}).get("stars", 0)
+            score = int(card.get("card_weighted_score"))
+            info = f"{clean_name} ({stars}* {score}s)"
+            rarity = int(card.get("heroes", {}).get("rarity", 0))
+
+            if rarity == 4:
+                info = f"{info} (COMMON)"
+            elif rarity == 3:
+                info = f"{info} (RARE)"
+            elif rarity == 2:
+                info = f"{info} (EPIC)"
+            elif rarity == 1:
+                info = f"{info} (LEGEND)"
+            clean_card_info.append(info)
+        return ", ".join(clean_card_info)
+
+    def register_in_tournaments(
+        self,
+        token: str,
+        wallet_address: str,
+        account_number: int,
+        tournament_ids: Dict[str, str],
+    ) -> Dict[str, bool]:
+        cards = self.fetch_player_cards(wallet_address, token, account_number)
+
+        if not cards:
+            info_log(f"No cards available for account {account_number}")
+            return {t_type: False for t_type in tournament_ids.keys()}
+
+        plan = self.plan_registrations(cards, tournament_ids)
+
+        results = {}
+        for t_type in self.TOURNAMENT_ORDER:
+            if not tournament_ids.get(t_type):
+                continue
+            results[t_type] = False
+            if not any(plan_type == t_type for plan_type, _ in plan):
+                info_log(
+                    f"Not enough available cards for {t_type} tournament for account {account_number}"
+                )
+
+        info_log(
+            f"Registration plan for account {account_number}: "
+            + ", ".join(
+                f"{t_type}={sum(1 for plan_type, _ in plan if plan_type == t_type)}"
+                for t_type in results
+            )
+        )
+
+        deck_numbers = {}
+        failed_types = set()
+        for t_type, selected_cards in plan:
+            if t_type in failed_types:
+                continue
+
+            deck_number = deck_numbers.get(t_type, 0) + 1
+            total_stars = sum(self._card_stats(card)[0] for card in selected_cards)
+            total_score = sum(self._card_stats(card)[1] for card in selected_cards)
+
+            try:
+                info_log(
+                    f"Selected cards for {t_type} tournament deck #{deck_number} (total stars={total_stars}*; score={total_score}): {self._format_deck(selected_cards)}"
+                )
+
+                success = self.register_for_tournament(
+                    token,
+                    t_type,
+                    wallet_address,
+                    account_number,
+                    tournament_ids[t_type],
+                    [card["id"] for card in selected_cards],
+                    deck_number,
+                )
+            except Exception as e:
+                error_log(f"Error registering for {t_type} tournament: {str(e)}")
+                success = False
+
+            if success:
+                deck_numbers[t_type] = deck_number
+                results[t_type] = True
+            else:
+                failed_types.add(t_type)
+
+        return results
@@ -0,0 +1,274 @@
+import concurrent.futures
+import json
+import threading
+import time
+from typing import Dict, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import Web3
+from .nonce_manager import NonceManager
+from .rate_limiter import RateLimiter
+from .receipt_watcher import ReceiptWatcher
+
+RPC_POOL_SIZE = 50
+RPC_TIMEOUT = 10
+RPC_BATCH_WINDOW = 0.005
+RPC_BATCH_SIZE = 50
+
+BATCHABLE_METHODS = {
+    "eth_getBalance",
+    "eth_getTransactionCount",
+    "eth_gasPrice",
+    "eth_call",
+}
+
+
+def to_http_url(rpc_url: str) -> str:
+    # The pooled provider speaks JSON-RPC over HTTP only; public nodes serve
+    # the same API over https on their websocket host
+    scheme, separator, rest = rpc_url.partition("://")
+    scheme = scheme.lower()
+    if separator and scheme in ("http", "https"):
+        return rpc_url
+    if separator and scheme in ("ws", "wss"):
+        return ("https" if scheme == "wss" else "http") + "://" + rest
+    raise ValueError(f"Unsupported RPC url (expected http(s) or ws(s)): {rpc_url}")
+
+
+class RequestBatcher:
+    def __init__(
+        self,
+        send_batch,
+        window: float = RPC_BATCH_WINDOW,
+        max_size: int = RPC_BATCH_SIZE,
+    ):
+        self.send_batch = send_batch
+        self.window = window
+        self.max_size = max(1, max_size)
+        self.queue: List[tuple] = []
+        self.collecting = False
+        self.condition = threading.Condition()
+
+    def submit(self, method, params) -> Dict:
+        # The first caller of a window waits for it to pass (or fill up) and
+        # sends everything queued meanwhile; the others just wait for their
+        # response
+        future = concurrent.futures.Future()
+        with self.condition:
+            self.queue.append((method, params, future))
+            leader = not self.collecting
+            if leader:
+                self.collecting = True
+            elif len(self.queue) >= self.max_size:
+                self.condition.notify_all()
+
+        if leader:
+            deadline = time.monotonic() + self.window
+            with self.condition:
+                while len(self.queue) < self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self.condition.wait(remaining)
+                batch = self.queue
+                self.queue = []
+                self.collecting = False
+            self._flush(batch)
+
+        return future.result()
+
+    def _flush(self, batch: List[tuple]):
+        for start in range(0, len(batch), self.max_size):
+            chunk = batch[start : start + self.max_size]
+            try:
+                responses = self.send_batch(
+                    [(method, params) for method, params, _ in chunk]
+                )
+            except Exception as e:
+                for _, _, future in chunk:
+                    future.set_exception(e)
+                continue
+
+            for (method, _, future), response in zip(chunk, responses):
+                if response is None:
+                    future.set_exception(
+                        ValueError(f"Missing response for {method} in RPC batch")
+                    )
+                else:
+                    future.set_result(response)
+
+
+class PooledHTTPProvider(Web3.HTTPProvider):
+    def __init__(
+        self,
+        endpoint_uri,
+        session: requests.Session,
+        rate_limiter: Optional[RateLimiter] = None,
+        batch_window: float = 0,
+        batch_size: int = RPC_BATCH_SIZE,
+        **kwargs,
+    ):
+        super().__init__(endpoint_uri, **kwargs)
+        self._session = session
+        self._rate_limiter = rate_limiter
+        self._batcher = (
+            RequestBatcher(self.make_batch_request, batch_window, batch_size)
+            if batch_window > 0
+            else None
+        )
+
+    def make_request(self, method, params):
+        if self._batcher and method in BATCHABLE_METHODS:
+            return self._batcher.submit(method, params)
+
+        if self._rate_limiter:
+            self._rate_limiter.acquire(str(self.endpoint_uri))
+
+        request_kwargs = self.get_request_kwargs()
+        request_kwargs.setdefault("timeout", RPC_TIMEOUT)
+        response = self._session.post(
+            self.endpoint_uri,
+            data=self.encode_rpc_request(method, params),
+            **request_kwargs,
+        )
+        response.raise_for_status()
+        return self.decode_rpc_response(response.content)
+
+    def make_batch_request(self, calls: List[tuple]) -> List[Dict]:
+        if self._rate_limiter:
+            self._rate_limiter.acquire(str(self.endpoint_uri))
+
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "method": method,
+                "params": params,
+                "id": next(self.request_counter),
+            }
+            for method, params in calls
+        ]
+        request_kwargs = self.get_request_kwargs()
+        request_kwargs.setdefault("timeout", RPC_TIMEOUT)
+        response = self._session.post(
+            self.endpoint_uri,
+            data=json.dumps(payload),
+            **request_kwargs,
+        )
+        response.raise_for_status()
+
+        responses = response.json()
+        if isinstance(responses, dict):
+            raise ValueError(responses.get("error", responses))
+        by_id = {item.get("id"): item for item in responses}
+        return [by_id.get(call["id"]) for call in payload]
+
+
+class Web3Registry:
+    def __init__(
+        self,
+        pool_size: int = RPC_POOL_SIZE,
+        batch_window: float = RPC_BATCH_WINDOW,
+        batch_size: int = RPC_BATCH_SIZE,
+    ):
+        self.pool_size = pool_size
+        self.batch_window = batch_window
+        self.batch_size = batch_size
+        self.sessions: Dict[str, requests.Session] = {}
+        self.instances: Dict[tuple, Web3] = {}
+        self.contracts: Dict[tuple, object] = {}
+        self.receipt_watchers: Dict[int, ReceiptWatcher] = {}
+        self.nonce_managers: Dict[int, NonceManager] = {}
+        self.lock = threading.Lock()
+
+    def _get_session(self, rpc_url: str) -> requests.Session:
+        session = self.sessions.get(rpc_url)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self.sessions[rpc_url] = session
+        return session
+
+    def get_web3(self, rpc_url: str, rate_limiter: Optional[RateLimiter] = None) -> Web3:
+        rpc_url = to_http_url(rpc_url)
+        key = (rpc_url, rate_limiter)
+        with self.lock:
+            web3 = self.instances.get(key)
+            if web3 is None:
+                web3 = Web3(
+                    PooledHTTPProvider(
+                        rpc_url,
+                        self._get_session(rpc_url),
+                        rate_limiter,
+                        batch_window=self.batch_window,
+                        batch_size=self.batch_size,
+                    )
+                )
+                self.instances[key] = web3
+            return web3
+
+    def configure(self, batch_window: float, batch_size: int = RPC_BATCH_SIZE):
+        with self.lock:
+            self.batch_window = batch_window
+            self.batch_size = batch_size
+
+    def get_contract(self, web3: Web3, address: str, abi: List[Dict]):
+        checksum_address = web3.to_checksum_address(address)
+        key = (id(web3), checksum_address, json.dumps(abi, sort_keys=True))
+        with self.lock:
+            contract = self.contracts.get(key)
+            if contract is None:
+                contract = web3.eth.contract(address=checksum_address, abi=abi)
+                self.contracts[key] = contract
+            return contract
+
+    def get_receipt_watcher(self, web3: Web3) -> ReceiptWatcher:
+        with self.lock:
+            watcher = self.receipt_watchers.get(id(web3))
+            if watcher is None:
+                watcher = ReceiptWatcher(web3)
+                self.receipt_watchers[id(web3)] = watcher
+            return watcher
+
+    def get_nonce_manager(self, web3: Web3) -> NonceManager:
+        with self.lock:
+            nonce_manager = self.nonce_managers.get(id(web3))
+            if nonce_manager is None:
+                nonce_manager = NonceManager(web3)
+                self.nonce_managers[id(web3)] = nonce_manager
+            return nonce_manager
+
+    def close(self):
+        with self.lock:
+            watchers = list(self.receipt_watchers.values())
+            self.receipt_watchers.clear()
+        for watcher in watchers:
+            watcher.stop()
+
+        with self.lock:
+            for session in self.sessions.values():
+                session.close()
+            self.sessions.clear()
+            self.instances.clear()
+            self.contracts.clear()
+            self.nonce_managers.clear()
+
+
+registry = Web3Registry()
+
+
+def get_web3(rpc_url: str, rate_limiter: Optional[RateLimiter] = None) -> Web3:
+    return registry.get_web3(rpc_url, rate_limiter)
+
+
+def get_contract(web3: Web3, address: str, abi: List[Dict]):
+    return registry.get_contract(web3, address, abi)
+
+
+def get_receipt_watcher(web3: Web3) -> ReceiptWatcher:
+    return registry.get_receipt_watcher(web3)
+
+
+def get_nonce_manager(web3: Web3) -> NonceManager:
+    return registry.get_nonce_manager(web3)
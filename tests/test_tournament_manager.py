@@ -0,0 +1,57 @@
+from src.tournament_manager import TournamentManager
+
+LEGEND, EPIC, RARE, COMMON = 1, 2, 3, 4
+
+
+def make_card(card_id, rarity, stars, score):
+    return {
+        "id": card_id,
+        "card_weighted_score": score,
+        "heroes": {"name": card_id, "rarity": rarity, "stars": stars},
+    }
+
+
+def deck_score(deck):
+    return sum(card["card_weighted_score"] for card in deck)
+
+
+def test_gold_seed_deck_is_improved():
+    # The filter keeps the two epics with the most stars, so the seed deck
+    # misses the cheap high scoring third epic; a swap with the pool adds it
+    cards = [
+        make_card("epic-7", EPIC, 7, 150),
+        make_card("epic-6", EPIC, 6, 140),
+        make_card("epic-2", EPIC, 2, 500),
+        make_card("rare-a", RARE, 3, 230),
+        make_card("rare-b", RARE, 3, 220),
+        make_card("rare-c", RARE, 3, 210),
+        make_card("rare-d", RARE, 3, 200),
+        make_card("common", COMMON, 1, 100),
+    ]
+    manager = TournamentManager(None, {})
+
+    seed_deck, _ = manager.select_best_cards_for_tournament(cards, 25, 0, [])
+    assert "epic-2" not in {card["id"] for card in seed_deck}
+    assert manager._deck_is_valid("gold", list(seed_deck))
+
+    plan = manager.plan_registrations(cards, {"gold": "gold-id"})
+
+    assert len(plan) == 1
+    tournament_type, deck = plan[0]
+    assert tournament_type == "gold"
+    assert "epic-2" in {card["id"] for card in deck}
+    assert deck_score(deck) > deck_score(seed_deck)
+    assert manager._deck_is_valid("gold", deck)
+
+
+def test_elite_seed_deck_without_legend_is_valid():
+    cards = [make_card(f"epic-{index}", EPIC, 7, 300 - index) for index in range(5)]
+    cards.append(make_card("legend", LEGEND, 9, 100))
+    manager = TournamentManager(None, {})
+
+    seed_deck, _ = manager.select_best_cards_for_tournament(
+        cards, float("inf"), 0, []
+    )
+
+    assert "legend" not in {card["id"] for card in seed_deck}
+    assert manager._deck_is_valid("elite", list(seed_deck))